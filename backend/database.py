@@ -1,5 +1,6 @@
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
+from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 
@@ -21,6 +22,10 @@ except ConnectionFailure as e:
 # Get database
 db = mongodb_client[DATABASE_NAME]
 
+# Async client for routes that await their queries; it connects lazily on first use
+async_mongodb_client = AsyncIOMotorClient(MONGODB_URL)
+async_db = async_mongodb_client[DATABASE_NAME]
+
 # Create indexes
 def create_indexes():
     """Create database indexes"""
@@ -52,4 +57,9 @@ def get_predictions_collection():
 
 def get_tracking_collection():
     """Get tracking collection"""
-    return db["tracking_data"]
\ No newline at end of file
+    return db["tracking_data"]
+
+# Async collection getters, for async def routes so queries don't block the event loop
+def get_tracking_collection_async():
+    """Get tracking collection (Motor)"""
+    return async_db["tracking_data"]
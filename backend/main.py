@@ -1,24 +1,43 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+# Single-row tree inference gains nothing from native thread pools and
+# oversubscribes CPUs under concurrent requests; must run before numpy loads.
+# Scale out with uvicorn --workers instead.
+for _thread_var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_thread_var, "1")
+
 from fastapi.exceptions import RequestValidationError
 from fastapi import Request
-from fastapi.responses import JSONResponse
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 import joblib
 import numpy as np
-import pandas as pd
 import shap
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, NamedTuple, Tuple, Iterable
 import logging
+import math
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 import json
+import orjson
+import hashlib
+import hmac
 import random
-import os
+import time
 import re
+import string
+import threading
 from dotenv import load_dotenv
 from bson import ObjectId
-from fastapi.responses import StreamingResponse
-from pdf_generator import generate_health_report_pdf
+from fastapi.responses import Response, StreamingResponse
+from pdf_generator import generate_health_report_pdf_bytes
 
 # Load environment variables
 load_dotenv()
@@ -34,7 +53,8 @@ from tracking_routes import router as tracking_router
 app = FastAPI(
     title="PreventiX Advanced API - Optimized",
     description="AI-powered health risk prediction with personalized recommendations (Anti-overfitting optimized)",
-    version="2.1.0"
+    version="2.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # NOW add the exception handler
@@ -43,7 +63,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     logger.error(f"Validation error: {exc.errors()}")
     logger.error(f"Body received: {exc.body}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": exc.errors(),
@@ -59,7 +79,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="PreventiX Advanced API - Optimized",
     description="AI-powered health risk prediction with personalized recommendations (Anti-overfitting optimized)",
-    version="2.1.0"
+    version="2.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS
@@ -80,6 +101,8 @@ diabetes_model = None
 hypertension_model = None
 model_features = None
 feature_scaler = None
+scaler_mean = None
+scaler_inv_scale = None
 diabetes_explainer = None
 hypertension_explainer = None
 nutrition_recommendations = None
@@ -209,9 +232,13 @@ class HealthAnswer(BaseModel):
     """Model for AI-generated health answers"""
     answer: str = Field(..., description="AI-generated personalized answer")
     confidence: str = Field(..., description="Confidence level (High/Medium/Low)")
-    related_factors: List[str] = Field(..., description="Related health factors mentioned")
-    follow_up_suggestions: List[str] = Field(..., description="Follow-up suggestions")
+    related_factors: Tuple[str, ...] = Field(..., description="Related health factors mentioned")
+    follow_up_suggestions: Tuple[str, ...] = Field(..., description="Follow-up suggestions")
     disclaimer: str = Field(..., description="Medical disclaimer")
+    
+    class Config:
+        # Cached answers are shared between requests
+        frozen = True
 
 def safe_float_conversion(value: Any) -> float:
     """Safely convert any value to float for serialization"""
@@ -225,6 +252,20 @@ def safe_float_conversion(value: Any) -> float:
     except (ValueError, TypeError):
         return 0.0
 
+def risk_to_percent(risk: float) -> float:
+    """Express a stored risk as a percentage; values above 1 are already percentages (0.852 -> 85.2)"""
+    return risk * 100 if risk <= 1.0 else risk
+
+# Response timestamps only carry seconds, so the ISO string is reused within a second: [second, iso string]
+_now_iso_cache = [None, ""]
+
+def now_iso() -> str:
+    """Return the current local time as an ISO string at seconds precision"""
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _now_iso_cache[1]
+
 def safe_convert_dict_values(data: Dict[str, Any]) -> Dict[str, Any]:
     """Safely convert all values in a dictionary to serializable types"""
     converted = {}
@@ -243,6 +284,7 @@ def load_models():
     """Load ML models and preprocessors"""
     global diabetes_model, hypertension_model, model_features
     global feature_scaler, diabetes_explainer, hypertension_explainer
+    global scaler_mean, scaler_inv_scale
     global nutrition_recommendations, fitness_recommendations
     
     try:
@@ -253,6 +295,11 @@ def load_models():
         hypertension_model = joblib.load('hypertension_model_optimized.joblib')
         model_features = joblib.load('model_features_optimized.joblib')
         
+        # Keep per-request inference single-threaded
+        for model in (diabetes_model, hypertension_model):
+            if hasattr(model, 'n_jobs'):
+                model.n_jobs = 1
+        
         # Load preprocessors
         try:
             feature_scaler = joblib.load('feature_scaler_optimized.joblib')
@@ -264,6 +311,12 @@ def load_models():
                 logger.warning("No scaler found, will use raw features")
                 feature_scaler = None
         
+        # Float32 standardization constants, the precision the tree models split on
+        scaler_mean = scaler_inv_scale = None
+        if getattr(feature_scaler, 'mean_', None) is not None and getattr(feature_scaler, 'scale_', None) is not None:
+            scaler_mean = feature_scaler.mean_.astype(np.float32)
+            scaler_inv_scale = (1.0 / feature_scaler.scale_).astype(np.float32)
+        
         # Load recommendations
         try:
             nutrition_recommendations = joblib.load('nutrition_recommendations.joblib')
@@ -347,7 +400,7 @@ async def health_check():
             "hypertension": type(hypertension_model).__name__ if hypertension_model else None
         },
         "sample_features": model_features[:10] if model_features else [],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/features")
@@ -472,6 +525,7 @@ def calculate_health_scores(features: Dict) -> Dict[str, float]:
         'cardiovascular': max(0, min(100, cardio_score))
     }
 
+@lru_cache(maxsize=1001)
 def get_risk_category(probability: float) -> str:
     """Categorize risk level with more realistic thresholds"""
     if probability < 0.25:
@@ -483,11 +537,11 @@ def get_risk_category(probability: float) -> str:
     else:
         return "Very High Risk"
 
-def prepare_features(health_input: HealthInput) -> tuple[pd.DataFrame, Dict]:
-    """Prepare input features for optimized model prediction"""
+def engineer_features(health_input: HealthInput) -> tuple[Dict, Dict]:
+    """Fill feature defaults and composite scores, returning (feature values, feature quality)"""
     
     # Convert input to dictionary
-    input_dict = health_input.dict()
+    input_dict = health_input.model_dump()
     
     # Set defaults for optional features based on optimized model
     if input_dict.get('hba1c') is None:
@@ -532,15 +586,6 @@ def prepare_features(health_input: HealthInput) -> tuple[pd.DataFrame, Dict]:
     
     input_dict['lifestyle_health_score'] = min(1.0, lifestyle_factors)
     
-    # Create DataFrame with only the features used in the optimized model
-    features_df = pd.DataFrame([input_dict])
-    
-    # Ensure all model features are present
-    for feature in model_features:
-        if feature not in features_df.columns:
-            # Set reasonable defaults for any missing engineered features
-            features_df[feature] = 0
-    
     # Calculate feature quality metrics
     feature_quality = {
         'glucose_level_quality': 50 <= input_dict['glucose_level'] <= 300,
@@ -549,7 +594,22 @@ def prepare_features(health_input: HealthInput) -> tuple[pd.DataFrame, Dict]:
         'age_quality': 18 <= input_dict['age'] <= 100
     }
     
-    return features_df[model_features], feature_quality
+    return input_dict, feature_quality
+
+def prepare_feature_array(health_input: HealthInput) -> tuple[np.ndarray, Dict, Dict]:
+    """Prepare the model feature row as a (1, n_features) array, returning (feature row, feature values, feature quality)"""
+    input_dict, feature_quality = engineer_features(health_input)
+    # Ordered by model_features; missing engineered features default to 0
+    feature_values = {feature: input_dict.get(feature, 0) for feature in model_features}
+    feature_row = np.array([list(feature_values.values())], dtype=np.float32)
+    return feature_row, feature_values, feature_quality
+
+def scale_feature_row(feature_row: np.ndarray) -> np.ndarray:
+    """Standardize a feature row as (x - mean) * (1 / scale), skipping StandardScaler.transform"""
+    if scaler_mean is None:
+        # Scalers without mean_/scale_ still go through transform
+        return feature_row if feature_scaler is None else feature_scaler.transform(feature_row)
+    return (feature_row - scaler_mean) * scaler_inv_scale
 
 def get_personalized_recommendations(
     feature_importance: List[tuple],
@@ -1954,22 +2014,22 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
     
     try:
         # Prepare features
-        input_df, feature_quality = prepare_features(health_input)
+        input_array, feature_values, feature_quality = prepare_feature_array(health_input)
         
         # Apply preprocessing if available
-        if feature_scaler is not None:
-            input_array = feature_scaler.transform(input_df)
-        else:
-            input_array = input_df.values
+        input_array = scale_feature_row(input_array)
         
-        # Get predictions - ensure they are Python floats
-        diabetes_proba = safe_float_conversion(diabetes_model.predict_proba(input_array)[0, 1])
-        hypertension_proba = safe_float_conversion(hypertension_model.predict_proba(input_array)[0, 1])
+        # Get predictions, batched with concurrent requests - ensure they are Python floats
+        diabetes_proba, hypertension_proba = map(safe_float_conversion, await predict_risks_batched(input_array))
         
         # Get confidence levels
         diabetes_confidence = get_confidence_level(diabetes_proba, feature_quality)
         hypertension_confidence = get_confidence_level(hypertension_proba, feature_quality)
         
+        # Get risk categories once (quantized to the reported precision)
+        diabetes_category = get_risk_category(round(diabetes_proba, 3))
+        hypertension_category = get_risk_category(round(hypertension_proba, 3))
+        
         # Get feature importance and SHAP values
         diabetes_importance = get_simple_feature_importance(diabetes_model, model_features, input_array)
         hypertension_importance = get_simple_feature_importance(hypertension_model, model_features, input_array)
@@ -1998,7 +2058,7 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
                         for feature, value in zip(model_features, diabetes_shap)
                     },
                     "feature_values": {
-                        feature: safe_float_conversion(input_df[feature].iloc[0])
+                        feature: safe_float_conversion(feature_values[feature])
                         for feature in model_features
                     }
                 }
@@ -2010,7 +2070,7 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
                         for feature, value in zip(model_features, hypertension_shap)
                     },
                     "feature_values": {
-                        feature: safe_float_conversion(input_df[feature].iloc[0])
+                        feature: safe_float_conversion(feature_values[feature])
                         for feature in model_features
                     }
                 }
@@ -2038,7 +2098,7 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
             }
         
         # Get personalized recommendations
-        input_values = health_input.dict()
+        input_values = health_input.model_dump()
         diabetes_recs = get_personalized_recommendations(
             diabetes_importance, input_values, 'diabetes', diabetes_proba
         )
@@ -2070,7 +2130,7 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
             {
                 "feature": feat,
                 "importance": safe_float_conversion(imp),
-                "value": safe_float_conversion(input_df[feat].iloc[0]) if feat in input_df.columns else None
+                "value": safe_float_conversion(feature_values[feat]) if feat in feature_values else None
             }
             for feat, imp in diabetes_importance[:5]
         ]
@@ -2079,7 +2139,7 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
             {
                 "feature": feat,
                 "importance": safe_float_conversion(imp),
-                "value": safe_float_conversion(input_df[feat].iloc[0]) if feat in input_df.columns else None
+                "value": safe_float_conversion(feature_values[feat]) if feat in feature_values else None
             }
             for feat, imp in hypertension_importance[:5]
         ]
@@ -2106,8 +2166,8 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
             "hypertension_risk": round(hypertension_proba, 3),
             "diabetes_confidence": diabetes_confidence,
             "hypertension_confidence": hypertension_confidence,
-            "risk_category_diabetes": get_risk_category(diabetes_proba),
-            "risk_category_hypertension": get_risk_category(hypertension_proba),
+            "risk_category_diabetes": diabetes_category,
+            "risk_category_hypertension": hypertension_category,
             "diabetes_shap_values": safe_convert_dict_values(diabetes_shap_dict),
             "hypertension_shap_values": safe_convert_dict_values(hypertension_shap_dict),
             "nutrition_recommendations": {
@@ -2151,21 +2211,23 @@ async def predict_health_risks(health_input: HealthInput, current_user: dict = D
             predictions_collection = get_predictions_collection()
             prediction_record = {
                 "user_id": current_user["id"],  # Use authenticated user ID
-                "input_data": health_input.dict(),
+                "input_data": health_input.model_dump(),
                 "diabetes_risk": diabetes_proba,
                 "hypertension_risk": hypertension_proba,
                 "diabetes_confidence": diabetes_confidence,
                 "hypertension_confidence": hypertension_confidence,
-                "risk_category_diabetes": get_risk_category(diabetes_proba),
-                "risk_category_hypertension": get_risk_category(hypertension_proba),
+                "risk_category_diabetes": diabetes_category,
+                "risk_category_hypertension": hypertension_category,
                 "metabolic_health_score": response.metabolic_health_score,
                 "cardiovascular_health_score": response.cardiovascular_health_score,
                 "created_at": datetime.now()
             }
             
             logger.info(f"Prediction record prepared: {prediction_record}")
-            result = predictions_collection.insert_one(prediction_record)
+            result = await run_in_threadpool(predictions_collection.insert_one, prediction_record)
             logger.info(f"Prediction saved to database with ID: {result.inserted_id}")
+            # This worker's Q&A cache should answer from the new assessment (other workers catch up within the TTL)
+            _latest_health_data_cache.pop(current_user["id"], None)
             
         except Exception as db_error:
             logger.error(f"Failed to save prediction to database: {db_error}")
@@ -2185,11 +2247,12 @@ async def get_prediction_history(limit: int = 10, current_user: dict = Depends(g
     try:
         predictions_collection = get_predictions_collection()
         
-        cursor = predictions_collection.find(
-            {"user_id": str(current_user["_id"])}
-        ).sort("created_at", -1).limit(limit)
-        
-        predictions = await cursor.to_list(length=limit)
+        # pymongo is blocking; run the query in the threadpool
+        predictions = await run_in_threadpool(
+            lambda: list(predictions_collection.find(
+                {"user_id": current_user["id"]}
+            ).sort("created_at", -1).limit(limit))
+        )
         
         for pred in predictions:
             pred["_id"] = str(pred["_id"])
@@ -2209,13 +2272,16 @@ async def get_dashboard_stats(current_user: dict = Depends(get_current_active_us
     try:
         predictions_collection = get_predictions_collection()
         
-        latest_prediction = await predictions_collection.find_one(
-            {"user_id": str(current_user["_id"])},
+        # pymongo is blocking; run the queries in the threadpool
+        latest_prediction = await run_in_threadpool(
+            predictions_collection.find_one,
+            {"user_id": current_user["id"]},
             sort=[("created_at", -1)]
         )
         
-        total_predictions = await predictions_collection.count_documents(
-            {"user_id": str(current_user["_id"])}
+        total_predictions = await run_in_threadpool(
+            predictions_collection.count_documents,
+            {"user_id": current_user["id"]}
         )
         
         stats = {
@@ -2235,6 +2301,76 @@ async def get_dashboard_stats(current_user: dict = Depends(get_current_active_us
 # [Keep all your other existing endpoints: get_general_recommendations, analyze_what_if_scenario_endpoint,
 #  get_tracking_goals, update_tracking_data, search_food_database]
 
+# ReportLab rendering is pure-Python CPU work; render in worker processes to keep it off the GIL.
+# Each uvicorn worker has its own pool, so by default the cores are split across WEB_WORKERS.
+WEB_WORKERS = max(1, int(os.getenv("WEB_WORKERS", 1)))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", max(1, (os.cpu_count() or 1) // WEB_WORKERS)))
+_pdf_pool = None
+# The PDF endpoints are sync and run on threadpool threads; only one of them may create the pool
+_pdf_pool_lock = threading.Lock()
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the PDF rendering process pool, created on first use"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Spawned, not forked: this process already runs threadpool, Motor and batching threads
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=get_context("spawn"))
+        return _pdf_pool
+
+@app.on_event("shutdown")
+def shutdown_pdf_pool():
+    """Stop the PDF rendering workers with the app"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(cancel_futures=True)
+            _pdf_pool = None
+
+# Opt-in, since cached reports hold the patient name: input digest -> PDF bytes, oldest first
+PDF_CACHE_ENABLED = os.getenv("PDF_CACHE_ENABLED", "false").lower() == "true"
+PDF_CACHE_MAX_REPORTS = 256
+_pdf_cache: Dict[str, bytes] = {}
+
+def lookup_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[str, Any]) -> tuple:
+    """Return (cache key, cached PDF bytes or None); the key is None when the cache is disabled"""
+    if not PDF_CACHE_ENABLED:
+        return None, None
+    # The report prints its generation time to the minute, so the minute is part of the key
+    payload = orjson.dumps(
+        [prediction_data, user_info, time.strftime('%Y%m%d%H%M')],
+        option=orjson.OPT_SORT_KEYS, default=str
+    )
+    key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return key, _pdf_cache.get(key)
+
+def store_report_pdf(key: Optional[str], pdf_bytes: bytes) -> bytes:
+    """Cache a rendered report under its lookup key, evicting the oldest reports"""
+    if key is not None:
+        while len(_pdf_cache) >= PDF_CACHE_MAX_REPORTS:
+            _pdf_cache.pop(next(iter(_pdf_cache)), None)
+        _pdf_cache[key] = pdf_bytes
+    return pdf_bytes
+
+async def render_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[str, Any]) -> bytes:
+    """Render a health report PDF in the process pool without blocking the event loop"""
+    key, pdf_bytes = lookup_report_pdf(prediction_data, user_info)
+    if pdf_bytes is None:
+        loop = asyncio.get_running_loop()
+        pdf_bytes = store_report_pdf(key, await loop.run_in_executor(
+            get_pdf_pool(), generate_health_report_pdf_bytes, prediction_data, user_info
+        ))
+    return pdf_bytes
+
+def render_health_report_pdf_blocking(prediction_data: Dict[str, Any], user_info: Dict[str, Any]) -> bytes:
+    """Render a health report PDF in the process pool, waiting on the calling threadpool thread"""
+    key, pdf_bytes = lookup_report_pdf(prediction_data, user_info)
+    if pdf_bytes is None:
+        pdf_bytes = store_report_pdf(key, get_pdf_pool().submit(
+            generate_health_report_pdf_bytes, prediction_data, user_info
+        ).result())
+    return pdf_bytes
+
 @app.get("/predictions/{prediction_id}/download-pdf")
 def download_prediction_pdf(
     prediction_id: str,
@@ -2259,13 +2395,14 @@ def download_prediction_pdf(
             "email": current_user.get("email", "")
         }
         
-        pdf_buffer = generate_health_report_pdf(prediction, user_info)
+        pdf_bytes = render_health_report_pdf_blocking(prediction, user_info)
         
         # Return PDF as download
-        filename = f"health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        filename = f"health_report_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        return StreamingResponse(
-            pdf_buffer,
+        # Send the finished PDF as one body
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
@@ -2276,7 +2413,7 @@ def download_prediction_pdf(
         logger.error(f"Error generating PDF: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
-@app.post("/predict/download-pdf", response_class=StreamingResponse)
+@app.post("/predict/download-pdf", response_class=Response)
 def download_latest_prediction_pdf(
     health_input: HealthInput,
     current_user: dict = Depends(get_current_active_user)
@@ -2300,12 +2437,13 @@ def download_latest_prediction_pdf(
             "email": current_user.get("email", "")
         }
         
-        pdf_buffer = generate_health_report_pdf(latest_prediction, user_info)
+        pdf_bytes = render_health_report_pdf_blocking(latest_prediction, user_info)
         
-        filename = f"health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        filename = f"health_report_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        return StreamingResponse(
-            pdf_buffer,
+        # Send the finished PDF as one body
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
@@ -2316,7 +2454,7 @@ def download_latest_prediction_pdf(
         logger.error(f"Error generating PDF: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
-@app.post("/predict/current-pdf", response_class=StreamingResponse)
+@app.post("/predict/current-pdf", response_class=Response)
 async def download_current_prediction_pdf(
     health_data: dict,
     current_user: dict = Depends(get_current_active_user)
@@ -2345,28 +2483,28 @@ async def download_current_prediction_pdf(
             )
         
         # Prepare features
-        input_df, feature_quality = prepare_features(health_input)
+        input_array, feature_values, feature_quality = prepare_feature_array(health_input)
         
         # Apply preprocessing if available
-        if feature_scaler is not None:
-            input_array = feature_scaler.transform(input_df)
-        else:
-            input_array = input_df.values
+        input_array = scale_feature_row(input_array)
         
-        # Get predictions
-        diabetes_proba = safe_float_conversion(diabetes_model.predict_proba(input_array)[0, 1])
-        hypertension_proba = safe_float_conversion(hypertension_model.predict_proba(input_array)[0, 1])
+        # Get predictions, batched with concurrent requests
+        diabetes_proba, hypertension_proba = map(safe_float_conversion, await predict_risks_batched(input_array))
         
         # Get confidence levels
         diabetes_confidence = get_confidence_level(diabetes_proba, feature_quality)
         hypertension_confidence = get_confidence_level(hypertension_proba, feature_quality)
         
+        # Get risk categories once (quantized to the reported precision)
+        diabetes_category = get_risk_category(round(diabetes_proba, 3))
+        hypertension_category = get_risk_category(round(hypertension_proba, 3))
+        
         # Get feature importance
         diabetes_importance = get_simple_feature_importance(diabetes_model, model_features, input_array)
         hypertension_importance = get_simple_feature_importance(hypertension_model, model_features, input_array)
         
         # Get personalized recommendations
-        input_values = health_input.dict()
+        input_values = health_input.model_dump()
         diabetes_recs = get_personalized_recommendations(
             diabetes_importance, input_values, 'diabetes', diabetes_proba
         )
@@ -2393,7 +2531,7 @@ async def download_current_prediction_pdf(
             {
                 "feature": feat,
                 "importance": safe_float_conversion(imp),
-                "value": safe_float_conversion(input_df[feat].iloc[0]) if feat in input_df.columns else None
+                "value": safe_float_conversion(feature_values[feat]) if feat in feature_values else None
             }
             for feat, imp in diabetes_importance[:5]
         ]
@@ -2402,7 +2540,7 @@ async def download_current_prediction_pdf(
             {
                 "feature": feat,
                 "importance": safe_float_conversion(imp),
-                "value": safe_float_conversion(input_df[feat].iloc[0]) if feat in input_df.columns else None
+                "value": safe_float_conversion(feature_values[feat]) if feat in feature_values else None
             }
             for feat, imp in hypertension_importance[:5]
         ]
@@ -2437,8 +2575,8 @@ async def download_current_prediction_pdf(
             "hypertension_risk": round(hypertension_proba, 3),
             "diabetes_confidence": diabetes_confidence,
             "hypertension_confidence": hypertension_confidence,
-            "risk_category_diabetes": get_risk_category(diabetes_proba),
-            "risk_category_hypertension": get_risk_category(hypertension_proba),
+            "risk_category_diabetes": diabetes_category,
+            "risk_category_hypertension": hypertension_category,
             "nutrition_recommendations": {
                 "primary": combined_nutrition[:4],
                 "secondary": combined_nutrition[4:8] if len(combined_nutrition) > 4 else []
@@ -2465,7 +2603,7 @@ async def download_current_prediction_pdf(
         logger.info(f"User info: {user_info}")
         
         try:
-            pdf_buffer = generate_health_report_pdf(prediction_data, user_info)
+            pdf_bytes = await render_health_report_pdf(prediction_data, user_info)
             logger.info("PDF generated successfully")
         except Exception as pdf_error:
             logger.error(f"Error in generate_health_report_pdf: {pdf_error}")
@@ -2474,10 +2612,11 @@ async def download_current_prediction_pdf(
             logger.error(f"PDF generation traceback: {traceback.format_exc()}")
             raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(pdf_error)}")
         
-        filename = f"health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        filename = f"health_report_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        return StreamingResponse(
-            pdf_buffer,
+        # Send the finished PDF as one body
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
@@ -2488,13 +2627,108 @@ async def download_current_prediction_pdf(
         logger.error(f"Error generating PDF: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
+# Shared answer strings, defined once instead of per analyzer
+GENERAL_HEALTH_DISCLAIMER = "This assessment is for informational purposes only and should not replace professional medical advice."
+
+class HealthProfile(NamedTuple):
+    """Health values used by the question analyzers, parsed once per question"""
+    age: float = 45
+    gender: float = 0
+    bmi: float = 25
+    blood_pressure: float = 120
+    glucose_level: float = 100
+    cholesterol_level: float = 200
+    physical_activity: float = 5
+    smoking_status: float = 0
+    family_history: float = 0
+    alcohol_intake: float = 0
+    sleep_hours: float = 7
+    stress_level: float = 5
+    daily_steps: float = 7000
+    hba1c: Optional[float] = None
+
+def parse_health_profile(health_data: Dict[str, Any]) -> HealthProfile:
+    """Convert stored health data into a HealthProfile, keeping defaults for missing or invalid values"""
+    values = {}
+    for field in HealthProfile._fields:
+        value = health_data.get(field)
+        if value is None:
+            continue
+        # Numbers keep their own type, so answers print "140 mmHg" rather than "140.0 mmHg"
+        if not isinstance(value, (int, float)):
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid {field} value: {value}, using default")
+                continue
+        # NaN and infinity would land in the top band of the threshold tables
+        if isinstance(value, float) and not math.isfinite(value):
+            logger.warning(f"Invalid {field} value: {value}, using default")
+            continue
+        values[field] = value
+    # HbA1c is optional; a zero reading means it was not provided
+    if not values.get('hba1c'):
+        values.pop('hba1c', None)
+    return HealthProfile(**values)
+
+def value_types(values: Iterable[Any]) -> tuple:
+    """Types of some answer inputs; the answer caches key on them because 25 and 25.0 hash alike but print differently"""
+    return tuple(type(value) for value in values)
+
+# Question keywords per category; matched as substrings of the lowercased question
+QUESTION_KEYWORDS = {
+    "risk": ('risk', 'chance', 'probability', 'likely', 'develop'),
+    "diabetes": ('diabetes', 'diabetic', 'blood sugar', 'glucose'),
+    "hypertension": ('hypertension', 'blood pressure', 'high blood pressure', 'bp'),
+    "prevention": ('prevent', 'avoid', 'reduce', 'lower', 'improve'),
+    "nutrition": ('diet', 'food', 'eat', 'nutrition', 'meal', 'carb', 'sugar'),
+    "fitness": ('exercise', 'workout', 'fitness', 'activity', 'gym', 'cardio'),
+}
+QUESTION_CATEGORY_PRIORITY = ("prevention", "nutrition", "fitness")
+
+def compile_question_keywords(keywords_by_category: Dict[str, tuple]) -> tuple:
+    """Compile category keywords into one lookahead pattern and a keyword -> categories map"""
+    keyword_categories = {}
+    for category, words in keywords_by_category.items():
+        for word in words:
+            keyword_categories.setdefault(word, set()).add(category)
+    # Only the longest keyword at a position is reported, so it also carries the
+    # categories of any shorter keyword it starts with (e.g. 'mental health' / 'mental')
+    resolved_categories = {
+        word: frozenset().union(*(categories for other, categories in keyword_categories.items() if word.startswith(other)))
+        for word in keyword_categories
+    }
+    # Zero-width lookahead so overlapping keywords (e.g. 'blood sugar' / 'sugar') are all reported
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(word) for word in sorted(resolved_categories, key=len, reverse=True)) + "))"
+    )
+    return pattern, resolved_categories
+
+def match_keyword_categories(compiled_keywords: tuple, question_lower: str) -> frozenset:
+    """Return the categories whose keywords appear in a lowercased question, in one regex scan"""
+    pattern, keyword_categories = compiled_keywords
+    return frozenset().union(*(keyword_categories[match.group(1)] for match in pattern.finditer(question_lower)))
+
+_QUESTION_KEYWORD_MATCHER = compile_question_keywords(QUESTION_KEYWORDS)
+
+@lru_cache(maxsize=1024)
+def match_question_categories(question_lower: str) -> frozenset:
+    """Return the keyword categories present in a lowercased question (cached, the quick-question buttons repeat)"""
+    return match_keyword_categories(_QUESTION_KEYWORD_MATCHER, question_lower)
+
+QUESTION_FALLBACK_FOLLOW_UPS = (
+    "Try rephrasing your question",
+    "Check if you have completed a health assessment",
+    "Contact support if the issue continues",
+)
+
 def analyze_health_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
     """AI-powered analysis of health questions based on user's specific health data"""
     
     try:
-        logger.info(f"analyze_health_question called with question: {question[:50]}...")
-        logger.info(f"analyze_health_question received health_data: {health_data}")
-        logger.info(f"analyze_health_question received prediction_result: {prediction_result}")
+        logger.info("analyze_health_question called with question: %s...", question[:50])
+        logger.debug("analyze_health_question received health_data: %s", health_data)
+        logger.debug("analyze_health_question received prediction_result: %s", prediction_result)
         
         # Ensure health_data is not None and is a dictionary
         if health_data is None:
@@ -2516,221 +2750,252 @@ def analyze_health_question(question: str, health_data: Dict[str, Any], predicti
             # Don't return early, continue with general health advice
         
         # Log health data for debugging
-        logger.info(f"Health data keys: {list(health_data.keys()) if health_data else 'None'}")
-        logger.info(f"Health data sample: {dict(list(health_data.items())[:3]) if health_data else 'None'}")
-        logger.info(f"Prediction result keys: {list(prediction_result.keys()) if prediction_result else 'None'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Health data keys: %s", list(health_data.keys()) if health_data else 'None')
+            logger.debug("Prediction result keys: %s", list(prediction_result.keys()) if prediction_result else 'None')
             
-        # Extract key health metrics with safe defaults and validation
-        try:
-            age = float(health_data.get('age', 45))
-            gender = "Male" if float(health_data.get('gender', 0)) == 1 else "Female"
-            bmi = float(health_data.get('bmi', 25))
-            blood_pressure = float(health_data.get('blood_pressure', 120))
-            glucose = float(health_data.get('glucose_level', 100))
-            cholesterol = float(health_data.get('cholesterol_level', 200))
-            activity = float(health_data.get('physical_activity', 5))
-            smoking = float(health_data.get('smoking_status', 0))
-            family_history = float(health_data.get('family_history', 0))
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error extracting health data: {e}")
-            # Use safe defaults
-            age = 45
-            gender = "Male"
-            bmi = 25
-            blood_pressure = 120
-            glucose = 100
-            cholesterol = 200
-            activity = 5
-            smoking = 0
-            family_history = 0
-        
-        # Convert smoking status to text with bounds checking
-        smoking_int = int(smoking)
-        if smoking_int < 0 or smoking_int > 2:
-            smoking_int = 0
-        smoking_status = ["Never", "Former", "Current"][smoking_int]
+        # Parse the health values once for all analyzers
+        profile = parse_health_profile(health_data)
         
         # Analyze question keywords and intent
         question_lower = question.lower()
         
+        # Route on keyword categories found in a single scan of the question
+        categories = match_question_categories(question_lower)
+        
         # Risk assessment questions
-        if any(word in question_lower for word in ['risk', 'chance', 'probability', 'likely', 'develop']):
-            if any(word in question_lower for word in ['diabetes', 'diabetic', 'blood sugar', 'glucose']):
-                return analyze_diabetes_risk_question(question, health_data, prediction_result)
-            elif any(word in question_lower for word in ['hypertension', 'blood pressure', 'high blood pressure', 'bp']):
-                return analyze_hypertension_risk_question(question, health_data, prediction_result)
+        if "risk" in categories:
+            if "diabetes" in categories:
+                category = "diabetes_risk"
+            elif "hypertension" in categories:
+                category = "hypertension_risk"
             else:
-                return analyze_general_risk_question(question, health_data, prediction_result)
-        
-        # Lifestyle and prevention questions
-        elif any(word in question_lower for word in ['prevent', 'avoid', 'reduce', 'lower', 'improve']):
-            return analyze_prevention_question(question, health_data, prediction_result)
-        
-        # Diet and nutrition questions
-        elif any(word in question_lower for word in ['diet', 'food', 'eat', 'nutrition', 'meal', 'carb', 'sugar']):
-            return analyze_nutrition_question(question, health_data, prediction_result)
-        
-        # Exercise and fitness questions
-        elif any(word in question_lower for word in ['exercise', 'workout', 'fitness', 'activity', 'gym', 'cardio']):
-            return analyze_fitness_question(question, health_data, prediction_result)
-        
-        # General health questions
+                category = "general_risk"
         else:
-            return analyze_general_health_question(question, health_data, prediction_result)
+            # Prevention, then nutrition, then fitness, then general health
+            category = next((c for c in QUESTION_CATEGORY_PRIORITY if c in categories), "general")
+        
+        # Serve repeat (category, profile, prediction) combinations from the answer cache
+        prediction_items = tuple(
+            (field, prediction_result[field]) for field in QUESTION_PREDICTION_FIELDS if field in prediction_result
+        )
+        input_types = value_types(profile) + value_types(value for _, value in prediction_items)
+        return answer_question_category(category, profile, prediction_items, input_types)
         
     except Exception as e:
         logger.error(f"Error in analyze_health_question: {e}")
         # Return a safe fallback response
-        return HealthAnswer(
+        return HealthAnswer.model_construct(
             answer="I apologize, but I'm having trouble processing your question right now. Please try again or contact support if the issue persists.",
             confidence="Low",
-            related_factors=[],
-            follow_up_suggestions=[
-                "Try rephrasing your question",
-                "Check if you have completed a health assessment",
-                "Contact support if the issue continues"
-            ],
+            related_factors=(),
+            follow_up_suggestions=QUESTION_FALLBACK_FOLLOW_UPS,
             disclaimer="This is a fallback response due to a technical issue. Please try again."
         )
 
-def analyze_diabetes_risk_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
-    """Analyze diabetes-related questions with detailed personalized insights"""
-    
-    # Log the specific health data being analyzed
-    logger.info(f"Analyzing diabetes risk for specific health data: {health_data}")
-    
-    age = health_data.get('age', 45)
-    bmi = health_data.get('bmi', 25)
-    glucose = health_data.get('glucose_level', 100)
-    family_history = health_data.get('family_history', 0)
-    activity = health_data.get('physical_activity', 5)
-    hba1c = health_data.get('hba1c', None)
-    blood_pressure = health_data.get('blood_pressure', 120)
-    cholesterol = health_data.get('cholesterol_level', 200)
-    smoking = health_data.get('smoking_status', 0)
-    alcohol = health_data.get('alcohol_intake', 0)
-    sleep_hours = health_data.get('sleep_hours', 7)
-    stress_level = health_data.get('stress_level', 5)
-    
-    # Get prediction results if available
-    diabetes_risk = prediction_result.get('diabetes_risk', 0) if prediction_result else 0
-    diabetes_confidence = prediction_result.get('diabetes_confidence', 'Unknown') if prediction_result else 'Unknown'
-    
-    # Ensure diabetes_risk is a valid number
-    try:
-        diabetes_risk = float(diabetes_risk) if diabetes_risk is not None else 0
-    except (ValueError, TypeError):
-        logger.warning(f"Invalid diabetes_risk value: {diabetes_risk}, using 0")
-        diabetes_risk = 0
-    
-    # Get hypertension risk with type checking
-    hypertension_risk = prediction_result.get('hypertension_risk', 0) if prediction_result else 0
-    try:
-        hypertension_risk = float(hypertension_risk) if hypertension_risk is not None else 0
-    except (ValueError, TypeError):
-        logger.warning(f"Invalid hypertension_risk value: {hypertension_risk}, using 0")
-        hypertension_risk = 0
-    
-    # Detailed risk factor analysis
+# Risk factor threshold tables: (profile field, thresholds, inclusive, tiers).
+# The tier is the number of thresholds passed (>= when inclusive, > otherwise);
+# each tier maps to (score, message template) and a None message adds no factor.
+# Fields that are None in the profile (e.g. a missing HbA1c) are not scored.
+DIABETES_RISK_FACTORS = (
+    ('bmi', (25, 30), False, (
+        (0, "Healthy weight (BMI: {v:.1f}) - Low diabetes risk"),
+        (2, "Overweight (BMI: {v:.1f}) - Moderate diabetes risk"),
+        (3, "Obesity (BMI: {v:.1f}) - Major diabetes risk factor"),
+    )),
+    ('glucose_level', (100, 126), False, (
+        (0, "Normal glucose ({v} mg/dL) - Good metabolic health"),
+        (2, "Borderline glucose ({v} mg/dL) - Pre-diabetic risk"),
+        (3, "Elevated blood glucose ({v} mg/dL) - Pre-diabetic range"),
+    )),
+    ('hba1c', (5.7, 6.5), True, (
+        (0, "Normal HbA1c ({v}%) - Good long-term glucose control"),
+        (3, "Pre-diabetic HbA1c ({v}%) - Increased risk"),
+        (4, "Elevated HbA1c ({v}%) - Diabetes range"),
+    )),
+    ('family_history', (0,), False, (
+        (0, "No family history of diabetes - Lower genetic risk"),
+        (2, "Family history of diabetes - Genetic predisposition"),
+    )),
+    ('physical_activity', (3, 6), True, (
+        (3, "Low physical activity ({v}/10) - Major diabetes risk"),
+        (1, "Moderate physical activity ({v}/10) - Some diabetes risk"),
+        (0, "Good physical activity ({v}/10) - Protective against diabetes"),
+    )),
+    ('age', (45, 65), False, (
+        (0, "Age {v} - Lower diabetes risk"),
+        (1, "Age {v} - Moderate diabetes risk with age"),
+        (2, "Age {v} - Higher diabetes risk with age"),
+    )),
+    ('blood_pressure', (140,), False, (
+        (0, None),
+        (1, "High blood pressure ({v} mmHg) - Diabetes risk"),
+    )),
+    ('smoking_status', (0,), False, (
+        (0, None),
+        (1, "Smoking history - Increases diabetes risk"),
+    )),
+    ('sleep_hours', (6,), True, (
+        (1, "Insufficient sleep ({v} hours) - Diabetes risk"),
+        (0, None),
+    )),
+    ('stress_level', (7,), False, (
+        (0, None),
+        (1, "High stress level ({v}/10) - Diabetes risk"),
+    )),
+)
+
+HYPERTENSION_RISK_FACTORS = (
+    ('blood_pressure', (120, 130, 140), True, (
+        (0, "Normal blood pressure ({v} mmHg) - Good cardiovascular health"),
+        (2, "Elevated blood pressure ({v} mmHg) - Pre-hypertension"),
+        (3, "Stage 1 Hypertension ({v} mmHg) - Elevated risk"),
+        (4, "Stage 2 Hypertension ({v} mmHg) - High risk"),
+    )),
+    ('bmi', (25, 30), False, (
+        (0, "Healthy weight (BMI: {v:.1f}) - Lower hypertension risk"),
+        (2, "Overweight (BMI: {v:.1f}) - Moderate hypertension risk"),
+        (3, "Obesity (BMI: {v:.1f}) - Major hypertension risk"),
+    )),
+    ('age', (45, 65), False, (
+        (0, "Age {v} - Lower hypertension risk"),
+        (2, "Age {v} - Moderate hypertension risk with age"),
+        (3, "Age {v} - High hypertension risk with age"),
+    )),
+    ('family_history', (0,), False, (
+        (0, "No family history of hypertension - Lower genetic risk"),
+        (2, "Family history of hypertension - Genetic predisposition"),
+    )),
+    ('physical_activity', (3, 6), True, (
+        (3, "Low physical activity ({v}/10) - Major hypertension risk"),
+        (1, "Moderate physical activity ({v}/10) - Some hypertension risk"),
+        (0, "Good physical activity ({v}/10) - Protective against hypertension"),
+    )),
+    ('cholesterol_level', (200, 240), False, (
+        (0, None),
+        (1, "Borderline cholesterol ({v} mg/dL) - Some hypertension risk"),
+        (2, "High cholesterol ({v} mg/dL) - Hypertension risk"),
+    )),
+    ('glucose_level', (100, 126), False, (
+        (0, None),
+        (1, "Borderline glucose ({v} mg/dL) - Some hypertension risk"),
+        (2, "Elevated glucose ({v} mg/dL) - Hypertension risk"),
+    )),
+    ('smoking_status', (0,), False, (
+        (0, None),
+        (3, "Smoking history - Major hypertension risk"),
+    )),
+    ('alcohol_intake', (1, 3), False, (
+        (0, None),
+        (1, "Moderate alcohol intake ({v}/5) - Some hypertension risk"),
+        (2, "High alcohol intake ({v}/5) - Hypertension risk"),
+    )),
+    ('sleep_hours', (6,), True, (
+        (2, "Insufficient sleep ({v} hours) - Hypertension risk"),
+        (0, None),
+    )),
+    ('stress_level', (7,), False, (
+        (0, None),
+        (2, "High stress level ({v}/10) - Hypertension risk"),
+    )),
+)
+
+# Factor kinds used to pick answer bullets; a factor may be neither or both
+FACTOR_RISK = 1
+FACTOR_PROTECTIVE = 2
+
+def classify_risk_factor(message: str) -> int:
+    """Classify a factor message as a risk and/or protective factor"""
+    text = message.lower()
+    kind = 0
+    if "risk" in text and "protective" not in text:
+        kind |= FACTOR_RISK
+    if "protective" in text or "good" in text or "normal" in text:
+        kind |= FACTOR_PROTECTIVE
+    return kind
+
+def compile_factor_table(factor_table: tuple) -> tuple:
+    """Resolve a risk factor table into (field, bisect, thresholds, (score, message, kind) tiers) rows"""
+    return tuple(
+        (
+            field,
+            bisect_right if inclusive else bisect_left,
+            thresholds,
+            tuple((score, message, classify_risk_factor(message) if message is not None else 0) for score, message in tiers),
+        )
+        for field, thresholds, inclusive, tiers in factor_table
+    )
+
+# Compiled once at import so scoring is a lookup per factor
+DIABETES_FACTOR_SCORER = compile_factor_table(DIABETES_RISK_FACTORS)
+HYPERTENSION_FACTOR_SCORER = compile_factor_table(HYPERTENSION_RISK_FACTORS)
+
+def score_risk_factors(factor_scorer: tuple, profile: HealthProfile) -> tuple:
+    """Score a health profile with a compiled factor table, returning (factors, risk bullets, protective bullets, total score)"""
     risk_factors = []
-    risk_scores = []
-    
-    # BMI Analysis
-    if bmi > 30:
-        risk_factors.append(f"Obesity (BMI: {bmi:.1f}) - Major diabetes risk factor")
-        risk_scores.append(3)
-    elif bmi > 25:
-        risk_factors.append(f"Overweight (BMI: {bmi:.1f}) - Moderate diabetes risk")
-        risk_scores.append(2)
-    else:
-        risk_factors.append(f"Healthy weight (BMI: {bmi:.1f}) - Low diabetes risk")
-        risk_scores.append(0)
-    
-    # Glucose Analysis
-    if glucose > 126:
-        risk_factors.append(f"Elevated blood glucose ({glucose} mg/dL) - Pre-diabetic range")
-        risk_scores.append(3)
-    elif glucose > 100:
-        risk_factors.append(f"Borderline glucose ({glucose} mg/dL) - Pre-diabetic risk")
-        risk_scores.append(2)
-    else:
-        risk_factors.append(f"Normal glucose ({glucose} mg/dL) - Good metabolic health")
-        risk_scores.append(0)
-    
-    # HbA1c Analysis (if available)
-    if hba1c:
-        if hba1c >= 6.5:
-            risk_factors.append(f"Elevated HbA1c ({hba1c}%) - Diabetes range")
-            risk_scores.append(4)
-        elif hba1c >= 5.7:
-            risk_factors.append(f"Pre-diabetic HbA1c ({hba1c}%) - Increased risk")
-            risk_scores.append(3)
-        else:
-            risk_factors.append(f"Normal HbA1c ({hba1c}%) - Good long-term glucose control")
-            risk_scores.append(0)
-    
-    # Family History
-    if family_history:
-        risk_factors.append("Family history of diabetes - Genetic predisposition")
-        risk_scores.append(2)
-    else:
-        risk_factors.append("No family history of diabetes - Lower genetic risk")
-        risk_scores.append(0)
-    
-    # Physical Activity
-    if activity < 3:
-        risk_factors.append(f"Low physical activity ({activity}/10) - Major diabetes risk")
-        risk_scores.append(3)
-    elif activity < 6:
-        risk_factors.append(f"Moderate physical activity ({activity}/10) - Some diabetes risk")
-        risk_scores.append(1)
-    else:
-        risk_factors.append(f"Good physical activity ({activity}/10) - Protective against diabetes")
-        risk_scores.append(0)
-    
-    # Age Factor
-    if age > 65:
-        risk_factors.append(f"Age {age} - Higher diabetes risk with age")
-        risk_scores.append(2)
-    elif age > 45:
-        risk_factors.append(f"Age {age} - Moderate diabetes risk with age")
-        risk_scores.append(1)
-    else:
-        risk_factors.append(f"Age {age} - Lower diabetes risk")
-        risk_scores.append(0)
-    
-    # Additional Risk Factors
-    if blood_pressure > 140:
-        risk_factors.append(f"High blood pressure ({blood_pressure} mmHg) - Diabetes risk")
-        risk_scores.append(1)
-    
-    if smoking > 0:
-        risk_factors.append(f"Smoking history - Increases diabetes risk")
-        risk_scores.append(1)
-    
-    if sleep_hours < 6:
-        risk_factors.append(f"Insufficient sleep ({sleep_hours} hours) - Diabetes risk")
-        risk_scores.append(1)
-    
-    if stress_level > 7:
-        risk_factors.append(f"High stress level ({stress_level}/10) - Diabetes risk")
-        risk_scores.append(1)
-    
-    # Calculate total risk score
-    total_risk_score = sum(risk_scores)
-    
-    # Generate detailed personalized response
-    if total_risk_score >= 8 or diabetes_risk > 0.5:
-        confidence = "High"
-        answer = f"""**Your Diabetes Risk Assessment: HIGH RISK**
+    risk_bullets = []
+    protective_bullets = []
+    total_score = 0
+    for field, locate_tier, thresholds, tiers in factor_scorer:
+        value = getattr(profile, field)
+        if value is None:
+            continue
+        score, message, kind = tiers[locate_tier(thresholds, value)]
+        total_score += score
+        if message is None:
+            continue
+        factor = message.format(v=value)
+        risk_factors.append(factor)
+        # Bullets are segregated here so rendering needs no per-message filtering
+        if kind & FACTOR_RISK:
+            risk_bullets.append(factor)
+        if kind & FACTOR_PROTECTIVE:
+            protective_bullets.append(factor)
+    return risk_factors, risk_bullets, protective_bullets, total_score
+
+# Category label tables: (thresholds, inclusive, labels), resolved with tier_label.
+# Inclusive tables put a value equal to a threshold in the higher tier.
+BMI_CATEGORY_LABELS = ((25, 30), False, ('Normal weight', 'Overweight', 'Obesity'))
+BMI_HEALTHY_CATEGORY_LABELS = ((25, 30), False, ('Healthy weight', 'Overweight', 'Obesity'))
+BMI_REVIEW_LABELS = ((25,), False, ('Good', 'Needs improvement'))
+GLUCOSE_CATEGORY_LABELS = ((100,), False, ('Normal', 'Pre-diabetic'))
+GLUCOSE_REVIEW_LABELS = ((100,), False, ('Normal', 'Monitor closely'))
+ACTIVITY_CATEGORY_LABELS = ((3, 6), True, ('Low', 'Moderate', 'Good'))
+ACTIVITY_LEVEL_LABELS = ((4, 7), False, ('Low', 'Moderate', 'High'))
+ACTIVITY_REVIEW_LABELS = ((6,), True, ('Needs improvement', 'Good'))
+AGE_RISK_LABELS = ((45, 65), False, ('Lower risk age', 'Moderate risk age', 'High risk age'))
+AGE_REVIEW_LABELS = ((45,), False, ('Lower risk', 'Monitor closely'))
+AGE_AGING_LABELS = ((45,), False, ('Lower risk age', 'Monitor as you age'))
+AGE_LIFE_STAGE_LABELS = ((50, 65), False, ('Young adult', 'Midlife', 'Senior'))
+BP_STAGE_LABELS = ((120, 130, 140), True, ('Normal', 'Elevated', 'Stage 1 Hypertension', 'Stage 2 Hypertension'))
+BP_CATEGORY_LABELS = ((130, 140), True, ('Normal', 'Elevated', 'High'))
+BP_HIGH_LABELS = ((130,), True, ('Normal', 'High'))
+BP_MONITOR_LABELS = ((120,), True, ('Good', 'Needs monitoring'))
+BP_REVIEW_LABELS = ((130,), True, ('Normal', 'Monitor closely'))
+CHOLESTEROL_CATEGORY_LABELS = ((200, 240), False, ('Normal', 'Borderline', 'High'))
+CHOLESTEROL_HIGH_LABELS = ((240,), False, ('Normal', 'High'))
+CHOLESTEROL_REVIEW_LABELS = ((200,), False, ('Normal', 'Monitor closely'))
+
+def tier_index(value: float, label_table: tuple) -> int:
+    """Return the tier a value falls in for a label table"""
+    thresholds, inclusive, _ = label_table
+    return bisect_right(thresholds, value) if inclusive else bisect_left(thresholds, value)
+
+def tier_label(value: float, label_table: tuple) -> str:
+    """Look up the category label for a value in a label table"""
+    return label_table[2][tier_index(value, label_table)]
+
+# Risk answer templates: (str.format text, tier labels). Each tier label is
+# (placeholder, value name, label table).
+DIABETES_HIGH_RISK_TEMPLATE = ("""**Your Diabetes Risk Assessment: HIGH RISK**
 
 Based on your specific health assessment, you have multiple significant diabetes risk factors:
-{chr(10).join([f"• {factor}" for factor in risk_factors if "risk" in factor.lower() and "protective" not in factor.lower()])}
+{risk_bullets}
 
 **Your Assessment Results:**
 • **Predicted Diabetes Risk: {diabetes_risk:.1%}** (Based on your specific health profile)
 • **Risk Category: {diabetes_confidence}**
-• **Metabolic Health Score: {prediction_result.get('metabolic_health_score', 'N/A') if prediction_result else 'N/A'}**
+• **Metabolic Health Score: {metabolic_score}**
 
 **Immediate Actions Needed:**
 • Schedule a comprehensive diabetes screening (HbA1c, fasting glucose, oral glucose tolerance test)
@@ -2739,22 +3004,25 @@ Based on your specific health assessment, you have multiple significant diabetes
 • Monitor blood glucose levels daily
 
 **Your Specific Risk Factors:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
-• Age: {age} years ({'High risk age' if age > 65 else 'Moderate risk age' if age > 45 else 'Lower risk age'})"""
-        
-    elif total_risk_score >= 4 or diabetes_risk > 0.2:
-        confidence = "Moderate"
-        answer = f"""**Your Diabetes Risk Assessment: MODERATE RISK**
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Physical Activity: {activity}/10 ({activity_label})
+• Age: {age} years ({age_label})""", (
+    ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+    ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+    ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    ('age_label', 'age', AGE_RISK_LABELS),
+))
+
+DIABETES_MODERATE_RISK_TEMPLATE = ("""**Your Diabetes Risk Assessment: MODERATE RISK**
 
 You have some diabetes risk factors that need attention:
-{chr(10).join([f"• {factor}" for factor in risk_factors if "risk" in factor.lower() and "protective" not in factor.lower()])}
+{risk_bullets}
 
 **Your Assessment Results:**
 • **Predicted Diabetes Risk: {diabetes_risk:.1%}** (Based on your specific health profile)
 • **Risk Category: {diabetes_confidence}**
-• **Metabolic Health Score: {prediction_result.get('metabolic_health_score', 'N/A') if prediction_result else 'N/A'}**
+• **Metabolic Health Score: {metabolic_score}**
 
 **Immediate Actions Needed:**
 • Get an HbA1c test within 3 months
@@ -2763,22 +3031,25 @@ You have some diabetes risk factors that need attention:
 • Improve diet quality (reduce refined carbs, increase fiber)
 
 **Your Specific Profile:**
-• BMI: {bmi:.1f} - {'Needs improvement' if bmi > 25 else 'Good'}
-• Blood Glucose: {glucose} mg/dL - {'Monitor closely' if glucose > 100 else 'Normal'}
-• Physical Activity: {activity}/10 - {'Needs improvement' if activity < 6 else 'Good'}
-• Age: {age} years - {'Monitor closely' if age > 45 else 'Lower risk'}"""
-        
-    else:
-        confidence = "Low"
-        answer = f"""**Your Diabetes Risk Assessment: LOW RISK**
+• BMI: {bmi:.1f} - {bmi_label}
+• Blood Glucose: {glucose} mg/dL - {glucose_label}
+• Physical Activity: {activity}/10 - {activity_label}
+• Age: {age} years - {age_label}""", (
+    ('bmi_label', 'bmi', BMI_REVIEW_LABELS),
+    ('glucose_label', 'glucose', GLUCOSE_REVIEW_LABELS),
+    ('activity_label', 'activity', ACTIVITY_REVIEW_LABELS),
+    ('age_label', 'age', AGE_REVIEW_LABELS),
+))
+
+DIABETES_LOW_RISK_TEMPLATE = ("""**Your Diabetes Risk Assessment: LOW RISK**
 
 Excellent! Your current health profile shows low diabetes risk:
-{chr(10).join([f"• {factor}" for factor in risk_factors if "protective" in factor.lower() or "good" in factor.lower() or "normal" in factor.lower()])}
+{protective_bullets}
 
 **Your Assessment Results:**
 • **Predicted Diabetes Risk: {diabetes_risk:.1%}** (Based on your specific health profile)
 • **Risk Category: {diabetes_confidence}**
-• **Metabolic Health Score: {prediction_result.get('metabolic_health_score', 'N/A') if prediction_result else 'N/A'}**
+• **Metabolic Health Score: {metabolic_score}**
 
 **Maintain Your Healthy Habits:**
 • Continue regular physical activity ({activity}/10 is great!)
@@ -2790,157 +3061,14 @@ Excellent! Your current health profile shows low diabetes risk:
 • BMI: {bmi:.1f} - Excellent
 • Blood Glucose: {glucose} mg/dL - Normal
 • Physical Activity: {activity}/10 - Good
-• Age: {age} years - {'Monitor as you age' if age > 45 else 'Lower risk age'}"""
-    
-    # Personalized follow-up suggestions
-    follow_up_suggestions = []
-    if total_risk_score >= 8:
-        follow_up_suggestions = [
-            "Schedule immediate diabetes screening with your doctor",
-            "Consider working with a diabetes educator",
-            "Start daily blood glucose monitoring",
-            "Discuss medication options with your healthcare provider"
-        ]
-    elif total_risk_score >= 4:
-        follow_up_suggestions = [
-            "Get HbA1c test within 3 months",
-            "Start a structured exercise program",
-            "Consider working with a nutritionist",
-            "Monitor blood glucose monthly"
-        ]
-    else:
-        follow_up_suggestions = [
-            "Continue current healthy lifestyle",
-            "Get annual health checkups",
-            "Maintain regular physical activity",
-            "Consider preventive health measures"
-        ]
-    
-    return HealthAnswer(
-        answer=answer,
-        confidence=confidence,
-        related_factors=risk_factors[:5],
-        follow_up_suggestions=follow_up_suggestions,
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice. Consult your healthcare provider for personalized medical guidance."
-    )
+• Age: {age} years - {age_label}""", (
+    ('age_label', 'age', AGE_AGING_LABELS),
+))
 
-def analyze_hypertension_risk_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
-    """Analyze hypertension-related questions with detailed personalized insights"""
-    age = health_data.get('age', 45)
-    blood_pressure = health_data.get('blood_pressure', 120)
-    bmi = health_data.get('bmi', 25)
-    cholesterol = health_data.get('cholesterol_level', 200)
-    glucose = health_data.get('glucose_level', 100)
-    family_history = health_data.get('family_history', 0)
-    activity = health_data.get('physical_activity', 5)
-    smoking = health_data.get('smoking_status', 0)
-    alcohol = health_data.get('alcohol_intake', 0)
-    sleep_hours = health_data.get('sleep_hours', 7)
-    stress_level = health_data.get('stress_level', 5)
-    
-    # Detailed risk factor analysis
-    risk_factors = []
-    risk_scores = []
-    
-    # Blood Pressure Analysis
-    if blood_pressure >= 140:
-        risk_factors.append(f"Stage 2 Hypertension ({blood_pressure} mmHg) - High risk")
-        risk_scores.append(4)
-    elif blood_pressure >= 130:
-        risk_factors.append(f"Stage 1 Hypertension ({blood_pressure} mmHg) - Elevated risk")
-        risk_scores.append(3)
-    elif blood_pressure >= 120:
-        risk_factors.append(f"Elevated blood pressure ({blood_pressure} mmHg) - Pre-hypertension")
-        risk_scores.append(2)
-    else:
-        risk_factors.append(f"Normal blood pressure ({blood_pressure} mmHg) - Good cardiovascular health")
-        risk_scores.append(0)
-    
-    # BMI Analysis
-    if bmi > 30:
-        risk_factors.append(f"Obesity (BMI: {bmi:.1f}) - Major hypertension risk")
-        risk_scores.append(3)
-    elif bmi > 25:
-        risk_factors.append(f"Overweight (BMI: {bmi:.1f}) - Moderate hypertension risk")
-        risk_scores.append(2)
-    else:
-        risk_factors.append(f"Healthy weight (BMI: {bmi:.1f}) - Lower hypertension risk")
-        risk_scores.append(0)
-    
-    # Age Factor
-    if age > 65:
-        risk_factors.append(f"Age {age} - High hypertension risk with age")
-        risk_scores.append(3)
-    elif age > 45:
-        risk_factors.append(f"Age {age} - Moderate hypertension risk with age")
-        risk_scores.append(2)
-    else:
-        risk_factors.append(f"Age {age} - Lower hypertension risk")
-        risk_scores.append(0)
-    
-    # Family History
-    if family_history:
-        risk_factors.append("Family history of hypertension - Genetic predisposition")
-        risk_scores.append(2)
-    else:
-        risk_factors.append("No family history of hypertension - Lower genetic risk")
-        risk_scores.append(0)
-    
-    # Physical Activity
-    if activity < 3:
-        risk_factors.append(f"Low physical activity ({activity}/10) - Major hypertension risk")
-        risk_scores.append(3)
-    elif activity < 6:
-        risk_factors.append(f"Moderate physical activity ({activity}/10) - Some hypertension risk")
-        risk_scores.append(1)
-    else:
-        risk_factors.append(f"Good physical activity ({activity}/10) - Protective against hypertension")
-        risk_scores.append(0)
-    
-    # Additional Risk Factors
-    if cholesterol > 240:
-        risk_factors.append(f"High cholesterol ({cholesterol} mg/dL) - Hypertension risk")
-        risk_scores.append(2)
-    elif cholesterol > 200:
-        risk_factors.append(f"Borderline cholesterol ({cholesterol} mg/dL) - Some hypertension risk")
-        risk_scores.append(1)
-    
-    if glucose > 126:
-        risk_factors.append(f"Elevated glucose ({glucose} mg/dL) - Hypertension risk")
-        risk_scores.append(2)
-    elif glucose > 100:
-        risk_factors.append(f"Borderline glucose ({glucose} mg/dL) - Some hypertension risk")
-        risk_scores.append(1)
-    
-    if smoking > 0:
-        risk_factors.append(f"Smoking history - Major hypertension risk")
-        risk_scores.append(3)
-    
-    if alcohol > 3:
-        risk_factors.append(f"High alcohol intake ({alcohol}/5) - Hypertension risk")
-        risk_scores.append(2)
-    elif alcohol > 1:
-        risk_factors.append(f"Moderate alcohol intake ({alcohol}/5) - Some hypertension risk")
-        risk_scores.append(1)
-    
-    if sleep_hours < 6:
-        risk_factors.append(f"Insufficient sleep ({sleep_hours} hours) - Hypertension risk")
-        risk_scores.append(2)
-    
-    if stress_level > 7:
-        risk_factors.append(f"High stress level ({stress_level}/10) - Hypertension risk")
-        risk_scores.append(2)
-    
-    # Calculate total risk score
-    total_risk_score = sum(risk_scores)
-    
-    # Generate detailed personalized response
-    if total_risk_score >= 10:
-        confidence = "High"
-        answer = f"""**Your Hypertension Risk Assessment: HIGH RISK**
+HYPERTENSION_HIGH_RISK_TEMPLATE = ("""**Your Hypertension Risk Assessment: HIGH RISK**
 
 Based on your health profile, you have multiple significant hypertension risk factors:
-{chr(10).join([f"• {factor}" for factor in risk_factors if "risk" in factor.lower() and "protective" not in factor.lower()])}
+{risk_bullets}
 
 **Immediate Actions Needed:**
 • Schedule immediate blood pressure monitoring (daily for 1 week)
@@ -2949,17 +3077,20 @@ Based on your health profile, you have multiple significant hypertension risk fa
 • Monitor blood pressure at home daily
 
 **Your Specific Risk Factors:**
-• Blood Pressure: {blood_pressure} mmHg ({'Stage 2 Hypertension' if blood_pressure >= 140 else 'Stage 1 Hypertension' if blood_pressure >= 130 else 'Elevated' if blood_pressure >= 120 else 'Normal'})
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
-• Age: {age} years ({'High risk age' if age > 65 else 'Moderate risk age' if age > 45 else 'Lower risk age'})"""
-        
-    elif total_risk_score >= 5:
-        confidence = "Moderate"
-        answer = f"""**Your Hypertension Risk Assessment: MODERATE RISK**
+• Blood Pressure: {blood_pressure} mmHg ({bp_label})
+• BMI: {bmi:.1f} ({bmi_label})
+• Physical Activity: {activity}/10 ({activity_label})
+• Age: {age} years ({age_label})""", (
+    ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+    ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    ('age_label', 'age', AGE_RISK_LABELS),
+    ('bp_label', 'blood_pressure', BP_STAGE_LABELS),
+))
+
+HYPERTENSION_MODERATE_RISK_TEMPLATE = ("""**Your Hypertension Risk Assessment: MODERATE RISK**
 
 You have some hypertension risk factors that need attention:
-{chr(10).join([f"• {factor}" for factor in risk_factors if "risk" in factor.lower() and "protective" not in factor.lower()])}
+{risk_bullets}
 
 **Immediate Actions Needed:**
 • Monitor blood pressure weekly for 1 month
@@ -2968,17 +3099,20 @@ You have some hypertension risk factors that need attention:
 • Reduce sodium intake to < 2,300mg/day
 
 **Your Specific Profile:**
-• Blood Pressure: {blood_pressure} mmHg - {'Needs monitoring' if blood_pressure >= 120 else 'Good'}
-• BMI: {bmi:.1f} - {'Needs improvement' if bmi > 25 else 'Good'}
-• Physical Activity: {activity}/10 - {'Needs improvement' if activity < 6 else 'Good'}
-• Age: {age} years - {'Monitor closely' if age > 45 else 'Lower risk'}"""
-        
-    else:
-        confidence = "Low"
-        answer = f"""**Your Hypertension Risk Assessment: LOW RISK**
+• Blood Pressure: {blood_pressure} mmHg - {bp_label}
+• BMI: {bmi:.1f} - {bmi_label}
+• Physical Activity: {activity}/10 - {activity_label}
+• Age: {age} years - {age_label}""", (
+    ('bmi_label', 'bmi', BMI_REVIEW_LABELS),
+    ('activity_label', 'activity', ACTIVITY_REVIEW_LABELS),
+    ('age_label', 'age', AGE_REVIEW_LABELS),
+    ('bp_label', 'blood_pressure', BP_MONITOR_LABELS),
+))
+
+HYPERTENSION_LOW_RISK_TEMPLATE = ("""**Your Hypertension Risk Assessment: LOW RISK**
 
 Excellent! Your current health profile shows low hypertension risk:
-{chr(10).join([f"• {factor}" for factor in risk_factors if "protective" in factor.lower() or "good" in factor.lower() or "normal" in factor.lower()])}
+{protective_bullets}
 
 **Maintain Your Healthy Habits:**
 • Continue regular physical activity ({activity}/10 is great!)
@@ -2990,288 +3124,391 @@ Excellent! Your current health profile shows low hypertension risk:
 • Blood Pressure: {blood_pressure} mmHg - Excellent
 • BMI: {bmi:.1f} - Good
 • Physical Activity: {activity}/10 - Good
-• Age: {age} years - {'Monitor as you age' if age > 45 else 'Lower risk age'}"""
-    
-    # Personalized follow-up suggestions
-    follow_up_suggestions = []
-    if total_risk_score >= 10:
-        follow_up_suggestions = [
-            "Schedule immediate blood pressure evaluation with your doctor",
-            "Consider working with a hypertension specialist",
-            "Start daily blood pressure monitoring at home",
-            "Discuss medication options with your healthcare provider"
-        ]
-    elif total_risk_score >= 5:
-        follow_up_suggestions = [
+• Age: {age} years - {age_label}""", (
+    ('age_label', 'age', AGE_AGING_LABELS),
+))
+
+def compile_answer_template(template: tuple) -> tuple:
+    """Split an answer template's text into (literal, field, format spec) segments once"""
+    text, tier_labels = template
+    segments = tuple((literal, field, spec) for literal, field, spec, _ in string.Formatter().parse(text))
+    return segments, tier_labels
+
+def render_answer_template(compiled_template: tuple, values: Dict[str, Any]) -> str:
+    """Fill a compiled answer template, resolving its tier labels from the given values"""
+    segments, tier_labels = compiled_template
+    context = dict(values)
+    for name, key, label_table in tier_labels:
+        context[name] = tier_label(values[key], label_table)
+    # Join the small pieces in one pass instead of re-parsing the whole template per answer
+    parts = []
+    for literal, field, spec in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(format(context[field], spec))
+    return "".join(parts)
+
+def format_bullets(items: List[str], limit: Optional[int] = None) -> str:
+    """Join up to limit items into a bullet list"""
+    shown = items if limit is None else items[:limit]
+    # One join with the bullet in the separator, rather than a "• " + item string per item
+    return "• " + "\n• ".join(shown) if shown else ""
+
+RISK_CONFIDENCE_LEVELS = ("Low", "Moderate", "High")
+RISK_ANSWER_DISCLAIMER = GENERAL_HEALTH_DISCLAIMER + " Consult your healthcare provider for personalized medical guidance."
+HEALTHY_LIFESTYLE_FOLLOW_UPS = (
+    "Continue current healthy lifestyle",
+    "Get annual health checkups",
+    "Maintain regular physical activity",
+    "Consider preventive health measures",
+)
+
+# Per-condition risk question settings; tiers are ordered (low, moderate, high)
+# and the score tier is the number of score_tiers thresholds reached.
+DIABETES_RISK_QUESTION = {
+    'scorer': DIABETES_FACTOR_SCORER,
+    'score_tiers': (4, 8),
+    'templates': tuple(map(compile_answer_template, (DIABETES_LOW_RISK_TEMPLATE, DIABETES_MODERATE_RISK_TEMPLATE, DIABETES_HIGH_RISK_TEMPLATE))),
+    'follow_ups': (
+        HEALTHY_LIFESTYLE_FOLLOW_UPS,
+        (
+            "Get HbA1c test within 3 months",
+            "Start a structured exercise program",
+            "Consider working with a nutritionist",
+            "Monitor blood glucose monthly",
+        ),
+        (
+            "Schedule immediate diabetes screening with your doctor",
+            "Consider working with a diabetes educator",
+            "Start daily blood glucose monitoring",
+            "Discuss medication options with your healthcare provider",
+        ),
+    ),
+}
+# Predicted diabetes probability above these raises the answer tier
+DIABETES_MODEL_RISK_TIERS = (0.2, 0.5)
+
+HYPERTENSION_RISK_QUESTION = {
+    'scorer': HYPERTENSION_FACTOR_SCORER,
+    'score_tiers': (5, 10),
+    'templates': tuple(map(compile_answer_template, (HYPERTENSION_LOW_RISK_TEMPLATE, HYPERTENSION_MODERATE_RISK_TEMPLATE, HYPERTENSION_HIGH_RISK_TEMPLATE))),
+    'follow_ups': (
+        HEALTHY_LIFESTYLE_FOLLOW_UPS,
+        (
             "Monitor blood pressure weekly for 1 month",
             "Start a structured exercise program",
             "Consider working with a nutritionist for DASH diet",
-            "Reduce sodium intake to < 2,300mg/day"
-        ]
-    else:
-        follow_up_suggestions = [
-            "Continue current healthy lifestyle",
-            "Get annual health checkups",
-            "Maintain regular physical activity",
-            "Consider preventive health measures"
-        ]
-    
-    return HealthAnswer(
+            "Reduce sodium intake to < 2,300mg/day",
+        ),
+        (
+            "Schedule immediate blood pressure evaluation with your doctor",
+            "Consider working with a hypertension specialist",
+            "Start daily blood pressure monitoring at home",
+            "Discuss medication options with your healthcare provider",
+        ),
+    ),
+}
+
+def build_risk_answer(risk_question: Dict[str, Any], profile: HealthProfile, answer_values: Dict[str, Any], model_tier: int = 0) -> tuple:
+    """Score a profile and render its risk answer as (answer, confidence, related factors, follow-ups)"""
+    risk_factors, risk_bullets, protective_bullets, total_risk_score = score_risk_factors(risk_question['scorer'], profile)
+    score_tier = bisect_right(risk_question['score_tiers'], total_risk_score)
+    
+    # The answer tier can be raised by the model prediction; follow-ups track the factor score
+    tier = max(score_tier, model_tier)
+    answer = render_answer_template(risk_question['templates'][tier], {
+        **answer_values,
+        'risk_bullets': format_bullets(risk_bullets),
+        'protective_bullets': format_bullets(protective_bullets),
+    })
+    related_factors = tuple(risk_factors[:5])
+    return answer, RISK_CONFIDENCE_LEVELS[tier], related_factors, risk_question['follow_ups'][score_tier]
+
+def make_risk_answer(built_answer: tuple) -> HealthAnswer:
+    """Wrap a (possibly cached) built risk answer in a fresh HealthAnswer"""
+    answer, confidence, related_factors, follow_up_suggestions = built_answer
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence=confidence,
-        related_factors=risk_factors[:5],
+        related_factors=related_factors,
         follow_up_suggestions=follow_up_suggestions,
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice. Consult your healthcare provider for personalized medical guidance."
+        disclaimer=RISK_ANSWER_DISCLAIMER
     )
 
-def analyze_prevention_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
-    """Analyze prevention-focused questions"""
-    age = health_data.get('age', 45)
-    bmi = health_data.get('bmi', 25)
-    activity = health_data.get('physical_activity', 5)
-    
-    prevention_strategies = []
-    
-    if bmi > 25:
-        prevention_strategies.append("weight management through a balanced diet and regular exercise")
-    
-    if activity < 5:
-        prevention_strategies.append("increasing physical activity to at least 150 minutes per week")
-    
-    prevention_strategies.extend([
-        "maintaining a healthy diet rich in fruits, vegetables, and whole grains",
-        "limiting processed foods and added sugars",
-        "managing stress through relaxation techniques",
-        "getting adequate sleep (7-9 hours nightly)",
-        "avoiding smoking and limiting alcohol consumption"
-    ])
+def analyze_diabetes_risk_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+    """Analyze diabetes-related questions with detailed personalized insights"""
     
-    answer = f"Based on your health profile, here are key prevention strategies: {'. '.join(prevention_strategies[:4])}. These lifestyle modifications can significantly reduce your risk of chronic diseases."
+    # Log a short fingerprint of the profile rather than its full repr
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Analyzing diabetes risk for profile hash=%s", hash(profile))
+    
+    # Get prediction results if available (invalid risk values count as 0)
+    prediction_result = prediction_result or {}
+    diabetes_risk = safe_float_conversion(prediction_result.get('diabetes_risk', 0))
+    if not math.isfinite(diabetes_risk):
+        diabetes_risk = 0.0
+    diabetes_confidence = prediction_result.get('diabetes_confidence', 'Unknown')
+    metabolic_score = prediction_result.get('metabolic_health_score', 'N/A')
+    
+    return make_risk_answer(build_diabetes_risk_answer(profile, diabetes_risk, diabetes_confidence, metabolic_score, value_types(profile)))
+
+@lru_cache(maxsize=4096, typed=True)
+def build_diabetes_risk_answer(profile: HealthProfile, diabetes_risk: float, diabetes_confidence: str, metabolic_score: Any, profile_types: tuple) -> tuple:
+    """Build the diabetes risk answer for one profile (cached per profile and value types, profiles repeat across questions)"""
+    answer_values = {
+        'age': profile.age, 'bmi': profile.bmi, 'glucose': profile.glucose_level, 'activity': profile.physical_activity,
+        'diabetes_risk': diabetes_risk, 'diabetes_confidence': diabetes_confidence,
+        'metabolic_score': metabolic_score,
+    }
+    model_tier = bisect_left(DIABETES_MODEL_RISK_TIERS, diabetes_risk)
+    return build_risk_answer(DIABETES_RISK_QUESTION, profile, answer_values, model_tier)
+
+def analyze_hypertension_risk_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+    """Analyze hypertension-related questions with detailed personalized insights"""
+    return make_risk_answer(build_hypertension_risk_answer(profile, value_types(profile)))
+
+@lru_cache(maxsize=4096)
+def build_hypertension_risk_answer(profile: HealthProfile, profile_types: tuple) -> tuple:
+    """Build the hypertension risk answer for one profile (cached per profile and value types, profiles repeat across questions)"""
+    answer_values = {
+        'age': profile.age, 'blood_pressure': profile.blood_pressure, 'bmi': profile.bmi, 'activity': profile.physical_activity,
+    }
+    return build_risk_answer(HYPERTENSION_RISK_QUESTION, profile, answer_values)
+
+# Prevention strategies; the weight and activity ones lead when they apply
+PREVENTION_WEIGHT_STRATEGY = "weight management through a balanced diet and regular exercise"
+PREVENTION_ACTIVITY_STRATEGY = "increasing physical activity to at least 150 minutes per week"
+CORE_PREVENTION_STRATEGIES = (
+    "maintaining a healthy diet rich in fruits, vegetables, and whole grains",
+    "limiting processed foods and added sugars",
+    "managing stress through relaxation techniques",
+    "getting adequate sleep (7-9 hours nightly)",
+    "avoiding smoking and limiting alcohol consumption",
+)
+# Only four answers are possible, keyed by (needs weight management, needs more activity)
+PREVENTION_ANSWERS = {
+    (needs_weight, needs_activity): (
+        "Based on your health profile, here are key prevention strategies: "
+        + '. '.join((
+            (PREVENTION_WEIGHT_STRATEGY,) * needs_weight
+            + (PREVENTION_ACTIVITY_STRATEGY,) * needs_activity
+            + CORE_PREVENTION_STRATEGIES
+        )[:4])
+        + ". These lifestyle modifications can significantly reduce your risk of chronic diseases."
+    )
+    for needs_weight in (False, True)
+    for needs_activity in (False, True)
+}
+
+PREVENTION_QUESTION_FOLLOW_UPS = (
+    "Set specific, achievable health goals",
+    "Track your progress regularly",
+    "Consider working with a healthcare provider or nutritionist",
+)
+
+def analyze_prevention_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+    """Analyze prevention-focused questions"""
+    answer = PREVENTION_ANSWERS[(profile.bmi > 25, profile.physical_activity < 5)]
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=["lifestyle factors", "preventive measures"],
-        follow_up_suggestions=[
-            "Set specific, achievable health goals",
-            "Track your progress regularly",
-            "Consider working with a healthcare provider or nutritionist"
-        ],
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice."
+        related_factors=("lifestyle factors", "preventive measures"),
+        follow_up_suggestions=PREVENTION_QUESTION_FOLLOW_UPS,
+        disclaimer=GENERAL_HEALTH_DISCLAIMER
     )
 
-def analyze_nutrition_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
-    """Analyze nutrition-related questions with detailed personalized recommendations"""
-    age = health_data.get('age', 45)
-    bmi = health_data.get('bmi', 25)
-    glucose = health_data.get('glucose_level', 100)
-    blood_pressure = health_data.get('blood_pressure', 120)
-    cholesterol = health_data.get('cholesterol_level', 200)
-    activity = health_data.get('physical_activity', 5)
-    hba1c = health_data.get('hba1c', None)
-    family_history = health_data.get('family_history', 0)
-    smoking = health_data.get('smoking_status', 0)
-    alcohol = health_data.get('alcohol_intake', 0)
-    sleep_hours = health_data.get('sleep_hours', 7)
-    stress_level = health_data.get('stress_level', 5)
-    
-    # Calculate personalized nutrition needs
-    base_calories = 2000 if age < 50 else 1800
-    if bmi > 30:
-        calorie_target = base_calories - 500  # Weight loss
-    elif bmi > 25:
-        calorie_target = base_calories - 250  # Moderate weight loss
-    else:
-        calorie_target = base_calories  # Maintenance
-    
-    # Protein needs based on activity and age
-    protein_needs = 1.2 if activity > 6 else 1.0
-    if age > 65:
-        protein_needs += 0.2  # Higher protein for older adults
-    
-    # Detailed nutrition analysis
-    nutrition_priorities = []
-    specific_recommendations = []
-    foods_to_emphasize = []
-    foods_to_limit = []
-    
-    # Blood Sugar Management
-    if glucose > 126 or (hba1c and hba1c >= 6.5):
-        nutrition_priorities.append("Diabetes Management")
-        specific_recommendations.extend([
+NUTRITION_GUIDANCE = {
+    # focus area: (recommendations, foods to emphasize, foods to limit)
+    "Diabetes Management": (
+        (
             "Follow a consistent carbohydrate meal plan",
             "Aim for 45-60g carbs per meal, 15-30g for snacks",
             "Choose low glycemic index foods",
-            "Space meals 3-4 hours apart"
-        ])
-        foods_to_emphasize.extend([
+            "Space meals 3-4 hours apart",
+        ),
+        (
             "Non-starchy vegetables (broccoli, spinach, bell peppers)",
             "Lean proteins (chicken, fish, tofu)",
             "Healthy fats (avocado, nuts, olive oil)",
-            "High-fiber foods (berries, beans, quinoa)"
-        ])
-        foods_to_limit.extend([
+            "High-fiber foods (berries, beans, quinoa)",
+        ),
+        (
             "Refined carbohydrates (white bread, pasta, rice)",
             "Sugary drinks and desserts",
             "Fruit juices and dried fruits",
-            "Processed snacks"
-        ])
-    elif glucose > 100 or (hba1c and hba1c >= 5.7):
-        nutrition_priorities.append("Pre-Diabetes Prevention")
-        specific_recommendations.extend([
+            "Processed snacks",
+        ),
+    ),
+    "Pre-Diabetes Prevention": (
+        (
             "Focus on whole, unprocessed foods",
             "Limit added sugars to < 25g daily",
             "Include protein with every meal",
-            "Choose complex carbohydrates"
-        ])
-        foods_to_emphasize.extend([
+            "Choose complex carbohydrates",
+        ),
+        (
             "Whole grains (brown rice, oats, quinoa)",
             "Legumes (beans, lentils, chickpeas)",
             "Non-starchy vegetables",
-            "Lean proteins"
-        ])
-        foods_to_limit.extend([
+            "Lean proteins",
+        ),
+        (
             "Sugary beverages",
             "White bread and pasta",
             "Candy and desserts",
-            "Fruit juices"
-        ])
-    
-    # Blood Pressure Management
-    if blood_pressure >= 130:
-        nutrition_priorities.append("Hypertension Management")
-        specific_recommendations.extend([
+            "Fruit juices",
+        ),
+    ),
+    "Hypertension Management": (
+        (
             "Follow DASH diet principles",
             "Limit sodium to < 2,300mg daily (ideally < 1,500mg)",
             "Increase potassium-rich foods",
-            "Limit alcohol to 1 drink/day for women, 2 for men"
-        ])
-        foods_to_emphasize.extend([
+            "Limit alcohol to 1 drink/day for women, 2 for men",
+        ),
+        (
             "Leafy greens (spinach, kale, arugula)",
             "Potassium-rich fruits (bananas, oranges, melons)",
             "Low-fat dairy products",
-            "Nuts and seeds (unsalted)"
-        ])
-        foods_to_limit.extend([
+            "Nuts and seeds (unsalted)",
+        ),
+        (
             "Processed and canned foods",
             "Fast food and restaurant meals",
             "Salted snacks and crackers",
-            "High-sodium condiments"
-        ])
-    
-    # Weight Management
-    if bmi > 30:
-        nutrition_priorities.append("Weight Loss")
-        specific_recommendations.extend([
-            f"Create a {calorie_target - 500} calorie deficit daily",
+            "High-sodium condiments",
+        ),
+    ),
+    "Weight Loss": (
+        (
+            "Create a {weight_loss_calories} calorie deficit daily",
             "Focus on high-volume, low-calorie foods",
             "Eat protein with every meal to preserve muscle",
-            "Practice portion control using smaller plates"
-        ])
-        foods_to_emphasize.extend([
+            "Practice portion control using smaller plates",
+        ),
+        (
             "Non-starchy vegetables (unlimited)",
             "Lean proteins (chicken breast, fish, Greek yogurt)",
             "High-fiber foods (berries, apples, vegetables)",
-            "Water and herbal teas"
-        ])
-        foods_to_limit.extend([
+            "Water and herbal teas",
+        ),
+        (
             "High-calorie beverages",
             "Fried foods and fast food",
             "Large portions of starchy foods",
-            "High-calorie snacks"
-        ])
-    elif bmi > 25:
-        nutrition_priorities.append("Weight Management")
-        specific_recommendations.extend([
-            f"Moderate calorie reduction to {calorie_target} calories daily",
+            "High-calorie snacks",
+        ),
+    ),
+    "Weight Management": (
+        (
+            "Moderate calorie reduction to {calorie_target} calories daily",
             "Focus on nutrient density",
             "Practice mindful eating",
-            "Include regular physical activity"
-        ])
-    
-    # Cholesterol Management
-    if cholesterol > 240:
-        nutrition_priorities.append("Cholesterol Management")
-        specific_recommendations.extend([
+            "Include regular physical activity",
+        ),
+        (),
+        (),
+    ),
+    "Cholesterol Management": (
+        (
             "Limit saturated fat to < 7% of daily calories",
             "Increase soluble fiber intake",
             "Include plant sterols and stanols",
-            "Choose lean proteins and fish"
-        ])
-        foods_to_emphasize.extend([
+            "Choose lean proteins and fish",
+        ),
+        (
             "Oatmeal and high-fiber cereals",
             "Fatty fish (salmon, mackerel, sardines)",
             "Nuts and seeds (walnuts, almonds)",
-            "Fruits and vegetables"
-        ])
-        foods_to_limit.extend([
+            "Fruits and vegetables",
+        ),
+        (
             "Red meat and processed meats",
             "Full-fat dairy products",
             "Fried foods",
-            "Trans fats and hydrogenated oils"
-        ])
-    
-    # Age-Specific Recommendations
-    if age > 65:
-        nutrition_priorities.append("Aging Health")
-        specific_recommendations.extend([
+            "Trans fats and hydrogenated oils",
+        ),
+    ),
+    "Aging Health": (
+        (
             "Increase protein intake to preserve muscle mass",
             "Focus on calcium and vitamin D for bone health",
             "Include B12-rich foods or supplements",
-            "Stay hydrated with 8+ glasses of water daily"
-        ])
-        foods_to_emphasize.extend([
+            "Stay hydrated with 8+ glasses of water daily",
+        ),
+        (
             "Lean proteins (fish, poultry, beans)",
             "Dairy products (milk, yogurt, cheese)",
             "Leafy greens (spinach, kale)",
-            "Berries and citrus fruits"
-        ])
-    
-    # Activity-Based Adjustments
-    if activity > 7:
-        specific_recommendations.extend([
+            "Berries and citrus fruits",
+        ),
+        (),
+    ),
+    "High Activity": (
+        (
             "Increase carbohydrate intake for energy",
             "Include pre and post-workout nutrition",
             "Stay well-hydrated during exercise",
-            "Focus on recovery nutrition"
-        ])
-        foods_to_emphasize.extend([
+            "Focus on recovery nutrition",
+        ),
+        (
             "Complex carbohydrates (sweet potatoes, quinoa)",
             "Lean proteins for muscle repair",
             "Hydrating foods (watermelon, cucumbers)",
-            "Anti-inflammatory foods (berries, turmeric)"
-        ])
-    
-    # Generate comprehensive response
-    if nutrition_priorities:
-        answer = f"""**Your Personalized Nutrition Plan**
+            "Anti-inflammatory foods (berries, turmeric)",
+        ),
+        (),
+    ),
+}
+
+NUTRITION_FOLLOW_UPS = (
+    "Consider working with a registered dietitian for personalized meal planning",
+    "Track your food intake for 1-2 weeks to identify patterns",
+    "Gradually implement changes rather than making drastic shifts",
+    "Monitor your health markers regularly to assess progress",
+)
+# Extra follow-ups by profile value: (profile field, label table), as for the risk factor labels
+NUTRITION_PROFILE_FOLLOW_UPS = (
+    ('bmi', ((25,), False, (None, "Focus on sustainable weight loss of 1-2 pounds per week"))),
+    ('blood_pressure', ((130,), True, (None, "Consider the DASH diet for blood pressure management"))),
+    ('glucose_level', ((100,), False, (None, "Monitor carbohydrate intake and blood sugar response"))),
+)
+
+NUTRITION_PLAN_TEMPLATE = compile_answer_template(("""**Your Personalized Nutrition Plan**
 
 **Primary Focus Areas:**
-{chr(10).join([f"• {priority}" for priority in nutrition_priorities])}
+{nutrition_priorities_bullets}
 
 **Your Health Profile:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Healthy weight'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 130 else 'Normal'})
-• Cholesterol: {cholesterol} mg/dL ({'High' if cholesterol > 240 else 'Normal'})
-• Physical Activity: {activity}/10 ({'High' if activity > 7 else 'Moderate' if activity > 4 else 'Low'})
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Blood Pressure: {blood_pressure} mmHg ({bp_label})
+• Cholesterol: {cholesterol} mg/dL ({cholesterol_label})
+• Physical Activity: {activity}/10 ({activity_label})
 
 **Specific Recommendations:**
-{chr(10).join([f"• {rec}" for rec in specific_recommendations[:6]])}
+{specific_recommendations_bullets}
 
 **Foods to Emphasize:**
-{chr(10).join([f"• {food}" for food in foods_to_emphasize[:8]])}
+{foods_to_emphasize_bullets}
 
 **Foods to Limit:**
-{chr(10).join([f"• {food}" for food in foods_to_limit[:6]])}
+{foods_to_limit_bullets}
 
 **Daily Targets:**
 • Calories: {calorie_target} per day
 • Protein: {protein_needs:.1f}g per kg body weight
 • Fiber: 25-35g daily
-• Water: 8+ glasses daily"""
-    else:
-        answer = f"""**Your Nutrition Assessment: EXCELLENT FOUNDATION**
+• Water: 8+ glasses daily""", (
+    ('bmi_label', 'bmi', BMI_HEALTHY_CATEGORY_LABELS),
+    ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+    ('bp_label', 'blood_pressure', BP_HIGH_LABELS),
+    ('cholesterol_label', 'cholesterol', CHOLESTEROL_HIGH_LABELS),
+    ('activity_label', 'activity', ACTIVITY_LEVEL_LABELS),
+)))
+
+NUTRITION_MAINTENANCE_TEMPLATE = compile_answer_template(("""**Your Nutrition Assessment: EXCELLENT FOUNDATION**
 
 Your current health profile shows good metabolic health:
 • BMI: {bmi:.1f} - Healthy weight
@@ -3288,242 +3525,306 @@ Your current health profile shows good metabolic health:
 **Daily Targets:**
 • Calories: {calorie_target} per day
 • Protein: {protein_needs:.1f}g per kg body weight
-• Focus on variety and moderation"""
+• Focus on variety and moderation""", ()))
+
+def analyze_nutrition_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+    """Analyze nutrition-related questions with detailed personalized recommendations"""
+    age = profile.age
+    bmi = profile.bmi
+    glucose = profile.glucose_level
+    blood_pressure = profile.blood_pressure
+    cholesterol = profile.cholesterol_level
+    activity = profile.physical_activity
+    hba1c = profile.hba1c
+    family_history = profile.family_history
+    smoking = profile.smoking_status
+    alcohol = profile.alcohol_intake
+    sleep_hours = profile.sleep_hours
+    stress_level = profile.stress_level
     
-    # Personalized follow-up suggestions
-    follow_up_suggestions = [
-        "Consider working with a registered dietitian for personalized meal planning",
-        "Track your food intake for 1-2 weeks to identify patterns",
-        "Gradually implement changes rather than making drastic shifts",
-        "Monitor your health markers regularly to assess progress"
-    ]
-    
-    if bmi > 25:
-        follow_up_suggestions.append("Focus on sustainable weight loss of 1-2 pounds per week")
+    # Calculate personalized nutrition needs
+    base_calories = 2000 if age < 50 else 1800
+    if bmi > 30:
+        calorie_target = base_calories - 500  # Weight loss
+    elif bmi > 25:
+        calorie_target = base_calories - 250  # Moderate weight loss
+    else:
+        calorie_target = base_calories  # Maintenance
+    
+    # Protein needs based on activity and age
+    protein_needs = 1.2 if activity > 6 else 1.0
+    if age > 65:
+        protein_needs += 0.2  # Higher protein for older adults
+    
+    # Detailed nutrition analysis
+    nutrition_priorities = []
+    
+    # Blood Sugar Management
+    if glucose > 126 or (hba1c and hba1c >= 6.5):
+        nutrition_priorities.append("Diabetes Management")
+    elif glucose > 100 or (hba1c and hba1c >= 5.7):
+        nutrition_priorities.append("Pre-Diabetes Prevention")
+    
+    # Blood Pressure Management
     if blood_pressure >= 130:
-        follow_up_suggestions.append("Consider the DASH diet for blood pressure management")
-    if glucose > 100:
-        follow_up_suggestions.append("Monitor carbohydrate intake and blood sugar response")
+        nutrition_priorities.append("Hypertension Management")
+    
+    # Weight Management
+    if bmi > 30:
+        nutrition_priorities.append("Weight Loss")
+    elif bmi > 25:
+        nutrition_priorities.append("Weight Management")
+    
+    # Cholesterol Management
+    if cholesterol > 240:
+        nutrition_priorities.append("Cholesterol Management")
+    
+    # Age-Specific Recommendations
+    if age > 65:
+        nutrition_priorities.append("Aging Health")
     
-    return HealthAnswer(
+    # Healthy profile: the maintenance answer uses none of the focus-area guidance
+    if not nutrition_priorities:
+        answer = render_answer_template(NUTRITION_MAINTENANCE_TEMPLATE, {
+            'bmi': bmi, 'glucose': glucose, 'blood_pressure': blood_pressure, 'cholesterol': cholesterol,
+            'calorie_target': calorie_target, 'protein_needs': protein_needs,
+        })
+    else:
+        # Activity-based adjustments add guidance without a focus area
+        guidance_keys = nutrition_priorities + ["High Activity"] if activity > 7 else nutrition_priorities
+        
+        specific_recommendations = []
+        foods_to_emphasize = []
+        foods_to_limit = []
+        for key in guidance_keys:
+            recommendations, emphasize, limit = NUTRITION_GUIDANCE[key]
+            specific_recommendations.extend(recommendations)
+            foods_to_emphasize.extend(emphasize)
+            foods_to_limit.extend(limit)
+        
+        # Fill in the calorie targets for the recommendations shown
+        specific_recommendations = [
+            rec.format(calorie_target=calorie_target, weight_loss_calories=calorie_target - 500)
+            for rec in specific_recommendations[:6]
+        ]
+        
+        answer = render_answer_template(NUTRITION_PLAN_TEMPLATE, {
+            'bmi': bmi, 'glucose': glucose, 'blood_pressure': blood_pressure, 'cholesterol': cholesterol,
+            'activity': activity, 'calorie_target': calorie_target, 'protein_needs': protein_needs,
+            'nutrition_priorities_bullets': format_bullets(nutrition_priorities),
+            'specific_recommendations_bullets': format_bullets(specific_recommendations),
+            'foods_to_emphasize_bullets': format_bullets(foods_to_emphasize, 8),
+            'foods_to_limit_bullets': format_bullets(foods_to_limit, 6),
+        })
+    
+    # Personalized follow-up suggestions
+    follow_up_suggestions = (*NUTRITION_FOLLOW_UPS, *collect_factor_labels(NUTRITION_PROFILE_FOLLOW_UPS, profile._asdict()))
+    
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=nutrition_priorities[:3],
+        related_factors=tuple(nutrition_priorities[:3]),
         follow_up_suggestions=follow_up_suggestions,
         disclaimer="This nutrition advice is for informational purposes only and should not replace professional medical or nutritional guidance. Consult with a registered dietitian for personalized meal planning."
     )
 
-def analyze_fitness_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
-    """Analyze fitness-related questions with detailed personalized exercise plans"""
-    age = health_data.get('age', 45)
-    bmi = health_data.get('bmi', 25)
-    blood_pressure = health_data.get('blood_pressure', 120)
-    glucose = health_data.get('glucose_level', 100)
-    cholesterol = health_data.get('cholesterol_level', 200)
-    activity = health_data.get('physical_activity', 5)
-    family_history = health_data.get('family_history', 0)
-    smoking = health_data.get('smoking_status', 0)
-    sleep_hours = health_data.get('sleep_hours', 7)
-    stress_level = health_data.get('stress_level', 5)
-    daily_steps = health_data.get('daily_steps', 7000)
-    
-    # Calculate personalized fitness needs
-    fitness_priorities = []
-    exercise_recommendations = []
-    intensity_guidelines = []
-    frequency_guidelines = []
-    specific_exercises = []
-    precautions = []
-    
-    # Current Fitness Level Assessment
-    if activity >= 8:
-        fitness_level = "Advanced"
-        base_weekly_minutes = 300
-    elif activity >= 6:
-        fitness_level = "Intermediate"
-        base_weekly_minutes = 200
-    elif activity >= 4:
-        fitness_level = "Beginner"
-        base_weekly_minutes = 150
-    else:
-        fitness_level = "Sedentary"
-        base_weekly_minutes = 100
-    
-    # Health-Specific Exercise Priorities
-    if bmi > 30:
-        fitness_priorities.append("Weight Loss")
-        exercise_recommendations.extend([
+FITNESS_GUIDANCE = {
+    # focus area: (exercise recommendations, specific exercises, precautions)
+    "Weight Loss": (
+        (
             "Focus on low-impact cardio to protect joints",
             "Include strength training to preserve muscle mass",
             "Start with 20-30 minutes of moderate activity",
-            "Gradually increase duration and intensity"
-        ])
-        specific_exercises.extend([
+            "Gradually increase duration and intensity",
+        ),
+        (
             "Walking (start with 10-15 minutes)",
             "Swimming or water aerobics",
             "Cycling (stationary or outdoor)",
-            "Light strength training with body weight"
-        ])
-        precautions.extend([
+            "Light strength training with body weight",
+        ),
+        (
             "Avoid high-impact activities initially",
             "Listen to your body and rest when needed",
-            "Consider working with a trainer for proper form"
-        ])
-    elif bmi > 25:
-        fitness_priorities.append("Weight Management")
-        exercise_recommendations.extend([
+            "Consider working with a trainer for proper form",
+        ),
+    ),
+    "Weight Management": (
+        (
             "Combine cardio and strength training",
             "Aim for 150-300 minutes of moderate activity weekly",
             "Include high-intensity interval training (HIIT)",
-            "Focus on building lean muscle mass"
-        ])
-        specific_exercises.extend([
+            "Focus on building lean muscle mass",
+        ),
+        (
             "Brisk walking or jogging",
             "Strength training 2-3 times per week",
             "HIIT workouts 1-2 times per week",
-            "Yoga or Pilates for flexibility"
-        ])
-    
-    # Blood Pressure Management
-    if blood_pressure >= 130:
-        fitness_priorities.append("Blood Pressure Control")
-        exercise_recommendations.extend([
+            "Yoga or Pilates for flexibility",
+        ),
+        (),
+    ),
+    "Blood Pressure Control": (
+        (
             "Focus on aerobic exercises for cardiovascular health",
             "Include moderate-intensity activities",
             "Avoid high-intensity exercises initially",
-            "Include stress-reducing activities"
-        ])
-        specific_exercises.extend([
+            "Include stress-reducing activities",
+        ),
+        (
             "Walking, cycling, or swimming",
             "Yoga and meditation",
             "Tai chi or gentle stretching",
-            "Breathing exercises"
-        ])
-        precautions.extend([
+            "Breathing exercises",
+        ),
+        (
             "Monitor blood pressure before and after exercise",
             "Avoid heavy lifting or straining",
-            "Stop if you feel dizzy or short of breath"
-        ])
-    
-    # Blood Sugar Management
-    if glucose > 100:
-        fitness_priorities.append("Blood Sugar Control")
-        exercise_recommendations.extend([
+            "Stop if you feel dizzy or short of breath",
+        ),
+    ),
+    "Blood Sugar Control": (
+        (
             "Include both aerobic and resistance training",
             "Exercise after meals to help with glucose control",
             "Aim for consistency rather than intensity",
-            "Include post-meal walks"
-        ])
-        specific_exercises.extend([
+            "Include post-meal walks",
+        ),
+        (
             "Walking after meals (10-15 minutes)",
             "Resistance training 2-3 times per week",
             "Aerobic activities (cycling, swimming)",
-            "Balance and flexibility exercises"
-        ])
-        precautions.extend([
+            "Balance and flexibility exercises",
+        ),
+        (
             "Monitor blood sugar before and after exercise",
             "Keep glucose tablets or snacks available",
-            "Stay hydrated during exercise"
-        ])
-    
-    # Age-Specific Recommendations
-    if age > 65:
-        fitness_priorities.append("Aging Health")
-        exercise_recommendations.extend([
+            "Stay hydrated during exercise",
+        ),
+    ),
+    "Aging Health": (
+        (
             "Focus on balance and flexibility",
             "Include strength training to prevent muscle loss",
             "Low-impact activities to protect joints",
-            "Regular physical activity for cognitive health"
-        ])
-        specific_exercises.extend([
+            "Regular physical activity for cognitive health",
+        ),
+        (
             "Walking or gentle hiking",
             "Water aerobics or swimming",
             "Light strength training with resistance bands",
-            "Balance exercises (tai chi, yoga)"
-        ])
-        precautions.extend([
+            "Balance exercises (tai chi, yoga)",
+        ),
+        (
             "Start slowly and progress gradually",
             "Focus on proper form over intensity",
-            "Include warm-up and cool-down periods"
-        ])
-    elif age > 50:
-        fitness_priorities.append("Midlife Health")
-        exercise_recommendations.extend([
+            "Include warm-up and cool-down periods",
+        ),
+    ),
+    "Midlife Health": (
+        (
             "Maintain muscle mass with strength training",
             "Include cardiovascular exercises",
             "Focus on bone health with weight-bearing activities",
-            "Include flexibility and mobility work"
-        ])
-        specific_exercises.extend([
+            "Include flexibility and mobility work",
+        ),
+        (
             "Moderate-intensity cardio (brisk walking, cycling)",
             "Strength training 2-3 times per week",
             "Yoga or Pilates for flexibility",
-            "Weight-bearing exercises (walking, dancing)"
-        ])
-    
-    # Current Activity Level Adjustments
-    if activity < 3:
-        fitness_priorities.append("Building Exercise Habit")
-        exercise_recommendations.extend([
+            "Weight-bearing exercises (walking, dancing)",
+        ),
+        (),
+    ),
+    "Building Exercise Habit": (
+        (
             "Start with 10-15 minutes of light activity",
             "Focus on consistency over intensity",
             "Choose activities you enjoy",
-            "Set realistic, achievable goals"
-        ])
-        specific_exercises.extend([
+            "Set realistic, achievable goals",
+        ),
+        (
             "Short walks around the neighborhood",
             "Gentle stretching or yoga",
             "Household activities (gardening, cleaning)",
-            "Dancing to music at home"
-        ])
-    elif activity < 6:
-        fitness_priorities.append("Increasing Activity")
-        exercise_recommendations.extend([
+            "Dancing to music at home",
+        ),
+        (),
+    ),
+    "Increasing Activity": (
+        (
             "Gradually increase duration and intensity",
             "Add variety to prevent boredom",
             "Include both cardio and strength training",
-            "Set progressive goals"
-        ])
-        specific_exercises.extend([
+            "Set progressive goals",
+        ),
+        (
             "Brisk walking or jogging",
             "Bodyweight exercises",
             "Cycling or swimming",
-            "Group fitness classes"
-        ])
-    else:
-        fitness_priorities.append("Optimizing Performance")
-        exercise_recommendations.extend([
+            "Group fitness classes",
+        ),
+        (),
+    ),
+    "Optimizing Performance": (
+        (
             "Include high-intensity training",
             "Focus on sport-specific training",
             "Include recovery and rest days",
-            "Monitor performance metrics"
-        ])
-        specific_exercises.extend([
+            "Monitor performance metrics",
+        ),
+        (
             "HIIT workouts",
             "Advanced strength training",
             "Sport-specific drills",
-            "Cross-training activities"
-        ])
-    
-    # Generate comprehensive response
-    if fitness_priorities:
-        answer = f"""**Your Personalized Fitness Plan**
+            "Cross-training activities",
+        ),
+        (),
+    ),
+}
+
+# Fitness level and weekly aerobic minutes by activity level
+FITNESS_LEVELS = ((4, 6, 8), True, (("Sedentary", 100), ("Beginner", 150), ("Intermediate", 200), ("Advanced", 300)))
+
+# Fitness priorities in display order: (profile field, label table); keys into FITNESS_GUIDANCE
+FITNESS_PRIORITY_LABELS = (
+    ('bmi', ((25, 30), False, (None, "Weight Management", "Weight Loss"))),
+    ('blood_pressure', ((130,), True, (None, "Blood Pressure Control"))),
+    ('glucose_level', ((100,), False, (None, "Blood Sugar Control"))),
+    ('age', ((50, 65), False, (None, "Midlife Health", "Aging Health"))),
+    ('physical_activity', ((3, 6), True, ("Building Exercise Habit", "Increasing Activity", "Optimizing Performance"))),
+)
+
+FITNESS_FOLLOW_UPS = (
+    "Start with activities you enjoy to build consistency",
+    "Track your progress with a fitness app or journal",
+    "Consider working with a personal trainer for proper form",
+    "Listen to your body and adjust intensity as needed",
+)
+FITNESS_PROFILE_FOLLOW_UPS = (
+    ('physical_activity', ((4,), True, ("Start with just 10 minutes daily and build up gradually", None))),
+    ('bmi', ((25,), False, (None, "Focus on sustainable weight loss through consistent exercise"))),
+    ('blood_pressure', ((130,), True, (None, "Monitor blood pressure and consult your doctor before starting"))),
+    ('age', ((65,), False, (None, "Include balance and flexibility exercises for fall prevention"))),
+)
+
+FITNESS_PLAN_TEMPLATE = compile_answer_template(("""**Your Personalized Fitness Plan**
 
 **Primary Focus Areas:**
-{chr(10).join([f"• {priority}" for priority in fitness_priorities])}
+{fitness_priorities_bullets}
 
 **Your Health Profile:**
 • Current Activity Level: {activity}/10 ({fitness_level})
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Healthy weight'})
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 130 else 'Normal'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Age: {age} years ({'Senior' if age > 65 else 'Midlife' if age > 50 else 'Young adult'})
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Pressure: {blood_pressure} mmHg ({bp_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Age: {age} years ({age_label})
 
 **Exercise Recommendations:**
-{chr(10).join([f"• {rec}" for rec in exercise_recommendations[:6]])}
+{exercise_recommendations_bullets}
 
 **Specific Exercises for You:**
-{chr(10).join([f"• {exercise}" for exercise in specific_exercises[:8]])}
+{specific_exercises_bullets}
 
 **Weekly Schedule:**
 • Aerobic Exercise: {base_weekly_minutes} minutes per week
@@ -3538,59 +3839,75 @@ def analyze_fitness_question(question: str, health_data: Dict[str, Any], predict
 • Progress gradually over 4-6 weeks
 
 **Important Precautions:**
-{chr(10).join([f"• {precaution}" for precaution in precautions[:4]])}"""
-    else:
-        answer = f"""**Your Fitness Assessment: EXCELLENT FOUNDATION**
-
-Your current health profile shows good fitness potential:
-• Activity Level: {activity}/10 ({fitness_level})
-• BMI: {bmi:.1f} - Healthy weight
-• Blood Pressure: {blood_pressure} mmHg - Normal
-• Blood Glucose: {glucose} mg/dL - Normal
-
-**Maintain Your Active Lifestyle:**
-• Continue your current exercise routine
-• Include variety to prevent plateaus
-• Focus on progressive overload
-• Include recovery and rest days
-
-**Weekly Schedule:**
-• Aerobic Exercise: {base_weekly_minutes} minutes per week
-• Strength Training: 2-3 times per week
-• Flexibility: Daily stretching
-• Active Recovery: Light activities on rest days"""
+{precautions_bullets}""", (
+    ('bmi_label', 'bmi', BMI_HEALTHY_CATEGORY_LABELS),
+    ('bp_label', 'blood_pressure', BP_HIGH_LABELS),
+    ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+    ('age_label', 'age', AGE_LIFE_STAGE_LABELS),
+)))
+
+def analyze_fitness_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+    """Analyze fitness-related questions with detailed personalized exercise plans"""
+    age = profile.age
+    bmi = profile.bmi
+    blood_pressure = profile.blood_pressure
+    glucose = profile.glucose_level
+    cholesterol = profile.cholesterol_level
+    activity = profile.physical_activity
+    family_history = profile.family_history
+    smoking = profile.smoking_status
+    sleep_hours = profile.sleep_hours
+    stress_level = profile.stress_level
+    daily_steps = profile.daily_steps
+    
+    # Current Fitness Level Assessment
+    fitness_level, base_weekly_minutes = tier_label(activity, FITNESS_LEVELS)
+    
+    # Health-specific, age and activity level exercise priorities
+    fitness_priorities = collect_factor_labels(FITNESS_PRIORITY_LABELS, profile._asdict())
+    
+    exercise_recommendations = []
+    specific_exercises = []
+    precautions = []
+    for priority in fitness_priorities:
+        recommendations, exercises, priority_precautions = FITNESS_GUIDANCE[priority]
+        exercise_recommendations.extend(recommendations)
+        specific_exercises.extend(exercises)
+        precautions.extend(priority_precautions)
+    
+    # Generate comprehensive response; the activity tier always adds a priority, so there is no maintenance-only answer
+    answer = render_answer_template(FITNESS_PLAN_TEMPLATE, {
+        'activity': activity, 'fitness_level': fitness_level, 'bmi': bmi, 'blood_pressure': blood_pressure,
+        'glucose': glucose, 'age': age, 'base_weekly_minutes': base_weekly_minutes,
+        'fitness_priorities_bullets': format_bullets(fitness_priorities),
+        'exercise_recommendations_bullets': format_bullets(exercise_recommendations, 6),
+        'specific_exercises_bullets': format_bullets(specific_exercises, 8),
+        'precautions_bullets': format_bullets(precautions, 4),
+    })
     
     # Personalized follow-up suggestions
-    follow_up_suggestions = [
-        "Start with activities you enjoy to build consistency",
-        "Track your progress with a fitness app or journal",
-        "Consider working with a personal trainer for proper form",
-        "Listen to your body and adjust intensity as needed"
-    ]
-    
-    if activity < 4:
-        follow_up_suggestions.append("Start with just 10 minutes daily and build up gradually")
-    if bmi > 25:
-        follow_up_suggestions.append("Focus on sustainable weight loss through consistent exercise")
-    if blood_pressure >= 130:
-        follow_up_suggestions.append("Monitor blood pressure and consult your doctor before starting")
-    if age > 65:
-        follow_up_suggestions.append("Include balance and flexibility exercises for fall prevention")
+    follow_up_suggestions = (*FITNESS_FOLLOW_UPS, *collect_factor_labels(FITNESS_PROFILE_FOLLOW_UPS, profile._asdict()))
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=fitness_priorities[:3],
+        related_factors=tuple(fitness_priorities[:3]),
         follow_up_suggestions=follow_up_suggestions,
         disclaimer="This fitness advice is for informational purposes only and should not replace professional medical or fitness guidance. Consult with your healthcare provider before starting any new exercise program."
     )
 
-def analyze_general_health_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+GENERAL_HEALTH_QUESTION_FOLLOW_UPS = (
+    "Continue regular health monitoring",
+    "Maintain consistent healthy habits",
+    "Schedule regular checkups with your healthcare provider",
+)
+
+def analyze_general_health_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
     """Analyze general health questions"""
-    age = health_data.get('age', 45)
-    bmi = health_data.get('bmi', 25)
-    blood_pressure = health_data.get('blood_pressure', 120)
-    glucose = health_data.get('glucose_level', 100)
+    age = profile.age
+    bmi = profile.bmi
+    blood_pressure = profile.blood_pressure
+    glucose = profile.glucose_level
     
     health_summary = f"Based on your health assessment (Age: {age}, BMI: {bmi:.1f}, Blood Pressure: {blood_pressure} mmHg, Glucose: {glucose} mg/dL), "
     
@@ -3604,52 +3921,62 @@ def analyze_general_health_question(question: str, health_data: Dict[str, Any],
         health_summary += "your health markers are generally in good ranges. Continue maintaining your healthy lifestyle habits and regular health checkups."
         confidence = "Low"
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=health_summary,
         confidence=confidence,
-        related_factors=["overall health", "lifestyle factors"],
-        follow_up_suggestions=[
-            "Continue regular health monitoring",
-            "Maintain consistent healthy habits",
-            "Schedule regular checkups with your healthcare provider"
-        ],
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice."
+        related_factors=("overall health", "lifestyle factors"),
+        follow_up_suggestions=GENERAL_HEALTH_QUESTION_FOLLOW_UPS,
+        disclaimer=GENERAL_HEALTH_DISCLAIMER
     )
 
-def analyze_general_risk_question(question: str, health_data: Dict[str, Any], prediction_result: Dict[str, Any] = None) -> HealthAnswer:
+# General risk factors: (profile field, label table); a None label means the factor does not apply
+GENERAL_RISK_FACTOR_LABELS = (
+    ('age', ((45,), False, (None, "age over 45"))),
+    ('bmi', ((25, 30), False, (None, "overweight", "obesity"))),
+    ('blood_pressure', ((140,), True, (None, "high blood pressure"))),
+    ('glucose_level', ((126,), True, (None, "elevated blood glucose"))),
+    ('family_history', ((0,), False, (None, "family history of chronic diseases"))),
+)
+GENERAL_PROTECTIVE_FACTOR_LABELS = (
+    ('bmi', ((25,), True, ("healthy weight", None))),
+    ('blood_pressure', ((120,), True, ("normal blood pressure", None))),
+    ('glucose_level', ((100,), True, ("normal blood glucose", None))),
+    ('family_history', ((0,), False, ("no family history of chronic diseases", None))),
+)
+
+def collect_factor_labels(factor_labels: tuple, values: Dict[str, Any]) -> List[str]:
+    """Return the labels of the factors that apply, with {v} filled in from the factor's value"""
+    factors = []
+    for field, label_table in factor_labels:
+        value = values[field]
+        label = tier_label(value, label_table)
+        if label is not None:
+            factors.append(label.format(v=value))
+    return factors
+
+def score_answer_bands(score_bands: tuple, values: Dict[str, Any]) -> tuple:
+    """Sum the band scores for the given values, returning (score, factors) with None factors skipped"""
+    total_score = 0
+    factors = []
+    for field, score_table in score_bands:
+        score, factor = tier_label(values[field], score_table)
+        total_score += score
+        if factor is not None:
+            factors.append(factor)
+    return total_score, factors
+
+GENERAL_RISK_QUESTION_FOLLOW_UPS = (
+    "Focus on modifiable risk factors",
+    "Maintain protective factors",
+    "Regular health monitoring",
+)
+
+def analyze_general_risk_question(question: str, profile: HealthProfile, prediction_result: Dict[str, Any] = None) -> HealthAnswer:
     """Analyze general risk assessment questions"""
-    age = health_data.get('age', 45)
-    bmi = health_data.get('bmi', 25)
-    blood_pressure = health_data.get('blood_pressure', 120)
-    glucose = health_data.get('glucose_level', 100)
-    family_history = health_data.get('family_history', 0)
-    
-    risk_factors = []
-    protective_factors = []
-    
-    # Assess risk factors
-    if age > 45:
-        risk_factors.append("age over 45")
-    if bmi > 30:
-        risk_factors.append("obesity")
-    elif bmi > 25:
-        risk_factors.append("overweight")
-    if blood_pressure >= 140:
-        risk_factors.append("high blood pressure")
-    if glucose >= 126:
-        risk_factors.append("elevated blood glucose")
-    if family_history:
-        risk_factors.append("family history of chronic diseases")
-    
-    # Assess protective factors
-    if bmi < 25:
-        protective_factors.append("healthy weight")
-    if blood_pressure < 120:
-        protective_factors.append("normal blood pressure")
-    if glucose < 100:
-        protective_factors.append("normal blood glucose")
-    if not family_history:
-        protective_factors.append("no family history of chronic diseases")
+    # Assess risk and protective factors
+    profile_values = profile._asdict()
+    risk_factors = collect_factor_labels(GENERAL_RISK_FACTOR_LABELS, profile_values)
+    protective_factors = collect_factor_labels(GENERAL_PROTECTIVE_FACTOR_LABELS, profile_values)
     
     if len(risk_factors) > len(protective_factors):
         answer = f"Your health profile shows several risk factors: {', '.join(risk_factors[:3])}. However, you also have some protective factors: {', '.join(protective_factors[:2])}. Focus on addressing the modifiable risk factors through lifestyle changes."
@@ -3661,66 +3988,113 @@ def analyze_general_risk_question(question: str, health_data: Dict[str, Any], pr
         answer = f"Your health profile shows good protective factors: {', '.join(protective_factors[:3])}. Continue maintaining these healthy habits to preserve your good health status."
         confidence = "High"
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence=confidence,
-        related_factors=risk_factors[:3] + protective_factors[:2],
-        follow_up_suggestions=[
-            "Focus on modifiable risk factors",
-            "Maintain protective factors",
-            "Regular health monitoring"
-        ],
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice."
+        related_factors=(*risk_factors[:3], *protective_factors[:2]),
+        follow_up_suggestions=GENERAL_RISK_QUESTION_FOLLOW_UPS,
+        disclaimer=GENERAL_HEALTH_DISCLAIMER
     )
 
 
+# Dispatch table for analyze_health_question
+QUESTION_HANDLERS = {
+    "diabetes_risk": analyze_diabetes_risk_question,
+    "hypertension_risk": analyze_hypertension_risk_question,
+    "general_risk": analyze_general_risk_question,
+    "prevention": analyze_prevention_question,
+    "nutrition": analyze_nutrition_question,
+    "fitness": analyze_fitness_question,
+    "general": analyze_general_health_question,
+}
+
+# Prediction fields the analyzers read; only these take part in the answer cache key
+QUESTION_PREDICTION_FIELDS = ('diabetes_risk', 'diabetes_confidence', 'metabolic_health_score')
+
+@lru_cache(maxsize=16384)
+def answer_question_category(category: str, profile: HealthProfile, prediction_items: tuple, input_types: tuple) -> HealthAnswer:
+    """Run the analyzer for a question category (cached per input types too; the frozen answer is shared between callers)"""
+    return QUESTION_HANDLERS[category]("", profile, dict(prediction_items))
+
+def assessment_column(assessments: List[Dict[str, Any]], field: str) -> np.ndarray:
+    """Collect one numeric field across assessment documents (missing values count as 0)"""
+    return np.fromiter((assessment.get(field, 0) for assessment in assessments), dtype=np.float64, count=len(assessments))
+
+# Only the prediction fields RecentAssessment is built from are fetched (_id is always returned)
+RECENT_ASSESSMENT_PROJECTION = {
+    "created_at": 1,
+    "diabetes_risk": 1,
+    "hypertension_risk": 1,
+    "metabolic_health_score": 1,
+    "cardiovascular_health_score": 1,
+    "risk_category_diabetes": 1,
+    "risk_category_hypertension": 1,
+    "input_data": 1,
+}
+
+def fetch_recent_assessments(user_id: str, limit: int) -> List[Dict[str, Any]]:
+    """Load a user's most recent prediction documents (blocking; run in the threadpool)"""
+    predictions_collection = get_predictions_collection()
+    return list(predictions_collection.find(
+        {"user_id": user_id},
+        RECENT_ASSESSMENT_PROJECTION,
+        sort=[("created_at", -1)],
+        limit=limit
+    ))
+
 @app.get("/assessments/recent", response_model=List[RecentAssessment])
 async def get_recent_assessments(limit: int = 10, current_user: dict = Depends(get_current_active_user)):
     """Get user's recent health assessments"""
     try:
         logger.info("Fetching recent assessments")
-        predictions_collection = get_predictions_collection()
         
-        # Fetch recent assessments for the authenticated user
-        logger.info(f"Searching for assessments for user: {current_user['id']}")
+        # Fetch recent assessments for the authenticated user off the event loop (PyMongo blocks)
+        logger.debug("Searching for assessments for user: %s", current_user['id'])
         
-        recent_assessments = list(predictions_collection.find(
-            {"user_id": current_user["id"]},
-            sort=[("created_at", -1)],
-            limit=limit
-        ))
+        recent_assessments = await run_in_threadpool(fetch_recent_assessments, current_user["id"], limit)
         
-        logger.info(f"Found {len(recent_assessments)} assessments")
+        logger.debug("Found %d assessments", len(recent_assessments))
         
         if not recent_assessments:
             logger.info("No assessments found")
             return []
         
+        # Round the risk and score columns in one vectorized pass
+        diabetes_risks = np.round(assessment_column(recent_assessments, "diabetes_risk") * 100, 1)
+        hypertension_risks = np.round(assessment_column(recent_assessments, "hypertension_risk") * 100, 1)
+        metabolic_scores = assessment_column(recent_assessments, "metabolic_health_score")
+        cardiovascular_scores = assessment_column(recent_assessments, "cardiovascular_health_score")
+        
+        # Calculate overall score (average of metabolic and cardiovascular scores)
+        overall_scores = np.round((metabolic_scores + cardiovascular_scores) / 2, 1)
+        
         # Format the data for response
-        formatted_assessments = []
-        for assessment in recent_assessments:
-            logger.info(f"Processing assessment {assessment.get('_id')} with input_data: {assessment.get('input_data')}")
-            # Calculate overall score (average of metabolic and cardiovascular scores)
-            metabolic_score = assessment.get("metabolic_health_score", 0)
-            cardiovascular_score = assessment.get("cardiovascular_health_score", 0)
-            overall_score = round((metabolic_score + cardiovascular_score) / 2, 1)
-            
-            formatted_assessment = RecentAssessment(
+        formatted_assessments = [
+            RecentAssessment.model_construct(
                 id=str(assessment["_id"]),
                 date=assessment["created_at"].strftime("%Y-%m-%d"),
-                diabetes_risk=round(assessment.get("diabetes_risk", 0) * 100, 1),
-                hypertension_risk=round(assessment.get("hypertension_risk", 0) * 100, 1),
-                metabolic_health_score=round(metabolic_score, 1),
-                cardiovascular_health_score=round(cardiovascular_score, 1),
+                diabetes_risk=diabetes_risk,
+                hypertension_risk=hypertension_risk,
+                metabolic_health_score=metabolic_score,
+                cardiovascular_health_score=cardiovascular_score,
                 overall_score=overall_score,
                 risk_category_diabetes=assessment.get("risk_category_diabetes", "Unknown"),
                 risk_category_hypertension=assessment.get("risk_category_hypertension", "Unknown"),
                 input_data=assessment.get("input_data", {})
             )
-            formatted_assessments.append(formatted_assessment)
+            for assessment, diabetes_risk, hypertension_risk, metabolic_score, cardiovascular_score, overall_score in zip(
+                recent_assessments,
+                diabetes_risks.tolist(),
+                hypertension_risks.tolist(),
+                np.round(metabolic_scores, 1).tolist(),
+                np.round(cardiovascular_scores, 1).tolist(),
+                overall_scores.tolist(),
+            )
+        ]
         
-        logger.info(f"Retrieved {len(formatted_assessments)} recent assessments")
-        logger.info(f"Sample assessment input_data: {formatted_assessments[0].input_data if formatted_assessments else 'No assessments'}")
+        logger.info("Retrieved %d recent assessments", len(formatted_assessments))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample assessment input_data: %s", formatted_assessments[0].input_data)
         return formatted_assessments
         
     except Exception as e:
@@ -3728,27 +4102,88 @@ async def get_recent_assessments(limit: int = 10, current_user: dict = Depends(g
         raise HTTPException(status_code=500, detail=f"Failed to fetch recent assessments: {str(e)}")
 
 # Q&A Helper Function
+class AnswerMetrics(NamedTuple):
+    """Health metrics extracted once for the live Q&A answer generators"""
+    age: float
+    gender: str
+    bmi: float
+    blood_pressure: float
+    glucose: float
+    cholesterol: float
+    activity: float
+    smoking: int
+    family_history: int
+    alcohol: int
+    sleep_hours: float
+    stress_level: float
+
+# Live Q&A topics and their keywords, in routing priority order; matched as substrings
+ANSWER_TOPIC_KEYWORDS = {
+    "diabetes": ('diabetes', 'diabetic', 'blood sugar', 'glucose', 'sugar', 'insulin', 'prediabetes'),
+    "hypertension": ('hypertension', 'blood pressure', 'high blood pressure', 'bp', 'heart', 'cardiovascular'),
+    "nutrition": ('diet', 'food', 'eat', 'nutrition', 'meal', 'carb', 'sugar', 'dietary', 'nutrients'),
+    "fitness": ('exercise', 'workout', 'fitness', 'activity', 'gym', 'cardio', 'strength', 'training'),
+    "sleep": ('sleep', 'insomnia', 'rest', 'fatigue', 'tired', 'energy', 'sleeping'),
+    "mental_health": ('stress', 'anxiety', 'mental', 'mood', 'depression', 'wellbeing', 'mental health', 'psychological'),
+    "lifestyle": ('lifestyle', 'habits', 'routine', 'daily', 'prevention', 'wellness', 'healthy living'),
+    "medication": ('medication', 'drugs', 'treatment', 'therapy', 'supplements', 'vitamins', 'pills'),
+    "symptoms": ('symptoms', 'signs', 'warning', 'alerts', 'pain', 'discomfort', 'feeling'),
+}
+_ANSWER_TOPIC_MATCHER = compile_question_keywords(ANSWER_TOPIC_KEYWORDS)
+
+@lru_cache(maxsize=1024)
+def match_answer_topic(question_lower: str) -> Optional[str]:
+    """Return the highest-priority live Q&A topic in a lowercased question, or None (cached, the quick-question buttons repeat)"""
+    topics = match_keyword_categories(_ANSWER_TOPIC_MATCHER, question_lower)
+    return next((topic for topic in ANSWER_TOPIC_KEYWORDS if topic in topics), None)
+
+# Wording the topic generators branch on: intent -> keywords, matched as substrings like the topics
+ANSWER_INTENT_KEYWORDS = {
+    "sleep": ('sleep', 'insomnia'),
+    "fatigue": ('tired', 'fatigue'),
+    "stress": ('stress', 'anxiety'),
+    "mood": ('depression', 'mood'),
+    "habits": ('lifestyle', 'habits'),
+    "prevention": ('prevention',),
+    "medication": ('medication', 'drug'),
+    "supplement": ('supplement', 'vitamin'),
+    "symptom": ('symptom', 'sign'),
+    "warning": ('warning', 'alert'),
+}
+_ANSWER_INTENT_MATCHER = compile_question_keywords(ANSWER_INTENT_KEYWORDS)
+
+@lru_cache(maxsize=1024)
+def match_answer_intents(question_lower: str) -> frozenset:
+    """Return the ANSWER_INTENT_KEYWORDS intents present in a lowercased question (cached like the topic match)"""
+    return match_keyword_categories(_ANSWER_INTENT_MATCHER, question_lower)
+
+ANSWER_FALLBACK_FOLLOW_UPS = (
+    "Try rephrasing your question",
+    "Contact support if the issue continues",
+)
+
 def generate_personalized_health_answer(question: str, health_data: Dict[str, Any]) -> HealthAnswer:
     """Generate personalized health answers based on user's health data"""
     try:
         # Debug logging
-        logger.info(f"generate_personalized_health_answer called with question: {question[:50]}...")
-        logger.info(f"Health data received: {health_data}")
-        logger.info(f"Health data type: {type(health_data)}")
-        logger.info(f"Health data keys: {list(health_data.keys()) if health_data else 'None'}")
-        logger.info(f"Diabetes risk in health_data: {health_data.get('diabetes_risk', 'NOT FOUND')}")
-        logger.info(f"Hypertension risk in health_data: {health_data.get('hypertension_risk', 'NOT FOUND')}")
-        
-        # Additional debugging for risk scores
-        if 'diabetes_risk' in health_data:
-            diabetes_raw = health_data.get('diabetes_risk')
-            diabetes_converted = diabetes_raw * 100 if diabetes_raw <= 1.0 else diabetes_raw
-            logger.info(f"Main Q&A - Diabetes: {diabetes_raw} -> {diabetes_converted}%")
-        
-        if 'hypertension_risk' in health_data:
-            hypertension_raw = health_data.get('hypertension_risk')
-            hypertension_converted = hypertension_raw * 100 if hypertension_raw <= 1.0 else hypertension_raw
-            logger.info(f"Main Q&A - Hypertension: {hypertension_raw} -> {hypertension_converted}%")
+        logger.info("generate_personalized_health_answer called with question: %s...", question[:50])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Health data received: %s", health_data)
+            logger.debug("Health data type: %s", type(health_data))
+            logger.debug("Health data keys: %s", list(health_data.keys()) if health_data else 'None')
+            logger.debug("Diabetes risk in health_data: %s", health_data.get('diabetes_risk', 'NOT FOUND'))
+            logger.debug("Hypertension risk in health_data: %s", health_data.get('hypertension_risk', 'NOT FOUND'))
+            
+            # Additional debugging for risk scores
+            if 'diabetes_risk' in health_data:
+                diabetes_raw = health_data.get('diabetes_risk')
+                diabetes_converted = risk_to_percent(diabetes_raw)
+                logger.debug("Main Q&A - Diabetes: %s -> %s%%", diabetes_raw, diabetes_converted)
+            
+            if 'hypertension_risk' in health_data:
+                hypertension_raw = health_data.get('hypertension_risk')
+                hypertension_converted = risk_to_percent(hypertension_raw)
+                logger.debug("Main Q&A - Hypertension: %s -> %s%%", hypertension_raw, hypertension_converted)
         
         # Extract key health metrics with safe defaults and type conversion
         try:
@@ -3764,12 +4199,15 @@ def generate_personalized_health_answer(question: str, health_data: Dict[str, An
             alcohol = int(health_data.get('alcohol_intake', 0))
             sleep_hours = float(health_data.get('sleep_hours', 7))
             stress_level = float(health_data.get('stress_level', 5))
+            # NaN and infinity would land in the top band of the factor label tables
+            if not all(map(math.isfinite, (age, bmi, blood_pressure, glucose, cholesterol, activity, sleep_hours, stress_level))):
+                raise ValueError("non-finite health value")
             
             # Log extracted values
-            logger.info(f"Extracted values - age: {age}, gender: {gender}, bmi: {bmi}, bp: {blood_pressure}, glucose: {glucose}")
+            logger.debug("Extracted values - age: %s, gender: %s, bmi: %s, bp: %s, glucose: %s", age, gender, bmi, blood_pressure, glucose)
         except (ValueError, TypeError) as e:
-            logger.error(f"Error converting health data values: {e}")
-            logger.error(f"Health data values: {health_data}")
+            logger.error("Error converting health data values: %s", e)
+            logger.error("Health data values: %s", health_data)
             # Use safe defaults
             age = 45
             gender = "Male"
@@ -3787,433 +4225,428 @@ def generate_personalized_health_answer(question: str, health_data: Dict[str, An
         # Analyze question type and generate personalized response
         question_lower = question.lower()
         
-        # Diabetes-related questions
-        if any(word in question_lower for word in ['diabetes', 'diabetic', 'blood sugar', 'glucose', 'sugar', 'insulin', 'prediabetes']):
-            return generate_diabetes_answer(question, health_data, age, gender, bmi, glucose, activity, smoking, family_history)
-        
-        # Hypertension-related questions
-        elif any(word in question_lower for word in ['hypertension', 'blood pressure', 'high blood pressure', 'bp', 'heart', 'cardiovascular']):
-            return generate_hypertension_answer(question, health_data, age, gender, bmi, blood_pressure, cholesterol, activity, smoking)
-        
-        # Nutrition-related questions
-        elif any(word in question_lower for word in ['diet', 'food', 'eat', 'nutrition', 'meal', 'carb', 'sugar', 'dietary', 'nutrients']):
-            return generate_nutrition_answer(question, health_data, bmi, glucose, cholesterol, activity)
-        
-        # Exercise-related questions
-        elif any(word in question_lower for word in ['exercise', 'workout', 'fitness', 'activity', 'gym', 'cardio', 'strength', 'training']):
-            return generate_fitness_answer(question, health_data, age, bmi, activity, blood_pressure)
-        
-        # Sleep-related questions
-        elif any(word in question_lower for word in ['sleep', 'insomnia', 'rest', 'fatigue', 'tired', 'energy', 'sleeping']):
-            return generate_sleep_answer(question, health_data, age, sleep_hours, stress_level, activity)
-        
-        # Mental health questions
-        elif any(word in question_lower for word in ['stress', 'anxiety', 'mental', 'mood', 'depression', 'wellbeing', 'mental health', 'psychological']):
-            return generate_mental_health_answer(question, health_data, age, stress_level, sleep_hours, activity)
-        
-        # Lifestyle questions
-        elif any(word in question_lower for word in ['lifestyle', 'habits', 'routine', 'daily', 'prevention', 'wellness', 'healthy living']):
-            return generate_lifestyle_answer(question, health_data, age, gender, bmi, activity, smoking, alcohol, sleep_hours)
-        
-        # Medication questions
-        elif any(word in question_lower for word in ['medication', 'drugs', 'treatment', 'therapy', 'supplements', 'vitamins', 'pills']):
-            return generate_medication_answer(question, health_data, age, gender, bmi, blood_pressure, glucose, cholesterol)
+        # Topics are tried in ANSWER_TOPIC_KEYWORDS order; one regex scan finds them all
+        topic = match_answer_topic(question_lower)
+        intents = match_answer_intents(question_lower)
         
-        # Symptoms questions
-        elif any(word in question_lower for word in ['symptoms', 'signs', 'warning', 'alerts', 'pain', 'discomfort', 'feeling']):
-            return generate_symptoms_answer(question, health_data, age, gender, bmi, blood_pressure, glucose, cholesterol)
+        metrics = AnswerMetrics(
+            age=age, gender=gender, bmi=bmi, blood_pressure=blood_pressure, glucose=glucose,
+            cholesterol=cholesterol, activity=activity, smoking=smoking, family_history=family_history,
+            alcohol=alcohol, sleep_hours=sleep_hours, stress_level=stress_level,
+        )
         
-        # General health questions
-        else:
-            return generate_general_health_answer(question, health_data, age, gender, bmi, blood_pressure, glucose, activity)
+        # Serve repeat (topic, intents, profile) combinations from the answer cache
+        health_items = tuple((field, health_data[field]) for field in ANSWER_HEALTH_FIELDS if field in health_data)
+        input_types = value_types(metrics) + value_types(value for _, value in health_items)
+        return answer_health_topic(topic, intents, metrics, health_items, input_types)
             
     except Exception as e:
-        logger.error(f"Error generating health answer: {e}")
-        return HealthAnswer(
+        logger.error("Error generating health answer: %s", e)
+        return HealthAnswer.model_construct(
             answer="I apologize, but I'm having trouble processing your question right now. Please try again.",
             confidence="Low",
-            related_factors=[],
-            follow_up_suggestions=["Try rephrasing your question", "Contact support if the issue continues"],
+            related_factors=(),
+            follow_up_suggestions=ANSWER_FALLBACK_FOLLOW_UPS,
             disclaimer="This is a fallback response due to a technical issue."
         )
 
-def generate_diabetes_answer(question: str, health_data: Dict, age: int, gender: str, bmi: float, glucose: float, activity: float, smoking: int, family_history: int) -> HealthAnswer:
-    """Generate personalized diabetes-related answers"""
-    
-    # Analyze risk factors
-    risk_factors = []
-    if bmi > 30:
-        risk_factors.append(f"obesity (BMI: {bmi:.1f})")
-    elif bmi > 25:
-        risk_factors.append(f"overweight (BMI: {bmi:.1f})")
-    
-    if glucose > 126:
-        risk_factors.append(f"elevated blood glucose ({glucose} mg/dL)")
-    elif glucose > 100:
-        risk_factors.append(f"pre-diabetic glucose levels ({glucose} mg/dL)")
-    
-    if activity < 3:
-        risk_factors.append("low physical activity")
-    
-    if smoking > 0:
-        risk_factors.append("smoking history")
-    
-    if family_history:
-        risk_factors.append("family history of diabetes")
-    
-    if age > 45:
-        risk_factors.append("age over 45")
-    
-    # Get actual diabetes risk from assessment results
-    diabetes_risk_raw = health_data.get('diabetes_risk', 0)
-    
-    # Convert decimal to percentage if needed (0.852 -> 85.2)
-    if diabetes_risk_raw <= 1.0:
-        diabetes_risk = diabetes_risk_raw * 100
-    else:
-        diabetes_risk = diabetes_risk_raw
-    
-    # Debug logging
-    logger.info(f"Diabetes Q&A - Raw risk score: {diabetes_risk_raw}")
-    logger.info(f"Diabetes Q&A - Converted risk score: {diabetes_risk}")
-    logger.info(f"Diabetes Q&A - Health data keys: {list(health_data.keys()) if health_data else 'None'}")
-    
-    # Generate personalized response based on actual risk score
-    if diabetes_risk >= 70:
-        confidence = "High"
-        answer = f"""**Your Diabetes Risk Assessment: VERY HIGH RISK**
-
-🚨 CRITICAL: Your actual diabetes risk is {diabetes_risk:.1f}% - This is VERY HIGH and requires immediate attention.
+# Stored risk percentages at or above these raise the live answer tier
+ANSWER_RISK_TIERS = (25, 50, 70)
+ANSWER_RISK_CONFIDENCE = ("High", "Medium", "High", "High")
+ANSWER_RISK_LEVELS = ("LOW", "MODERATE", "HIGH", "VERY HIGH")
+
+def answer_risk_tier(risk_percent: float) -> int:
+    """Return the ANSWER_RISK_TIERS tier of a risk percentage; a NaN risk is the lowest tier, as the >= checks had it"""
+    return bisect_right(ANSWER_RISK_TIERS, risk_percent) if not math.isnan(risk_percent) else 0
+
+# Live answer risk factors, in display order: (AnswerMetrics field, label table); {v} is the value
+DIABETES_ANSWER_FACTOR_LABELS = (
+    ('bmi', ((25, 30), False, (None, "overweight (BMI: {v:.1f})", "obesity (BMI: {v:.1f})"))),
+    ('glucose', ((100, 126), False, (None, "pre-diabetic glucose levels ({v} mg/dL)", "elevated blood glucose ({v} mg/dL)"))),
+    ('activity', ((3,), True, ("low physical activity", None))),
+    ('smoking', ((0,), False, (None, "smoking history"))),
+    ('family_history', ((0,), False, (None, "family history of diabetes"))),
+    ('age', ((45,), False, (None, "age over 45"))),
+)
 
-**Your Specific Risk Factors:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
-• Age: {age} years ({'High risk age' if age > 65 else 'Moderate risk age' if age > 45 else 'Lower risk age'})
+DIABETES_ANSWER_FOLLOW_UPS = (
+    "Schedule regular health checkups",
+    "Monitor your health metrics",
+    "Maintain healthy lifestyle habits",
+)
 
-**IMMEDIATE ACTIONS REQUIRED:**
-• Schedule a comprehensive diabetes screening (HbA1c, fasting glucose) IMMEDIATELY
-• Consult with an endocrinologist or diabetes specialist within 1-2 weeks
-• Consider diabetes medication as recommended by your doctor
-• Monitor blood glucose levels daily
-• Implement strict dietary changes immediately"""
-    elif diabetes_risk >= 50:
-        confidence = "High"
-        answer = f"""**Your Diabetes Risk Assessment: HIGH RISK**
+# Live diabetes answers by ANSWER_RISK_TIERS tier: (low, moderate, high, very high)
+DIABETES_ANSWER_TEMPLATES = tuple(map(compile_answer_template, (
+    ("""**Your Diabetes Risk Assessment: LOW RISK**
 
-⚠️ Your actual diabetes risk is {diabetes_risk:.1f}% - This is HIGH and needs urgent attention.
+✅ Good news! Your actual diabetes risk is {diabetes_risk:.1f}% - This is LOW.
 
-**Your Specific Risk Factors:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
-• Age: {age} years ({'High risk age' if age > 65 else 'Moderate risk age' if age > 45 else 'Lower risk age'})
+**Your Healthy Profile:**
+• BMI: {bmi:.1f} - Excellent
+• Blood Glucose: {glucose} mg/dL - Normal
+• Physical Activity: {activity}/10 - Good
+• Age: {age} years - Lower risk
 
-**URGENT ACTIONS NEEDED:**
-• Schedule a comprehensive diabetes screening (HbA1c, fasting glucose) within 2 weeks
-• Consult with an endocrinologist or diabetes specialist
-• Focus on weight management if BMI > 25
-• Increase physical activity to at least 150 minutes/week
-• Monitor blood glucose levels regularly"""
-        
-    elif diabetes_risk >= 25:
-        confidence = "Medium"
-        answer = f"""**Your Diabetes Risk Assessment: MODERATE RISK**
+**Maintain Your Healthy Habits:**
+• Continue regular physical activity ({activity}/10 is great!)
+• Maintain healthy weight (BMI {bmi:.1f} is good)
+• Keep blood glucose in normal range ({glucose} mg/dL is excellent)
+• Regular health checkups every 1-2 years""", ()),
+    ("""**Your Diabetes Risk Assessment: MODERATE RISK**
 
 Your actual diabetes risk is {diabetes_risk:.1f}% - This is MODERATE and needs attention.
 
 **Your Specific Profile:**
-• BMI: {bmi:.1f} - {'Needs improvement' if bmi > 25 else 'Good'}
-• Blood Glucose: {glucose} mg/dL - {'Monitor closely' if glucose > 100 else 'Normal'}
-• Physical Activity: {activity}/10 - {'Needs improvement' if activity < 6 else 'Good'}
-• Age: {age} years - {'Monitor closely' if age > 45 else 'Lower risk'}
+• BMI: {bmi:.1f} - {bmi_label}
+• Blood Glucose: {glucose} mg/dL - {glucose_label}
+• Physical Activity: {activity}/10 - {activity_label}
+• Age: {age} years - {age_label}
 
 **Recommended Actions:**
 • Get an HbA1c test within 3 months
 • Focus on weight management if BMI > 25
 • Increase physical activity to at least 150 minutes/week
-• Improve diet quality (reduce refined carbs, increase fiber)"""
-        
-    else:
-        confidence = "High"
-        answer = f"""**Your Diabetes Risk Assessment: LOW RISK**
+• Improve diet quality (reduce refined carbs, increase fiber)""", (
+        ('bmi_label', 'bmi', BMI_REVIEW_LABELS),
+        ('glucose_label', 'glucose', GLUCOSE_REVIEW_LABELS),
+        ('activity_label', 'activity', ACTIVITY_REVIEW_LABELS),
+        ('age_label', 'age', AGE_REVIEW_LABELS),
+    )),
+    ("""**Your Diabetes Risk Assessment: HIGH RISK**
 
-✅ Good news! Your actual diabetes risk is {diabetes_risk:.1f}% - This is LOW.
+⚠️ Your actual diabetes risk is {diabetes_risk:.1f}% - This is HIGH and needs urgent attention.
 
-**Your Healthy Profile:**
-• BMI: {bmi:.1f} - Excellent
-• Blood Glucose: {glucose} mg/dL - Normal
-• Physical Activity: {activity}/10 - Good
-• Age: {age} years - Lower risk
+**Your Specific Risk Factors:**
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Physical Activity: {activity}/10 ({activity_label})
+• Age: {age} years ({age_label})
 
-**Maintain Your Healthy Habits:**
-• Continue regular physical activity ({activity}/10 is great!)
-• Maintain healthy weight (BMI {bmi:.1f} is good)
-• Keep blood glucose in normal range ({glucose} mg/dL is excellent)
-• Regular health checkups every 1-2 years"""
-    
-    return HealthAnswer(
-        answer=answer,
-        confidence=confidence,
-        related_factors=risk_factors[:3] if risk_factors else ["healthy lifestyle"],
-        follow_up_suggestions=[
-            "Schedule regular health checkups",
-            "Monitor your health metrics",
-            "Maintain healthy lifestyle habits"
-        ],
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice."
-    )
+**URGENT ACTIONS NEEDED:**
+• Schedule a comprehensive diabetes screening (HbA1c, fasting glucose) within 2 weeks
+• Consult with an endocrinologist or diabetes specialist
+• Focus on weight management if BMI > 25
+• Increase physical activity to at least 150 minutes/week
+• Monitor blood glucose levels regularly""", (
+        ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+        ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+        ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+        ('age_label', 'age', AGE_RISK_LABELS),
+    )),
+    ("""**Your Diabetes Risk Assessment: VERY HIGH RISK**
 
-def generate_hypertension_answer(question: str, health_data: Dict, age: int, gender: str, bmi: float, blood_pressure: float, cholesterol: float, activity: float, smoking: int) -> HealthAnswer:
-    """Generate personalized hypertension-related answers"""
-    
-    # Get actual hypertension risk from assessment results
-    hypertension_risk_raw = health_data.get('hypertension_risk', 0)
-    
-    # Convert decimal to percentage if needed (0.887 -> 88.7)
-    if hypertension_risk_raw <= 1.0:
-        hypertension_risk = hypertension_risk_raw * 100
-    else:
-        hypertension_risk = hypertension_risk_raw
-    
-    # Debug logging
-    logger.info(f"Hypertension Q&A - Raw risk score: {hypertension_risk_raw}")
-    logger.info(f"Hypertension Q&A - Converted risk score: {hypertension_risk}")
-    logger.info(f"Hypertension Q&A - Health data keys: {list(health_data.keys()) if health_data else 'None'}")
+🚨 CRITICAL: Your actual diabetes risk is {diabetes_risk:.1f}% - This is VERY HIGH and requires immediate attention.
+
+**Your Specific Risk Factors:**
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Physical Activity: {activity}/10 ({activity_label})
+• Age: {age} years ({age_label})
+
+**IMMEDIATE ACTIONS REQUIRED:**
+• Schedule a comprehensive diabetes screening (HbA1c, fasting glucose) IMMEDIATELY
+• Consult with an endocrinologist or diabetes specialist within 1-2 weeks
+• Consider diabetes medication as recommended by your doctor
+• Monitor blood glucose levels daily
+• Implement strict dietary changes immediately""", (
+        ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+        ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+        ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+        ('age_label', 'age', AGE_RISK_LABELS),
+    )),
+)))
+
+def generate_diabetes_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
+    """Generate personalized diabetes-related answers"""
+    age = metrics.age
+    bmi = metrics.bmi
+    glucose = metrics.glucose
+    activity = metrics.activity
     
     # Analyze risk factors
-    risk_factors = []
-    if blood_pressure >= 140:
-        risk_factors.append(f"high blood pressure ({blood_pressure} mmHg)")
-    elif blood_pressure >= 130:
-        risk_factors.append(f"elevated blood pressure ({blood_pressure} mmHg)")
-    
-    if bmi > 30:
-        risk_factors.append(f"obesity (BMI: {bmi:.1f})")
-    elif bmi > 25:
-        risk_factors.append(f"overweight (BMI: {bmi:.1f})")
-    
-    if cholesterol > 240:
-        risk_factors.append(f"high cholesterol ({cholesterol} mg/dL)")
-    
-    if activity < 3:
-        risk_factors.append("low physical activity")
-    
-    if smoking > 0:
-        risk_factors.append("smoking history")
+    risk_factors = collect_factor_labels(DIABETES_ANSWER_FACTOR_LABELS, metrics._asdict())
     
-    if age > 65:
-        risk_factors.append("age over 65")
+    # Get actual diabetes risk from assessment results
+    diabetes_risk = risk_to_percent(health_data.get('diabetes_risk', 0))
     
     # Generate personalized response based on actual risk score
-    if hypertension_risk >= 70:
-        confidence = "High"
-        answer = f"""**Your Hypertension Risk Assessment: VERY HIGH RISK**
+    tier = answer_risk_tier(diabetes_risk)
+    confidence = ANSWER_RISK_CONFIDENCE[tier]
+    answer = render_answer_template(DIABETES_ANSWER_TEMPLATES[tier], {
+        'diabetes_risk': diabetes_risk, 'bmi': bmi, 'glucose': glucose, 'activity': activity, 'age': age,
+    })
+    
+    return HealthAnswer.model_construct(
+        answer=answer,
+        confidence=confidence,
+        related_factors=tuple(risk_factors[:3]) if risk_factors else ("healthy lifestyle",),
+        follow_up_suggestions=DIABETES_ANSWER_FOLLOW_UPS,
+        disclaimer=GENERAL_HEALTH_DISCLAIMER
+    )
 
-🚨 CRITICAL: Your actual hypertension risk is {hypertension_risk:.1f}% - This is VERY HIGH and requires immediate attention.
+HYPERTENSION_ANSWER_FACTOR_LABELS = (
+    ('blood_pressure', ((130, 140), True, (None, "elevated blood pressure ({v} mmHg)", "high blood pressure ({v} mmHg)"))),
+    ('bmi', ((25, 30), False, (None, "overweight (BMI: {v:.1f})", "obesity (BMI: {v:.1f})"))),
+    ('cholesterol', ((240,), False, (None, "high cholesterol ({v} mg/dL)"))),
+    ('activity', ((3,), True, ("low physical activity", None))),
+    ('smoking', ((0,), False, (None, "smoking history"))),
+    ('age', ((65,), False, (None, "age over 65"))),
+)
 
-**Your Specific Risk Factors:**
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 140 else 'Elevated' if blood_pressure >= 130 else 'Normal'})
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Cholesterol: {cholesterol} mg/dL ({'High' if cholesterol > 240 else 'Borderline' if cholesterol > 200 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
+HYPERTENSION_ANSWER_FOLLOW_UPS = (
+    "Monitor blood pressure regularly",
+    "Maintain heart-healthy lifestyle",
+    "Schedule regular health checkups",
+)
 
-**IMMEDIATE ACTIONS REQUIRED:**
-• Consult with a cardiologist or hypertension specialist IMMEDIATELY
-• Consider blood pressure medication as recommended by your doctor
-• Monitor blood pressure multiple times daily
-• Implement strict DASH diet immediately
-• Reduce sodium intake to < 1,500mg/day"""
-    elif hypertension_risk >= 50:
-        confidence = "High"
-        answer = f"""**Your Hypertension Risk Assessment: HIGH RISK**
+# Live hypertension answers by ANSWER_RISK_TIERS tier: (low, moderate, high, very high)
+HYPERTENSION_ANSWER_TEMPLATES = tuple(map(compile_answer_template, (
+    ("""**Your Hypertension Risk Assessment: LOW RISK**
 
-⚠️ Your actual hypertension risk is {hypertension_risk:.1f}% - This is HIGH and needs urgent attention.
+✅ Good news! Your actual hypertension risk is {hypertension_risk:.1f}% - This is LOW.
 
-**Your Specific Risk Factors:**
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 140 else 'Elevated' if blood_pressure >= 130 else 'Normal'})
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Cholesterol: {cholesterol} mg/dL ({'High' if cholesterol > 240 else 'Borderline' if cholesterol > 200 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
+**Your Healthy Profile:**
+• Blood Pressure: {blood_pressure} mmHg - Normal
+• BMI: {bmi:.1f} - Excellent
+• Cholesterol: {cholesterol} mg/dL - Normal
+• Physical Activity: {activity}/10 - Good
 
-**URGENT ACTIONS NEEDED:**
-• Consult with a cardiologist or hypertension specialist within 1-2 weeks
-• Consider medication if lifestyle changes aren't sufficient
-• Monitor blood pressure daily
-• Focus on heart-healthy diet (DASH diet recommended)"""
-        
-    elif hypertension_risk >= 25:
-        confidence = "Medium"
-        answer = f"""**Your Hypertension Risk Assessment: MODERATE RISK**
+**Maintain Your Healthy Habits:**
+• Continue regular physical activity ({activity}/10 is great!)
+• Maintain healthy weight (BMI {bmi:.1f} is good)
+• Keep blood pressure in normal range ({blood_pressure} mmHg is excellent)
+• Regular health checkups every 1-2 years""", ()),
+    ("""**Your Hypertension Risk Assessment: MODERATE RISK**
 
 Your actual hypertension risk is {hypertension_risk:.1f}% - This is MODERATE and needs attention.
 
 **Your Specific Profile:**
-• Blood Pressure: {blood_pressure} mmHg - {'Monitor closely' if blood_pressure >= 130 else 'Normal'}
-• BMI: {bmi:.1f} - {'Needs improvement' if bmi > 25 else 'Good'}
-• Cholesterol: {cholesterol} mg/dL - {'Monitor closely' if cholesterol > 200 else 'Normal'}
-• Physical Activity: {activity}/10 - {'Needs improvement' if activity < 6 else 'Good'}
+• Blood Pressure: {blood_pressure} mmHg - {blood_pressure_label}
+• BMI: {bmi:.1f} - {bmi_label}
+• Cholesterol: {cholesterol} mg/dL - {cholesterol_label}
+• Physical Activity: {activity}/10 - {activity_label}
 
 **Recommended Actions:**
 • Get regular blood pressure monitoring
 • Focus on weight management if BMI > 25
 • Increase physical activity to at least 150 minutes/week
-• Adopt heart-healthy diet (reduce sodium, increase fruits/vegetables)"""
-        
-    else:
-        confidence = "High"
-        answer = f"""**Your Hypertension Risk Assessment: LOW RISK**
+• Adopt heart-healthy diet (reduce sodium, increase fruits/vegetables)""", (
+        ('blood_pressure_label', 'blood_pressure', BP_REVIEW_LABELS),
+        ('bmi_label', 'bmi', BMI_REVIEW_LABELS),
+        ('cholesterol_label', 'cholesterol', CHOLESTEROL_REVIEW_LABELS),
+        ('activity_label', 'activity', ACTIVITY_REVIEW_LABELS),
+    )),
+    ("""**Your Hypertension Risk Assessment: HIGH RISK**
 
-✅ Good news! Your actual hypertension risk is {hypertension_risk:.1f}% - This is LOW.
+⚠️ Your actual hypertension risk is {hypertension_risk:.1f}% - This is HIGH and needs urgent attention.
 
-**Your Healthy Profile:**
-• Blood Pressure: {blood_pressure} mmHg - Normal
-• BMI: {bmi:.1f} - Excellent
-• Cholesterol: {cholesterol} mg/dL - Normal
-• Physical Activity: {activity}/10 - Good
+**Your Specific Risk Factors:**
+• Blood Pressure: {blood_pressure} mmHg ({blood_pressure_label})
+• BMI: {bmi:.1f} ({bmi_label})
+• Cholesterol: {cholesterol} mg/dL ({cholesterol_label})
+• Physical Activity: {activity}/10 ({activity_label})
+
+**URGENT ACTIONS NEEDED:**
+• Consult with a cardiologist or hypertension specialist within 1-2 weeks
+• Consider medication if lifestyle changes aren't sufficient
+• Monitor blood pressure daily
+• Focus on heart-healthy diet (DASH diet recommended)""", (
+        ('blood_pressure_label', 'blood_pressure', BP_CATEGORY_LABELS),
+        ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+        ('cholesterol_label', 'cholesterol', CHOLESTEROL_CATEGORY_LABELS),
+        ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    )),
+    ("""**Your Hypertension Risk Assessment: VERY HIGH RISK**
+
+🚨 CRITICAL: Your actual hypertension risk is {hypertension_risk:.1f}% - This is VERY HIGH and requires immediate attention.
+
+**Your Specific Risk Factors:**
+• Blood Pressure: {blood_pressure} mmHg ({blood_pressure_label})
+• BMI: {bmi:.1f} ({bmi_label})
+• Cholesterol: {cholesterol} mg/dL ({cholesterol_label})
+• Physical Activity: {activity}/10 ({activity_label})
 
-**Maintain Your Healthy Habits:**
-• Continue regular physical activity ({activity}/10 is great!)
-• Maintain healthy weight (BMI {bmi:.1f} is good)
-• Keep blood pressure in normal range ({blood_pressure} mmHg is excellent)
-• Regular health checkups every 1-2 years"""
+**IMMEDIATE ACTIONS REQUIRED:**
+• Consult with a cardiologist or hypertension specialist IMMEDIATELY
+• Consider blood pressure medication as recommended by your doctor
+• Monitor blood pressure multiple times daily
+• Implement strict DASH diet immediately
+• Reduce sodium intake to < 1,500mg/day""", (
+        ('blood_pressure_label', 'blood_pressure', BP_CATEGORY_LABELS),
+        ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+        ('cholesterol_label', 'cholesterol', CHOLESTEROL_CATEGORY_LABELS),
+        ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    )),
+)))
+
+def generate_hypertension_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
+    """Generate personalized hypertension-related answers"""
+    bmi = metrics.bmi
+    blood_pressure = metrics.blood_pressure
+    cholesterol = metrics.cholesterol
+    activity = metrics.activity
+    
+    # Get actual hypertension risk from assessment results
+    hypertension_risk = risk_to_percent(health_data.get('hypertension_risk', 0))
+    
+    # Analyze risk factors
+    risk_factors = collect_factor_labels(HYPERTENSION_ANSWER_FACTOR_LABELS, metrics._asdict())
     
-    return HealthAnswer(
+    # Generate personalized response based on actual risk score
+    tier = answer_risk_tier(hypertension_risk)
+    confidence = ANSWER_RISK_CONFIDENCE[tier]
+    answer = render_answer_template(HYPERTENSION_ANSWER_TEMPLATES[tier], {
+        'hypertension_risk': hypertension_risk, 'blood_pressure': blood_pressure, 'bmi': bmi,
+        'cholesterol': cholesterol, 'activity': activity,
+    })
+    
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence=confidence,
-        related_factors=risk_factors[:3] if risk_factors else ["healthy lifestyle"],
-        follow_up_suggestions=[
-            "Monitor blood pressure regularly",
-            "Maintain heart-healthy lifestyle",
-            "Schedule regular health checkups"
-        ],
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice."
+        related_factors=tuple(risk_factors[:3]) if risk_factors else ("healthy lifestyle",),
+        follow_up_suggestions=HYPERTENSION_ANSWER_FOLLOW_UPS,
+        disclaimer=GENERAL_HEALTH_DISCLAIMER
     )
 
-def generate_nutrition_answer(question: str, health_data: Dict, bmi: float, glucose: float, cholesterol: float, activity: float) -> HealthAnswer:
-    """Generate personalized nutrition-related answers"""
-    
-    # Analyze nutritional needs
-    if bmi > 30:
-        focus = "weight management and blood sugar control"
-        recommendations = [
-            "Focus on portion control and calorie reduction",
-            "Increase fiber intake (25-30g daily)",
-            "Limit refined carbohydrates and added sugars",
-            "Include lean proteins and healthy fats"
-        ]
-    elif bmi > 25:
-        focus = "weight management and metabolic health"
-        recommendations = [
-            "Moderate calorie reduction for weight loss",
-            "Increase vegetable and fruit intake",
-            "Choose whole grains over refined grains",
-            "Include regular protein with meals"
-        ]
-    else:
-        focus = "maintaining healthy weight and preventing disease"
-        recommendations = [
-            "Maintain balanced macronutrient intake",
-            "Continue current healthy eating patterns",
-            "Focus on nutrient-dense foods",
-            "Stay hydrated with water"
-        ]
-    
-    # Add specific recommendations based on health metrics
-    if glucose > 100:
-        recommendations.append("Monitor carbohydrate intake and blood sugar response")
-    if cholesterol > 200:
-        recommendations.append("Limit saturated fats and increase omega-3 fatty acids")
-    if activity < 5:
-        recommendations.append("Consider meal timing around physical activity")
-    
-    answer = f"""**Personalized Nutrition Recommendations**
+# Live nutrition plans by BMI tier (BMI_CATEGORY_LABELS): (focus, base recommendations)
+NUTRITION_ANSWER_PLANS = (
+    ("maintaining healthy weight and preventing disease", (
+        "Maintain balanced macronutrient intake",
+        "Continue current healthy eating patterns",
+        "Focus on nutrient-dense foods",
+        "Stay hydrated with water",
+    )),
+    ("weight management and metabolic health", (
+        "Moderate calorie reduction for weight loss",
+        "Increase vegetable and fruit intake",
+        "Choose whole grains over refined grains",
+        "Include regular protein with meals",
+    )),
+    ("weight management and blood sugar control", (
+        "Focus on portion control and calorie reduction",
+        "Increase fiber intake (25-30g daily)",
+        "Limit refined carbohydrates and added sugars",
+        "Include lean proteins and healthy fats",
+    )),
+)
+
+# Live nutrition recommendations added by metric: (AnswerMetrics field, label table)
+NUTRITION_ANSWER_EXTRA_RECOMMENDATIONS = (
+    ('glucose', ((100,), False, (None, "Monitor carbohydrate intake and blood sugar response"))),
+    ('cholesterol', ((200,), False, (None, "Limit saturated fats and increase omega-3 fatty acids"))),
+    ('activity', ((5,), True, ("Consider meal timing around physical activity", None))),
+)
+
+NUTRITION_ANSWER_FOLLOW_UPS = (
+    "Consider consulting a registered dietitian",
+    "Track your food intake and symptoms",
+    "Monitor your health metrics regularly",
+)
+
+# Live nutrition answer; focus and bullets come from NUTRITION_ANSWER_PLANS
+NUTRITION_ANSWER_TEMPLATE = compile_answer_template(("""**Personalized Nutrition Recommendations**
 
 Based on your health profile, here are tailored nutrition recommendations:
 
 **Your Current Status:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Cholesterol: {cholesterol} mg/dL ({'High' if cholesterol > 240 else 'Borderline' if cholesterol > 200 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Cholesterol: {cholesterol} mg/dL ({cholesterol_label})
+• Physical Activity: {activity}/10 ({activity_label})
 
-**Focus Area: {focus.title()}**
+**Focus Area: {focus}**
 
 **Personalized Recommendations:**
-{chr(10).join([f"• {rec}" for rec in recommendations])}
+{recommendations_bullets}
 
 **Sample Meal Plan:**
 • Breakfast: Whole grain cereal with berries and nuts
 • Lunch: Grilled chicken salad with mixed vegetables
 • Dinner: Baked fish with quinoa and steamed broccoli
-• Snacks: Greek yogurt with fruit, or raw vegetables with hummus"""
+• Snacks: Greek yogurt with fruit, or raw vegetables with hummus""", (
+    ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+    ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+    ('cholesterol_label', 'cholesterol', CHOLESTEROL_CATEGORY_LABELS),
+    ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+)))
+
+def generate_nutrition_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
+    """Generate personalized nutrition-related answers"""
+    bmi = metrics.bmi
+    glucose = metrics.glucose
+    cholesterol = metrics.cholesterol
+    activity = metrics.activity
+    
+    # Analyze nutritional needs
+    focus, base_recommendations = NUTRITION_ANSWER_PLANS[tier_index(bmi, BMI_CATEGORY_LABELS)]
+    
+    # Add specific recommendations based on health metrics
+    recommendations = [*base_recommendations, *collect_factor_labels(NUTRITION_ANSWER_EXTRA_RECOMMENDATIONS, metrics._asdict())]
     
-    return HealthAnswer(
+    answer = render_answer_template(NUTRITION_ANSWER_TEMPLATE, {
+        'bmi': bmi, 'glucose': glucose, 'cholesterol': cholesterol, 'activity': activity,
+        'focus': focus.title(), 'recommendations_bullets': format_bullets(recommendations),
+    })
+    
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=["nutrition", "diet", "weight management"],
-        follow_up_suggestions=[
-            "Consider consulting a registered dietitian",
-            "Track your food intake and symptoms",
-            "Monitor your health metrics regularly"
-        ],
+        related_factors=("nutrition", "diet", "weight management"),
+        follow_up_suggestions=NUTRITION_ANSWER_FOLLOW_UPS,
         disclaimer="This nutrition advice is for informational purposes only and should not replace professional medical or nutritional guidance."
     )
 
-def generate_fitness_answer(question: str, health_data: Dict, age: int, bmi: float, activity: float, blood_pressure: float) -> HealthAnswer:
-    """Generate personalized fitness-related answers"""
-    
-    # Analyze fitness needs
-    if activity < 3:
-        intensity = "low to moderate"
-        focus = "building a consistent exercise routine"
-        recommendations = [
-            "Start with 10-15 minutes of daily walking",
-            "Gradually increase to 30 minutes, 5 days per week",
-            "Include strength training 2-3 times per week",
-            "Focus on consistency over intensity"
-        ]
-    elif activity < 6:
-        intensity = "moderate to vigorous"
-        focus = "increasing exercise intensity and variety"
-        recommendations = [
-            "Aim for 150 minutes of moderate-intensity exercise weekly",
-            "Include both cardio and strength training",
-            "Add flexibility and balance exercises",
-            "Consider interval training for efficiency"
-        ]
-    else:
-        intensity = "moderate to high"
-        focus = "maintaining and optimizing your fitness routine"
-        recommendations = [
-            "Continue your current exercise routine",
-            "Add variety to prevent plateaus",
-            "Focus on recovery and injury prevention",
-            "Consider advanced training techniques"
-        ]
-    
-    # Add age-specific recommendations
-    if age > 65:
-        recommendations.append("Include balance and flexibility exercises for fall prevention")
-    if blood_pressure >= 130:
-        recommendations.append("Monitor blood pressure during exercise and consult your doctor")
-    
-    answer = f"""**Personalized Fitness Recommendations**
+# Live fitness plans by activity tier (ACTIVITY_CATEGORY_LABELS): (intensity, focus, base recommendations)
+FITNESS_ANSWER_PLANS = (
+    ("low to moderate", "building a consistent exercise routine", (
+        "Start with 10-15 minutes of daily walking",
+        "Gradually increase to 30 minutes, 5 days per week",
+        "Include strength training 2-3 times per week",
+        "Focus on consistency over intensity",
+    )),
+    ("moderate to vigorous", "increasing exercise intensity and variety", (
+        "Aim for 150 minutes of moderate-intensity exercise weekly",
+        "Include both cardio and strength training",
+        "Add flexibility and balance exercises",
+        "Consider interval training for efficiency",
+    )),
+    ("moderate to high", "maintaining and optimizing your fitness routine", (
+        "Continue your current exercise routine",
+        "Add variety to prevent plateaus",
+        "Focus on recovery and injury prevention",
+        "Consider advanced training techniques",
+    )),
+)
+
+# Live fitness recommendations added by metric: (AnswerMetrics field, label table)
+FITNESS_ANSWER_EXTRA_RECOMMENDATIONS = (
+    ('age', ((65,), False, (None, "Include balance and flexibility exercises for fall prevention"))),
+    ('blood_pressure', ((130,), True, (None, "Monitor blood pressure during exercise and consult your doctor"))),
+)
+
+FITNESS_ANSWER_FOLLOW_UPS = (
+    "Start slowly and gradually increase intensity",
+    "Listen to your body and rest when needed",
+    "Consider working with a fitness professional",
+)
+
+# Live fitness answer; intensity, focus and bullets come from FITNESS_ANSWER_PLANS
+FITNESS_ANSWER_TEMPLATE = compile_answer_template(("""**Personalized Fitness Recommendations**
 
 Based on your health profile, here are tailored exercise recommendations:
 
 **Your Current Status:**
 • Age: {age} years
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Current Activity Level: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 140 else 'Elevated' if blood_pressure >= 130 else 'Normal'})
+• BMI: {bmi:.1f} ({bmi_label})
+• Current Activity Level: {activity}/10 ({activity_label})
+• Blood Pressure: {blood_pressure} mmHg ({blood_pressure_label})
 
-**Focus Area: {focus.title()}**
+**Focus Area: {focus}**
 
-**Recommended Exercise Intensity: {intensity.title()}**
+**Recommended Exercise Intensity: {intensity}**
 
 **Personalized Recommendations:**
-{chr(10).join([f"• {rec}" for rec in recommendations])}
+{recommendations_bullets}
 
 **Sample Weekly Schedule:**
 • Monday: Cardio (30-45 minutes)
@@ -4222,159 +4655,220 @@ Based on your health profile, here are tailored exercise recommendations:
 • Thursday: Cardio (30-45 minutes)
 • Friday: Strength training (30 minutes)
 • Saturday: Fun activity (sports, hiking)
-• Sunday: Rest or light stretching"""
+• Sunday: Rest or light stretching""", (
+    ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+    ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    ('blood_pressure_label', 'blood_pressure', BP_CATEGORY_LABELS),
+)))
+
+def generate_fitness_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
+    """Generate personalized fitness-related answers"""
+    age = metrics.age
+    bmi = metrics.bmi
+    activity = metrics.activity
+    blood_pressure = metrics.blood_pressure
+    
+    # Analyze fitness needs
+    intensity, focus, base_recommendations = FITNESS_ANSWER_PLANS[tier_index(activity, ACTIVITY_CATEGORY_LABELS)]
+    
+    # Add age and blood pressure specific recommendations
+    recommendations = [*base_recommendations, *collect_factor_labels(FITNESS_ANSWER_EXTRA_RECOMMENDATIONS, metrics._asdict())]
     
-    return HealthAnswer(
+    answer = render_answer_template(FITNESS_ANSWER_TEMPLATE, {
+        'age': age, 'bmi': bmi, 'activity': activity, 'blood_pressure': blood_pressure,
+        'focus': focus.title(), 'intensity': intensity.title(), 'recommendations_bullets': format_bullets(recommendations),
+    })
+    
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=["exercise", "fitness", "physical activity"],
-        follow_up_suggestions=[
-            "Start slowly and gradually increase intensity",
-            "Listen to your body and rest when needed",
-            "Consider working with a fitness professional"
-        ],
+        related_factors=("exercise", "fitness", "physical activity"),
+        follow_up_suggestions=FITNESS_ANSWER_FOLLOW_UPS,
         disclaimer="This fitness advice is for informational purposes only and should not replace professional medical or fitness guidance."
     )
 
-def generate_general_health_answer(question: str, health_data: Dict, age: int, gender: str, bmi: float, blood_pressure: float, glucose: float, activity: float) -> HealthAnswer:
-    """Generate personalized general health answers"""
-    
-    # Analyze overall health status
-    health_score = 0
-    factors = []
-    
-    # BMI analysis
-    if 18.5 <= bmi <= 24.9:
-        health_score += 20
-        factors.append("healthy weight")
-    elif 25 <= bmi <= 29.9:
-        health_score += 15
-        factors.append("slightly overweight")
-    else:
-        health_score += 10
-        factors.append("weight management needed")
-    
-    # Blood pressure analysis
-    if blood_pressure < 120:
-        health_score += 20
-        factors.append("normal blood pressure")
-    elif blood_pressure < 130:
-        health_score += 15
-        factors.append("elevated blood pressure")
-    else:
-        health_score += 10
-        factors.append("high blood pressure")
-    
-    # Glucose analysis
-    if glucose < 100:
-        health_score += 20
-        factors.append("normal blood glucose")
-    elif glucose < 126:
-        health_score += 15
-        factors.append("pre-diabetic glucose")
-    else:
-        health_score += 10
-        factors.append("elevated blood glucose")
-    
-    # Activity analysis
-    if activity >= 7:
-        health_score += 20
-        factors.append("high physical activity")
-    elif activity >= 4:
-        health_score += 15
-        factors.append("moderate physical activity")
-    else:
-        health_score += 10
-        factors.append("low physical activity")
-    
-    # Age consideration
-    if age < 40:
-        health_score += 20
-    elif age < 60:
-        health_score += 15
-    else:
-        health_score += 10
-    
-    # Generate response based on health score
-    if health_score >= 80:
-        confidence = "High"
-        answer = f"""**Your Overall Health Status: EXCELLENT**
+# General health score bands after BMI: (AnswerMetrics field, label table of (score, factor or None))
+GENERAL_HEALTH_SCORE_BANDS = (
+    ('blood_pressure', ((120, 130), True, ((20, "normal blood pressure"), (15, "elevated blood pressure"), (10, "high blood pressure")))),
+    ('glucose', ((100, 126), True, ((20, "normal blood glucose"), (15, "pre-diabetic glucose"), (10, "elevated blood glucose")))),
+    ('activity', ((4, 7), True, ((10, "low physical activity"), (15, "moderate physical activity"), (20, "high physical activity")))),
+    ('age', ((40, 60), True, ((20, None), (15, None), (10, None)))),
+)
+# Health scores at or above these raise the general answer tier
+GENERAL_HEALTH_SCORE_TIERS = (60, 80)
+GENERAL_HEALTH_CONFIDENCE = ("High", "Medium", "High")
+
+GENERAL_HEALTH_ANSWER_FOLLOW_UPS = (
+    "Schedule regular health checkups",
+    "Monitor your health metrics",
+    "Consider lifestyle modifications",
+    "Consult healthcare providers as needed",
+)
 
-Congratulations! Your health profile shows excellent overall health.
+# Live general health answers by GENERAL_HEALTH_SCORE_TIERS tier: (needs attention, good, excellent)
+GENERAL_HEALTH_ANSWER_TEMPLATES = tuple(map(compile_answer_template, (
+    ("""**Your Overall Health Status: NEEDS ATTENTION**
 
-**Your Health Strengths:**
-• BMI: {bmi:.1f} - Healthy weight
-• Blood Pressure: {blood_pressure} mmHg - Normal
-• Blood Glucose: {glucose} mg/dL - Normal
-• Physical Activity: {activity}/10 - Active lifestyle
-• Age: {age} years - Young and healthy
+Your health profile shows several areas that need attention and improvement.
+
+**Your Health Profile:**
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Pressure: {blood_pressure} mmHg ({blood_pressure_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Physical Activity: {activity}/10 ({activity_label})
 
 **Key Health Factors:**
-{', '.join(factors[:3])}
+{key_factors}
 
-**Maintain Your Excellent Health:**
-• Continue your current healthy lifestyle
-• Regular health checkups every 1-2 years
-• Stay active and maintain your exercise routine
-• Keep up your healthy eating habits"""
-        
-    elif health_score >= 60:
-        confidence = "Medium"
-        answer = f"""**Your Overall Health Status: GOOD**
+**Priority Actions:**
+• Consult with healthcare providers
+• Focus on lifestyle modifications
+• Increase physical activity gradually
+• Improve diet quality
+• Regular health monitoring""", (
+        ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+        ('blood_pressure_label', 'blood_pressure', BP_CATEGORY_LABELS),
+        ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+        ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    )),
+    ("""**Your Overall Health Status: GOOD**
 
 Your health profile shows good overall health with some areas for improvement.
 
 **Your Health Profile:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 140 else 'Elevated' if blood_pressure >= 130 else 'Normal'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
+• BMI: {bmi:.1f} ({bmi_label})
+• Blood Pressure: {blood_pressure} mmHg ({blood_pressure_label})
+• Blood Glucose: {glucose} mg/dL ({glucose_label})
+• Physical Activity: {activity}/10 ({activity_label})
 
 **Key Health Factors:**
-{', '.join(factors[:3])}
+{key_factors}
 
 **Areas for Improvement:**
 • Focus on maintaining healthy weight
 • Increase physical activity if needed
 • Monitor blood pressure and glucose levels
-• Regular health checkups annually"""
-        
-    else:
-        confidence = "High"
-        answer = f"""**Your Overall Health Status: NEEDS ATTENTION**
+• Regular health checkups annually""", (
+        ('bmi_label', 'bmi', BMI_CATEGORY_LABELS),
+        ('blood_pressure_label', 'blood_pressure', BP_CATEGORY_LABELS),
+        ('glucose_label', 'glucose', GLUCOSE_CATEGORY_LABELS),
+        ('activity_label', 'activity', ACTIVITY_CATEGORY_LABELS),
+    )),
+    ("""**Your Overall Health Status: EXCELLENT**
 
-Your health profile shows several areas that need attention and improvement.
+Congratulations! Your health profile shows excellent overall health.
 
-**Your Health Profile:**
-• BMI: {bmi:.1f} ({'Obesity' if bmi > 30 else 'Overweight' if bmi > 25 else 'Normal weight'})
-• Blood Pressure: {blood_pressure} mmHg ({'High' if blood_pressure >= 140 else 'Elevated' if blood_pressure >= 130 else 'Normal'})
-• Blood Glucose: {glucose} mg/dL ({'Pre-diabetic' if glucose > 100 else 'Normal'})
-• Physical Activity: {activity}/10 ({'Low' if activity < 3 else 'Moderate' if activity < 6 else 'Good'})
+**Your Health Strengths:**
+• BMI: {bmi:.1f} - Healthy weight
+• Blood Pressure: {blood_pressure} mmHg - Normal
+• Blood Glucose: {glucose} mg/dL - Normal
+• Physical Activity: {activity}/10 - Active lifestyle
+• Age: {age} years - Young and healthy
 
 **Key Health Factors:**
-{', '.join(factors[:3])}
+{key_factors}
 
-**Priority Actions:**
-• Consult with healthcare providers
-• Focus on lifestyle modifications
-• Increase physical activity gradually
-• Improve diet quality
-• Regular health monitoring"""
+**Maintain Your Excellent Health:**
+• Continue your current healthy lifestyle
+• Regular health checkups every 1-2 years
+• Stay active and maintain your exercise routine
+• Keep up your healthy eating habits""", ()),
+)))
+
+def generate_general_health_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
+    """Generate personalized general health answers"""
+    age = metrics.age
+    bmi = metrics.bmi
+    blood_pressure = metrics.blood_pressure
+    glucose = metrics.glucose
+    activity = metrics.activity
+    
+    # Analyze overall health status
+    health_score = 0
+    factors = []
+    
+    # BMI analysis (closed 18.5-24.9 and 25-29.9 ranges, so not a threshold band)
+    if 18.5 <= bmi <= 24.9:
+        health_score += 20
+        factors.append("healthy weight")
+    elif 25 <= bmi <= 29.9:
+        health_score += 15
+        factors.append("slightly overweight")
+    else:
+        health_score += 10
+        factors.append("weight management needed")
     
-    return HealthAnswer(
+    # Blood pressure, glucose, activity and age bands
+    band_score, band_factors = score_answer_bands(GENERAL_HEALTH_SCORE_BANDS, metrics._asdict())
+    health_score += band_score
+    factors.extend(band_factors)
+    
+    # Generate response based on health score
+    tier = bisect_right(GENERAL_HEALTH_SCORE_TIERS, health_score)
+    confidence = GENERAL_HEALTH_CONFIDENCE[tier]
+    answer = render_answer_template(GENERAL_HEALTH_ANSWER_TEMPLATES[tier], {
+        'bmi': bmi, 'blood_pressure': blood_pressure, 'glucose': glucose, 'activity': activity, 'age': age,
+        'key_factors': ', '.join(factors[:3]),
+    })
+    
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence=confidence,
-        related_factors=factors[:3],
-        follow_up_suggestions=[
-            "Schedule regular health checkups",
-            "Monitor your health metrics",
-            "Consider lifestyle modifications",
-            "Consult healthcare providers as needed"
-        ],
-        disclaimer="This assessment is for informational purposes only and should not replace professional medical advice."
+        related_factors=tuple(factors[:3]),
+        follow_up_suggestions=GENERAL_HEALTH_ANSWER_FOLLOW_UPS,
+        disclaimer=GENERAL_HEALTH_DISCLAIMER
     )
 
+# Latest assessment inputs for the Q&A endpoint: user_id -> (expiry time, input_data or None)
+# The cache is per process: /predict only evicts the entry in the worker that served it, so with
+# several uvicorn workers the others can keep answering from the previous assessment for up to
+# LATEST_HEALTH_DATA_TTL seconds.
+LATEST_HEALTH_DATA_TTL = 60
+LATEST_HEALTH_DATA_MAX_USERS = 10000
+_latest_health_data_cache: Dict[str, tuple] = {}
+
+def get_latest_health_data(user_id: str) -> Optional[Dict[str, Any]]:
+    """Return the input data of a user's latest assessment, cached for LATEST_HEALTH_DATA_TTL seconds"""
+    now = time.monotonic()
+    cached = _latest_health_data_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        health_data = cached[1]
+    else:
+        predictions_collection = get_predictions_collection()
+        latest_prediction = predictions_collection.find_one(
+            {"user_id": user_id},
+            {"input_data": 1},
+            sort=[("created_at", -1)]
+        )
+        health_data = latest_prediction.get("input_data", {}) if latest_prediction else None
+        
+        # Re-insert so the dict stays ordered oldest first, then evict from the front
+        _latest_health_data_cache.pop(user_id, None)
+        while len(_latest_health_data_cache) >= LATEST_HEALTH_DATA_MAX_USERS:
+            _latest_health_data_cache.pop(next(iter(_latest_health_data_cache)), None)
+        _latest_health_data_cache[user_id] = (now + LATEST_HEALTH_DATA_TTL, health_data)
+    # Callers get their own copy of the shared cached dict
+    return dict(health_data) if health_data is not None else None
+
 # New Clean Q&A Endpoints
+async def answer_health_question(question_data: HealthQuestion, current_user: dict) -> HealthAnswer:
+    """Answer a question from the inline health data or the user's latest assessment"""
+    logger.info("Processing health question: %s...", question_data.question[:50])
+    
+    # Get user's latest health assessment if not provided
+    if not question_data.health_data:
+        latest_health_data = await run_in_threadpool(get_latest_health_data, current_user["id"])
+        if latest_health_data is not None:
+            question_data.health_data = latest_health_data
+        else:
+            raise HTTPException(status_code=404, detail="No health assessment data found. Please complete a health assessment first.")
+    
+    # Generate personalized answer based on health data
+    answer = generate_personalized_health_answer(question_data.question, question_data.health_data)
+    
+    logger.info("Successfully generated answer for user %s", current_user['email'])
+    return answer
+
 @app.post("/health/ask-question", response_model=HealthAnswer)
 async def ask_health_question(
     question_data: HealthQuestion,
@@ -4382,30 +4876,39 @@ async def ask_health_question(
 ):
     """AI-powered health Q&A based on user's latest health assessment"""
     try:
-        logger.info(f"Processing health question: {question_data.question[:50]}...")
-        
-        # Get user's latest health assessment if not provided
-        if not question_data.health_data:
-            predictions_collection = get_predictions_collection()
-            latest_prediction = predictions_collection.find_one(
-                {"user_id": str(current_user["_id"])},
-                sort=[("created_at", -1)]
-            )
-            if latest_prediction:
-                question_data.health_data = latest_prediction.get("input_data", {})
-            else:
-                raise HTTPException(status_code=404, detail="No health assessment data found. Please complete a health assessment first.")
-        
-        # Generate personalized answer based on health data
-        answer = generate_personalized_health_answer(question_data.question, question_data.health_data)
-        
-        logger.info(f"Successfully generated answer for user {current_user['email']}")
-        return answer
+        answer = await answer_health_question(question_data, current_user)
+        # The answer is built from trusted values; serialize it directly instead of re-validating it
+        return ORJSONResponse(answer.model_dump())
         
     except Exception as e:
-        logger.error(f"Error processing health question: {e}")
+        logger.error("Error processing health question: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to process question: {str(e)}")
 
+def stream_health_answer(answer: HealthAnswer):
+    """Yield an answer as NDJSON: one line per answer section, then a line with the remaining fields"""
+    for section in answer.answer.split("\n\n"):
+        yield orjson.dumps({"section": "answer", "text": section}) + b"\n"
+    yield orjson.dumps({
+        "section": "details",
+        "confidence": answer.confidence,
+        "related_factors": answer.related_factors,
+        "follow_up_suggestions": answer.follow_up_suggestions,
+        "disclaimer": answer.disclaimer,
+    }) + b"\n"
+
+@app.post("/health/ask-question/stream")
+async def ask_health_question_stream(
+    question_data: HealthQuestion,
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Same as /health/ask-question, streamed section by section for chat clients"""
+    try:
+        answer = await answer_health_question(question_data, current_user)
+        return StreamingResponse(stream_health_answer(answer), media_type="application/x-ndjson")
+        
+    except Exception as e:
+        logger.error("Error processing health question: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to process question: {str(e)}")
 
 # Test endpoint removed for security - all endpoints now require authentication
 
@@ -4421,7 +4924,7 @@ async def debug_save_test(health_input: HealthInput):
         # Create a test record
         test_record = {
             "user_id": "test_user_123",
-            "input_data": health_input.dict(),
+            "input_data": health_input.model_dump(),
             "diabetes_risk": 0.25,
             "hypertension_risk": 0.35,
             "diabetes_confidence": "Moderate",
@@ -4433,8 +4936,8 @@ async def debug_save_test(health_input: HealthInput):
             "created_at": datetime.now()
         }
         
-        result = predictions_collection.insert_one(test_record)
-        logger.info(f"Test record saved with ID: {result.inserted_id}")
+        result = await run_in_threadpool(predictions_collection.insert_one, test_record)
+        logger.info("Test record saved with ID: %s", result.inserted_id)
         
         return {
             "status": "success",
@@ -4443,12 +4946,50 @@ async def debug_save_test(health_input: HealthInput):
         }
         
     except Exception as e:
-        logger.error(f"Failed to save test record: {e}")
+        logger.error("Failed to save test record: %s", e)
         return {
             "status": "failed",
             "error": str(e)
         }
 
+# Scaled feature rows waiting for the next batched prediction: (row, future of (diabetes, hypertension) probabilities)
+PREDICTION_BATCH_WINDOW = 0.005
+PREDICTION_BATCH_MAX = 64
+_pending_predictions: List[tuple] = []
+
+async def predict_risks_batched(input_array: np.ndarray) -> tuple:
+    """Predict both risks for one feature row, sharing a predict_proba call with rows queued in the same window"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _pending_predictions.append((input_array, future))
+    # The first row of a batch schedules its flush
+    if len(_pending_predictions) == 1:
+        loop.call_later(PREDICTION_BATCH_WINDOW, flush_prediction_batch)
+    elif len(_pending_predictions) >= PREDICTION_BATCH_MAX:
+        flush_prediction_batch()
+    return await future
+
+def flush_prediction_batch() -> None:
+    """Run the queued feature rows through both models at once and resolve their futures"""
+    batch = _pending_predictions[:]
+    _pending_predictions.clear()
+    # A full batch may already have been flushed before its timer fired
+    if not batch:
+        return
+    try:
+        rows = np.vstack([row for row, _ in batch])
+        diabetes_probas = diabetes_model.predict_proba(rows)[:, 1]
+        hypertension_probas = hypertension_model.predict_proba(rows)[:, 1]
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+    for (_, future), diabetes_proba, hypertension_proba in zip(batch, diabetes_probas, hypertension_probas):
+        # Skip requests that were cancelled while waiting
+        if not future.done():
+            future.set_result((diabetes_proba, hypertension_proba))
+
 @app.post("/analyze/comprehensive")
 async def get_comprehensive_analysis(health_input: HealthInput):
     """Get comprehensive risk factor analysis for health assessment"""
@@ -4460,12 +5001,14 @@ async def get_comprehensive_analysis(health_input: HealthInput):
             )
         
         # Prepare input data
-        input_dict = health_input.dict()
-        input_df, feature_quality = prepare_features(health_input)
+        input_dict = health_input.model_dump()
+        input_array, _, feature_quality = prepare_feature_array(health_input)
         
-        # Get predictions
-        diabetes_proba = diabetes_model.predict_proba(input_df)[0][1]
-        hypertension_proba = hypertension_model.predict_proba(input_df)[0][1]
+        # The models were trained on scaled features, as in /predict
+        input_array = scale_feature_row(input_array)
+        
+        # Get predictions, batched with any concurrent analysis requests
+        diabetes_proba, hypertension_proba = await predict_risks_batched(input_array)
         
         # Get comprehensive analysis
         comprehensive_analysis = analyze_comprehensive_risk_factors(
@@ -4477,15 +5020,25 @@ async def get_comprehensive_analysis(health_input: HealthInput):
             "comprehensive_analysis": comprehensive_analysis,
             "diabetes_risk": round(diabetes_proba * 100, 1),
             "hypertension_risk": round(hypertension_proba * 100, 1),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Error in comprehensive analysis: {e}")
+        logger.error("Error in comprehensive analysis: %s", e)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-def generate_sleep_answer(question: str, health_data: Dict, age: int, sleep_hours: float, stress_level: float, activity: float) -> HealthAnswer:
+SLEEP_ANSWER_FOLLOW_UPS = (
+    "Ask about sleep hygiene tips",
+    "Learn stress management techniques",
+    "Get exercise recommendations for better sleep",
+    "Understand sleep disorders and when to seek help",
+)
+
+def generate_sleep_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
     """Generate personalized sleep-related answers"""
+    sleep_hours = metrics.sleep_hours
+    stress_level = metrics.stress_level
+    activity = metrics.activity
     
     # Analyze sleep patterns
     sleep_quality = "good" if 7 <= sleep_hours <= 9 else "needs improvement"
@@ -4509,57 +5062,64 @@ def generate_sleep_answer(question: str, health_data: Dict, age: int, sleep_hour
         factors.append("high activity levels promoting better sleep")
     
     # Generate personalized response
-    if "sleep" in question.lower() or "insomnia" in question.lower():
-        answer = f"Based on your profile, you're getting {sleep_hours:.1f} hours of sleep per night. "
+    if "sleep" in intents:
+        parts = [f"Based on your profile, you're getting {sleep_hours:.1f} hours of sleep per night. "]
         
         if 7 <= sleep_hours <= 9:
-            answer += "This is within the recommended range for adults. "
+            parts.append("This is within the recommended range for adults. ")
         elif sleep_hours < 7:
-            answer += "This is below the recommended 7-9 hours for adults. "
+            parts.append("This is below the recommended 7-9 hours for adults. ")
         else:
-            answer += "This exceeds the typical adult sleep needs. "
+            parts.append("This exceeds the typical adult sleep needs. ")
         
         if stress_level > 6:
-            answer += f"Your high stress level ({stress_level}/10) may be affecting sleep quality. "
-            answer += "Consider stress management techniques like meditation, deep breathing, or gentle yoga before bed. "
+            parts.append(f"Your high stress level ({stress_level}/10) may be affecting sleep quality. ")
+            parts.append("Consider stress management techniques like meditation, deep breathing, or gentle yoga before bed. ")
         
         if activity < 3:
-            answer += "Increasing your physical activity during the day can improve sleep quality at night. "
+            parts.append("Increasing your physical activity during the day can improve sleep quality at night. ")
         
-        answer += "Maintain a consistent sleep schedule and create a relaxing bedtime routine."
+        parts.append("Maintain a consistent sleep schedule and create a relaxing bedtime routine.")
     
-    elif "tired" in question.lower() or "fatigue" in question.lower():
-        answer = f"Your sleep duration of {sleep_hours:.1f} hours may be contributing to fatigue. "
+    elif "fatigue" in intents:
+        parts = [f"Your sleep duration of {sleep_hours:.1f} hours may be contributing to fatigue. "]
         
         if sleep_hours < 7:
-            answer += "Try to get 7-9 hours of quality sleep each night. "
+            parts.append("Try to get 7-9 hours of quality sleep each night. ")
         elif stress_level > 6:
-            answer += "High stress levels can cause fatigue even with adequate sleep. "
+            parts.append("High stress levels can cause fatigue even with adequate sleep. ")
         
-        answer += "Ensure your bedroom is cool, dark, and quiet for optimal sleep quality."
+        parts.append("Ensure your bedroom is cool, dark, and quiet for optimal sleep quality.")
     
     else:
-        answer = f"Your current sleep pattern shows {sleep_quality} sleep habits. "
+        parts = [f"Your current sleep pattern shows {sleep_quality} sleep habits. "]
         if sleep_hours < 7:
-            answer += "Aim for 7-9 hours of sleep for optimal health and energy levels."
+            parts.append("Aim for 7-9 hours of sleep for optimal health and energy levels.")
         else:
-            answer += "Continue maintaining good sleep hygiene for overall health."
+            parts.append("Continue maintaining good sleep hygiene for overall health.")
+    
+    answer = "".join(parts)
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=factors,
-        follow_up_suggestions=[
-            "Ask about sleep hygiene tips",
-            "Learn stress management techniques",
-            "Get exercise recommendations for better sleep",
-            "Understand sleep disorders and when to seek help"
-        ],
+        related_factors=tuple(factors),
+        follow_up_suggestions=SLEEP_ANSWER_FOLLOW_UPS,
         disclaimer="Sleep advice is general guidance. Consult a healthcare provider for persistent sleep issues."
     )
 
-def generate_mental_health_answer(question: str, health_data: Dict, age: int, stress_level: float, sleep_hours: float, activity: float) -> HealthAnswer:
+MENTAL_HEALTH_ANSWER_FOLLOW_UPS = (
+    "Learn stress management techniques",
+    "Get sleep improvement tips",
+    "Find mental health resources",
+    "Understand when to seek professional help",
+)
+
+def generate_mental_health_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
     """Generate personalized mental health answers"""
+    stress_level = metrics.stress_level
+    sleep_hours = metrics.sleep_hours
+    activity = metrics.activity
     
     # Analyze mental health factors
     factors = []
@@ -4587,96 +5147,87 @@ def generate_mental_health_answer(question: str, health_data: Dict, age: int, st
         mental_health_score -= 10
     
     # Generate personalized response
-    if "stress" in question.lower() or "anxiety" in question.lower():
-        answer = f"Your stress level is {stress_level}/10. "
+    if "stress" in intents:
+        parts = [f"Your stress level is {stress_level}/10. "]
         
         if stress_level > 7:
-            answer += "This is quite high and may be affecting your overall wellbeing. "
-            answer += "Consider stress management techniques like deep breathing, meditation, or talking to a counselor. "
+            parts.append("This is quite high and may be affecting your overall wellbeing. ")
+            parts.append("Consider stress management techniques like deep breathing, meditation, or talking to a counselor. ")
         elif stress_level < 4:
-            answer += "You're managing stress well! Continue your current stress management strategies. "
+            parts.append("You're managing stress well! Continue your current stress management strategies. ")
         else:
-            answer += "This is a moderate stress level. Consider preventive stress management techniques. "
+            parts.append("This is a moderate stress level. Consider preventive stress management techniques. ")
         
         if activity < 3:
-            answer += "Regular physical activity can significantly reduce stress levels. "
+            parts.append("Regular physical activity can significantly reduce stress levels. ")
         if sleep_hours < 7:
-            answer += "Adequate sleep is crucial for stress management. "
+            parts.append("Adequate sleep is crucial for stress management. ")
     
-    elif "depression" in question.lower() or "mood" in question.lower():
-        answer = f"Based on your lifestyle factors: "
+    elif "mood" in intents:
+        parts = [f"Based on your lifestyle factors: "]
         
         if activity >= 5:
-            answer += "Your good activity level supports positive mood. "
+            parts.append("Your good activity level supports positive mood. ")
         else:
-            answer += "Increasing physical activity can boost mood and mental health. "
+            parts.append("Increasing physical activity can boost mood and mental health. ")
         
         if sleep_hours >= 7:
-            answer += "Adequate sleep is essential for emotional wellbeing. "
+            parts.append("Adequate sleep is essential for emotional wellbeing. ")
         else:
-            answer += "Poor sleep can negatively impact mood and mental health. "
+            parts.append("Poor sleep can negatively impact mood and mental health. ")
         
         if stress_level > 6:
-            answer += "High stress can contribute to mood changes. Consider stress reduction techniques. "
+            parts.append("High stress can contribute to mood changes. Consider stress reduction techniques. ")
         
-        answer += "If you're experiencing persistent mood changes, consider speaking with a mental health professional."
+        parts.append("If you're experiencing persistent mood changes, consider speaking with a mental health professional.")
     
     else:
-        answer = f"Your mental health factors show: "
+        parts = [f"Your mental health factors show: "]
         if mental_health_score >= 30:
-            answer += "good mental health indicators. Continue your current lifestyle habits. "
+            parts.append("good mental health indicators. Continue your current lifestyle habits. ")
         else:
-            answer += "some areas for improvement. Focus on stress management, adequate sleep, and regular physical activity. "
+            parts.append("some areas for improvement. Focus on stress management, adequate sleep, and regular physical activity. ")
         
-        answer += "Mental health is as important as physical health - don't hesitate to seek professional support when needed."
+        parts.append("Mental health is as important as physical health - don't hesitate to seek professional support when needed.")
+    
+    answer = "".join(parts)
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=factors,
-        follow_up_suggestions=[
-            "Learn stress management techniques",
-            "Get sleep improvement tips",
-            "Find mental health resources",
-            "Understand when to seek professional help"
-        ],
+        related_factors=tuple(factors),
+        follow_up_suggestions=MENTAL_HEALTH_ANSWER_FOLLOW_UPS,
         disclaimer="Mental health advice is general guidance. Seek professional help for persistent mental health concerns."
     )
 
-def generate_lifestyle_answer(question: str, health_data: Dict, age: int, gender: str, bmi: float, activity: float, smoking: int, alcohol: int, sleep_hours: float) -> HealthAnswer:
+# Lifestyle score bands: (AnswerMetrics field, label table of (score, factor))
+LIFESTYLE_SCORE_BANDS = (
+    ('smoking', ((0,), False, ((20, "non-smoker"), (-20, "smoking habit - major health risk")))),
+    ('alcohol', ((0, 2), False, ((10, "no alcohol consumption"), (5, "moderate alcohol consumption"), (-10, "high alcohol consumption")))),
+    ('activity', ((3, 5), True, ((-15, "sedentary lifestyle"), (10, "moderately active"), (15, "active lifestyle")))),
+)
+
+LIFESTYLE_ANSWER_FOLLOW_UPS = (
+    "Get personalized exercise recommendations",
+    "Learn about healthy nutrition habits",
+    "Understand smoking cessation resources",
+    "Find stress management techniques",
+)
+
+def generate_lifestyle_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
     """Generate personalized lifestyle answers"""
-    
-    # Analyze lifestyle factors
-    factors = []
-    lifestyle_score = 0
-    
-    if smoking == 0:
-        factors.append("non-smoker")
-        lifestyle_score += 20
-    else:
-        factors.append("smoking habit - major health risk")
-        lifestyle_score -= 20
-    
-    if alcohol == 0:
-        factors.append("no alcohol consumption")
-        lifestyle_score += 10
-    elif alcohol <= 2:
-        factors.append("moderate alcohol consumption")
-        lifestyle_score += 5
-    else:
-        factors.append("high alcohol consumption")
-        lifestyle_score -= 10
-    
-    if activity >= 5:
-        factors.append("active lifestyle")
-        lifestyle_score += 15
-    elif activity >= 3:
-        factors.append("moderately active")
-        lifestyle_score += 10
-    else:
-        factors.append("sedentary lifestyle")
-        lifestyle_score -= 15
-    
+    age = metrics.age
+    gender = metrics.gender
+    bmi = metrics.bmi
+    activity = metrics.activity
+    smoking = metrics.smoking
+    alcohol = metrics.alcohol
+    sleep_hours = metrics.sleep_hours
+    
+    # Analyze lifestyle factors: smoking, alcohol and activity bands
+    lifestyle_score, factors = score_answer_bands(LIFESTYLE_SCORE_BANDS, metrics._asdict())
+    
+    # Sleep scores the closed 7-9 hour range, so it is not a threshold band
     if 7 <= sleep_hours <= 9:
         factors.append("good sleep habits")
         lifestyle_score += 10
@@ -4685,139 +5236,156 @@ def generate_lifestyle_answer(question: str, health_data: Dict, age: int, gender
         lifestyle_score -= 5
     
     # Generate personalized response
-    if "lifestyle" in question.lower() or "habits" in question.lower():
-        answer = f"Your lifestyle profile shows: "
+    if "habits" in intents:
+        parts = [f"Your lifestyle profile shows: "]
         
         if smoking == 0:
-            answer += "excellent choice to avoid smoking. "
+            parts.append("excellent choice to avoid smoking. ")
         else:
-            answer += "smoking is a major health risk that should be addressed. "
+            parts.append("smoking is a major health risk that should be addressed. ")
         
         if alcohol <= 2:
-            answer += "Your alcohol consumption appears moderate. "
+            parts.append("Your alcohol consumption appears moderate. ")
         else:
-            answer += "Consider reducing alcohol consumption for better health. "
+            parts.append("Consider reducing alcohol consumption for better health. ")
         
         if activity >= 5:
-            answer += "Great job maintaining an active lifestyle! "
+            parts.append("Great job maintaining an active lifestyle! ")
         else:
-            answer += "Increasing physical activity will significantly benefit your health. "
+            parts.append("Increasing physical activity will significantly benefit your health. ")
         
-        answer += "Focus on maintaining healthy habits: regular exercise, balanced nutrition, adequate sleep, and stress management."
+        parts.append("Focus on maintaining healthy habits: regular exercise, balanced nutrition, adequate sleep, and stress management.")
     
-    elif "prevention" in question.lower():
-        answer = f"Based on your {age}-year-old {gender.lower()} profile, key prevention strategies include: "
+    elif "prevention" in intents:
+        parts = [f"Based on your {age}-year-old {gender.lower()} profile, key prevention strategies include: "]
         
         if smoking > 0:
-            answer += "Quitting smoking is the most important step. "
+            parts.append("Quitting smoking is the most important step. ")
         if activity < 5:
-            answer += "Regular physical activity (150 minutes/week) is crucial. "
+            parts.append("Regular physical activity (150 minutes/week) is crucial. ")
         if bmi > 25:
-            answer += "Maintaining a healthy weight through diet and exercise. "
+            parts.append("Maintaining a healthy weight through diet and exercise. ")
         
-        answer += "Regular health screenings, stress management, and adequate sleep are also essential for prevention."
+        parts.append("Regular health screenings, stress management, and adequate sleep are also essential for prevention.")
     
     else:
-        answer = f"Your lifestyle factors indicate "
+        parts = [f"Your lifestyle factors indicate "]
         if lifestyle_score >= 40:
-            answer += "good overall lifestyle choices. Continue your healthy habits! "
+            parts.append("good overall lifestyle choices. Continue your healthy habits! ")
         else:
-            answer += "several areas for improvement. Focus on the most impactful changes first. "
+            parts.append("several areas for improvement. Focus on the most impactful changes first. ")
         
-        answer += "Small, consistent changes in daily habits can lead to significant long-term health benefits."
+        parts.append("Small, consistent changes in daily habits can lead to significant long-term health benefits.")
     
-    return HealthAnswer(
+    answer = "".join(parts)
+    
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="High",
-        related_factors=factors,
-        follow_up_suggestions=[
-            "Get personalized exercise recommendations",
-            "Learn about healthy nutrition habits",
-            "Understand smoking cessation resources",
-            "Find stress management techniques"
-        ],
+        related_factors=tuple(factors),
+        follow_up_suggestions=LIFESTYLE_ANSWER_FOLLOW_UPS,
         disclaimer="Lifestyle advice is general guidance. Consult healthcare providers for personalized recommendations."
     )
 
-def generate_medication_answer(question: str, health_data: Dict, age: int, gender: str, bmi: float, blood_pressure: float, glucose: float, cholesterol: float) -> HealthAnswer:
+# Medication answer labels: (AnswerMetrics field, label table); a None label means it does not apply
+MEDICATION_CONSIDERATION_LABELS = (
+    ('blood_pressure', ((140,), True, (None, "blood pressure medication may be needed"))),
+    ('glucose', ((126,), True, (None, "diabetes medication may be required"))),
+    ('cholesterol', ((240,), True, (None, "cholesterol medication may be beneficial"))),
+)
+MEDICATION_FACTOR_LABELS = (
+    ('age', ((65,), True, (None, "age-related medication considerations"))),
+    ('bmi', ((30,), False, (None, "weight-related medication adjustments may be needed"))),
+)
+
+MEDICATION_ANSWER_FOLLOW_UPS = (
+    "Discuss medication options with your doctor",
+    "Learn about medication interactions",
+    "Understand supplement safety",
+    "Get regular health monitoring",
+)
+
+def generate_medication_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
     """Generate personalized medication-related answers"""
+    age = metrics.age
     
     # Analyze medication needs
-    factors = []
-    medication_considerations = []
-    
-    if blood_pressure >= 140:
-        medication_considerations.append("blood pressure medication may be needed")
-    if glucose >= 126:
-        medication_considerations.append("diabetes medication may be required")
-    if cholesterol >= 240:
-        medication_considerations.append("cholesterol medication may be beneficial")
-    
-    if age >= 65:
-        factors.append("age-related medication considerations")
-    if bmi > 30:
-        factors.append("weight-related medication adjustments may be needed")
+    answer_values = metrics._asdict()
+    medication_considerations = collect_factor_labels(MEDICATION_CONSIDERATION_LABELS, answer_values)
+    factors = collect_factor_labels(MEDICATION_FACTOR_LABELS, answer_values)
     
     # Generate personalized response
-    if "medication" in question.lower() or "drug" in question.lower():
-        answer = f"Based on your health profile: "
+    if "medication" in intents:
+        parts = [f"Based on your health profile: "]
         
         if medication_considerations:
-            answer += f"Your health indicators suggest {', '.join(medication_considerations[:2])}. "
-            answer += "However, medication decisions should always be made with your healthcare provider. "
+            parts.append(f"Your health indicators suggest {', '.join(medication_considerations[:2])}. ")
+            parts.append("However, medication decisions should always be made with your healthcare provider. ")
         else:
-            answer += "Your current health indicators don't suggest immediate medication needs. "
-            answer += "Focus on lifestyle modifications first. "
+            parts.append("Your current health indicators don't suggest immediate medication needs. ")
+            parts.append("Focus on lifestyle modifications first. ")
         
-        answer += "Never start, stop, or change medications without consulting your doctor."
+        parts.append("Never start, stop, or change medications without consulting your doctor.")
     
-    elif "supplement" in question.lower() or "vitamin" in question.lower():
-        answer = f"Based on your {age}-year-old profile: "
+    elif "supplement" in intents:
+        parts = [f"Based on your {age}-year-old profile: "]
         
         if age >= 50:
-            answer += "You may benefit from vitamin D and B12 supplements. "
-        if health_data.get('physical_activity', 5) < 3:
-            answer += "Consider omega-3 supplements for heart health. "
-        if health_data.get('sleep_hours', 7) < 7:
-            answer += "Magnesium supplements may help with sleep. "
+            parts.append("You may benefit from vitamin D and B12 supplements. ")
+        if metrics.activity < 3:
+            parts.append("Consider omega-3 supplements for heart health. ")
+        if metrics.sleep_hours < 7:
+            parts.append("Magnesium supplements may help with sleep. ")
         
-        answer += "Always consult your healthcare provider before starting any supplements, especially if you take medications."
+        parts.append("Always consult your healthcare provider before starting any supplements, especially if you take medications.")
     
     else:
-        answer = f"Your health profile suggests "
+        parts = [f"Your health profile suggests "]
         if medication_considerations:
-            answer += "potential medication needs that should be discussed with your healthcare provider. "
+            parts.append("potential medication needs that should be discussed with your healthcare provider. ")
         else:
-            answer += "good health indicators that may not require medications at this time. "
+            parts.append("good health indicators that may not require medications at this time. ")
         
-        answer += "Regular monitoring and lifestyle modifications are key to maintaining health."
+        parts.append("Regular monitoring and lifestyle modifications are key to maintaining health.")
+    
+    answer = "".join(parts)
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="Medium",
-        related_factors=factors,
-        follow_up_suggestions=[
-            "Discuss medication options with your doctor",
-            "Learn about medication interactions",
-            "Understand supplement safety",
-            "Get regular health monitoring"
-        ],
+        related_factors=tuple(factors),
+        follow_up_suggestions=MEDICATION_ANSWER_FOLLOW_UPS,
         disclaimer="This is not medical advice. Always consult healthcare providers for medication decisions."
     )
 
-def generate_symptoms_answer(question: str, health_data: Dict, age: int, gender: str, bmi: float, blood_pressure: float, glucose: float, cholesterol: float) -> HealthAnswer:
+# Symptom warning signs: (AnswerMetrics field, label table); a None label means it does not apply
+SYMPTOM_WARNING_SIGN_LABELS = (
+    ('blood_pressure', ((140,), True, (None, "high blood pressure symptoms like headaches, dizziness"))),
+    ('glucose', ((126,), True, (None, "diabetes symptoms like increased thirst, frequent urination"))),
+    ('bmi', ((30,), False, (None, "obesity-related symptoms like joint pain, fatigue"))),
+)
+
+SYMPTOM_MONITORING_LABELS = (
+    ('blood_pressure', ((130,), True, (None, "cardiovascular symptoms like chest pain, shortness of breath. "))),
+    ('glucose', ((100,), True, (None, "diabetes symptoms like excessive thirst, frequent urination, blurred vision. "))),
+    ('bmi', ((25,), False, (None, "weight-related symptoms like joint pain, sleep apnea. "))),
+)
+
+SYMPTOMS_ANSWER_FOLLOW_UPS = (
+    "Learn about emergency symptoms",
+    "Understand when to seek immediate care",
+    "Get regular health screenings",
+    "Track symptoms and patterns",
+)
+
+def generate_symptoms_answer(intents: frozenset, health_data: Dict, metrics: AnswerMetrics) -> HealthAnswer:
     """Generate personalized symptoms-related answers"""
+    age = metrics.age
+    gender = metrics.gender
     
     # Analyze potential symptoms based on health data
     factors = []
-    warning_signs = []
-    
-    if blood_pressure >= 140:
-        warning_signs.append("high blood pressure symptoms like headaches, dizziness")
-    if glucose >= 126:
-        warning_signs.append("diabetes symptoms like increased thirst, frequent urination")
-    if bmi > 30:
-        warning_signs.append("obesity-related symptoms like joint pain, fatigue")
+    warning_signs = collect_factor_labels(SYMPTOM_WARNING_SIGN_LABELS, metrics._asdict())
     
     if age >= 50:
         factors.append("age-related symptom monitoring")
@@ -4827,45 +5395,82 @@ def generate_symptoms_answer(question: str, health_data: Dict, age: int, gender:
         factors.append("female-specific health symptoms to monitor")
     
     # Generate personalized response
-    if "symptom" in question.lower() or "sign" in question.lower():
-        answer = f"Based on your health profile, be aware of: "
+    if "symptom" in intents:
+        parts = [f"Based on your health profile, be aware of: "]
         
         if warning_signs:
-            answer += f"{', '.join(warning_signs[:2])}. "
+            parts.append(f"{', '.join(warning_signs[:2])}. ")
         else:
-            answer += "general health symptoms like persistent fatigue, unexplained weight changes, or unusual pain. "
+            parts.append("general health symptoms like persistent fatigue, unexplained weight changes, or unusual pain. ")
         
-        answer += "If you experience any concerning symptoms, consult your healthcare provider promptly."
+        parts.append("If you experience any concerning symptoms, consult your healthcare provider promptly.")
     
-    elif "warning" in question.lower() or "alert" in question.lower():
-        answer = f"Your health indicators suggest monitoring for: "
-        
-        if blood_pressure >= 130:
-            answer += "cardiovascular symptoms like chest pain, shortness of breath. "
-        if glucose >= 100:
-            answer += "diabetes symptoms like excessive thirst, frequent urination, blurred vision. "
-        if bmi > 25:
-            answer += "weight-related symptoms like joint pain, sleep apnea. "
+    elif "warning" in intents:
+        parts = [f"Your health indicators suggest monitoring for: "]
+        parts.extend(collect_factor_labels(SYMPTOM_MONITORING_LABELS, metrics._asdict()))
         
-        answer += "Seek immediate medical attention for severe symptoms like chest pain, difficulty breathing, or severe headache."
+        parts.append("Seek immediate medical attention for severe symptoms like chest pain, difficulty breathing, or severe headache.")
     
     else:
-        answer = f"Your {age}-year-old {gender.lower()} profile suggests monitoring for age and gender-appropriate symptoms. "
-        answer += "Regular health checkups and awareness of your body's changes are important for early detection of health issues."
+        parts = [f"Your {age}-year-old {gender.lower()} profile suggests monitoring for age and gender-appropriate symptoms. "]
+        parts.append("Regular health checkups and awareness of your body's changes are important for early detection of health issues.")
+    
+    answer = "".join(parts)
     
-    return HealthAnswer(
+    return HealthAnswer.model_construct(
         answer=answer,
         confidence="Medium",
-        related_factors=factors,
-        follow_up_suggestions=[
-            "Learn about emergency symptoms",
-            "Understand when to seek immediate care",
-            "Get regular health screenings",
-            "Track symptoms and patterns"
-        ],
+        related_factors=tuple(factors),
+        follow_up_suggestions=SYMPTOMS_ANSWER_FOLLOW_UPS,
         disclaimer="This is not medical advice. Seek immediate medical attention for severe or concerning symptoms."
     )
 
+# Live Q&A dispatch: topic -> answer generator
+ANSWER_TOPIC_HANDLERS = {
+    "diabetes": generate_diabetes_answer,
+    "hypertension": generate_hypertension_answer,
+    "nutrition": generate_nutrition_answer,
+    "fitness": generate_fitness_answer,
+    "sleep": generate_sleep_answer,
+    "mental_health": generate_mental_health_answer,
+    "lifestyle": generate_lifestyle_answer,
+    "medication": generate_medication_answer,
+    "symptoms": generate_symptoms_answer,
+}
+
+# Raw health_data fields the answer generators read; only these take part in the answer cache key
+ANSWER_HEALTH_FIELDS = ('diabetes_risk', 'hypertension_risk')
+
+@lru_cache(maxsize=4096)
+def answer_health_topic(topic: Optional[str], intents: frozenset, metrics: AnswerMetrics, health_items: tuple, input_types: tuple) -> HealthAnswer:
+    """Run the answer generator for a topic (cached per input types too; the frozen answer is shared between callers)"""
+    # Questions without a known topic get the general health answer
+    handler = ANSWER_TOPIC_HANDLERS.get(topic, generate_general_health_answer)
+    return handler(intents, dict(health_items), metrics)
+
+# Memoized Q&A answers; these only depend on their arguments and the answer templates
+ANSWER_CACHES = (answer_health_topic, answer_question_category, build_diabetes_risk_answer, build_hypertension_risk_answer)
+
+# Cache flushes are an operator action: the route only works when CACHE_ADMIN_TOKEN is set,
+# and the caller must send it in the X-Cache-Admin-Token header on top of logging in
+CACHE_ADMIN_TOKEN = os.getenv("CACHE_ADMIN_TOKEN")
+
+@app.post("/health/cache/invalidate")
+async def invalidate_answer_cache(
+    x_cache_admin_token: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Drop all cached Q&A answers and cached latest assessments"""
+    if not CACHE_ADMIN_TOKEN or not hmac.compare_digest(x_cache_admin_token or "", CACHE_ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Not allowed to invalidate caches")
+    cleared = len(_latest_health_data_cache)
+    _latest_health_data_cache.clear()
+    for cached_answer in ANSWER_CACHES:
+        cleared += cached_answer.cache_info().currsize
+        cached_answer.cache_clear()
+    logger.info("User %s cleared %d cached health answers", current_user['email'], cleared)
+    return {"status": "success", "cleared": cleared}
+
 # Test endpoint for debugging risk conversion
 @app.get("/debug/risk-conversion")
 async def debug_risk_conversion():
@@ -4877,18 +5482,18 @@ async def debug_risk_conversion():
     
     # Test conversion logic
     diabetes_raw = test_data.get('diabetes_risk', 0)
-    diabetes_converted = diabetes_raw * 100 if diabetes_raw <= 1.0 else diabetes_raw
+    diabetes_converted = risk_to_percent(diabetes_raw)
     
     hypertension_raw = test_data.get('hypertension_risk', 0)
-    hypertension_converted = hypertension_raw * 100 if hypertension_raw <= 1.0 else hypertension_raw
+    hypertension_converted = risk_to_percent(hypertension_raw)
     
     return {
         "diabetes_raw": diabetes_raw,
         "diabetes_converted": diabetes_converted,
         "hypertension_raw": hypertension_raw,
         "hypertension_converted": hypertension_converted,
-        "diabetes_risk_level": "VERY HIGH" if diabetes_converted >= 70 else "HIGH" if diabetes_converted >= 50 else "MODERATE" if diabetes_converted >= 25 else "LOW",
-        "hypertension_risk_level": "VERY HIGH" if hypertension_converted >= 70 else "HIGH" if hypertension_converted >= 50 else "MODERATE" if hypertension_converted >= 25 else "LOW"
+        "diabetes_risk_level": ANSWER_RISK_LEVELS[answer_risk_tier(diabetes_converted)],
+        "hypertension_risk_level": ANSWER_RISK_LEVELS[answer_risk_tier(hypertension_converted)]
     }
 
 if __name__ == "__main__":
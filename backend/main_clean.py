@@ -1,24 +1,18 @@
 from fastapi.exceptions import RequestValidationError
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 import joblib
 import numpy as np
-import pandas as pd
-import shap
 from typing import Dict, List, Any, Optional, Union
 import logging
 from datetime import datetime
 import json
-import random
 import os
-import re
+import time
 from dotenv import load_dotenv
-from bson import ObjectId
-from fastapi.responses import StreamingResponse
-from pdf_generator import generate_health_report_pdf
 
 # Load environment variables
 load_dotenv()
@@ -34,7 +28,8 @@ from tracking_routes import router as tracking_router
 app = FastAPI(
     title="PreventiX Advanced API - Clean",
     description="AI-powered health risk prediction with personalized recommendations",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure logging
@@ -56,7 +51,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     logger.error(f"Validation error: {exc.errors()}")
     logger.error(f"Body received: {exc.body}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": exc.errors(),
@@ -122,6 +117,19 @@ fitness_recommendations = None
 nutrition_recommendations = None
 model_features = None
 
+# Health check timestamps only carry seconds, so the ISO string is reused within a second: [second, iso string]
+_now_iso_cache = [None, ""]
+
+def now_iso() -> str:
+    """Return the current local time as an ISO string at seconds precision"""
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _now_iso_cache[1]
+
+# Combined artifact archive written by train_pipeline.py
+MODELS_BUNDLE_PATH = 'models_bundle.joblib'
+
 def load_models():
     """Load ML models and preprocessors"""
     global diabetes_model, hypertension_model, feature_scaler, fitness_recommendations, nutrition_recommendations, model_features
@@ -129,13 +137,23 @@ def load_models():
     try:
         logger.info("Loading optimized models and preprocessors...")
         
-        # Load models
-        diabetes_model = joblib.load('diabetes_model_optimized.joblib')
-        hypertension_model = joblib.load('hypertension_model_optimized.joblib')
-        feature_scaler = joblib.load('feature_scaler_optimized.joblib')
-        fitness_recommendations = joblib.load('fitness_recommendations.joblib')
-        nutrition_recommendations = joblib.load('nutrition_recommendations.joblib')
-        model_features = joblib.load('model_features_optimized.joblib')
+        if os.path.exists(MODELS_BUNDLE_PATH):
+            # One memory-mapped load; numpy arrays are paged in on demand
+            bundle = joblib.load(MODELS_BUNDLE_PATH, mmap_mode='r')
+            diabetes_model = bundle['diabetes']
+            hypertension_model = bundle['hypertension']
+            feature_scaler = bundle['scaler']
+            fitness_recommendations = bundle['fitness']
+            nutrition_recommendations = bundle['nutrition']
+            model_features = bundle['features']
+        else:
+            # Load models
+            diabetes_model = joblib.load('diabetes_model_optimized.joblib')
+            hypertension_model = joblib.load('hypertension_model_optimized.joblib')
+            feature_scaler = joblib.load('feature_scaler_optimized.joblib')
+            fitness_recommendations = joblib.load('fitness_recommendations.joblib')
+            nutrition_recommendations = joblib.load('nutrition_recommendations.joblib')
+            model_features = joblib.load('model_features_optimized.joblib')
         
         logger.info("Optimized models loaded successfully. Features: 18")
         logger.info(f"Model types: Diabetes={type(diabetes_model).__name__}, Hypertension={type(hypertension_model).__name__}")
@@ -167,7 +185,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "models_loaded": {
             "diabetes_model": diabetes_model is not None,
             "hypertension_model": hypertension_model is not None,
@@ -1,75 +1,486 @@
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, KeepTogether
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from bisect import bisect_right
 from io import BytesIO
+from types import MappingProxyType
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import partial
+from xml.sax.saxutils import escape
+from typing import Dict, List, Any, BinaryIO, Optional, Sequence
 
-def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[str, Any]) -> BytesIO:
-    """Generate a comprehensive personalized health report PDF"""
+# Shared read-only default for missing report sections
+EMPTY_SECTION = MappingProxyType({})
+
+# Report palette
+TITLE_BLUE = colors.HexColor('#2563eb')
+HEADING_BLUE = colors.HexColor('#1e40af')
+ACCENT_BLUE = colors.HexColor('#3b82f6')
+SCORE_GREEN = colors.HexColor('#10b981')
+
+# Report styles, built once and shared by every report
+STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=STYLES['Heading1'],
+    fontSize=24,
+    textColor=TITLE_BLUE,
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=STYLES['Heading2'],
+    fontSize=16,
+    textColor=HEADING_BLUE,
+    spaceAfter=12,
+    spaceBefore=12
+)
+
+SUBHEADING_STYLE = ParagraphStyle(
+    'CustomSubHeading',
+    parent=STYLES['Heading3'],
+    fontSize=14,
+    textColor=ACCENT_BLUE,
+    spaceAfter=10
+)
+
+# A separate style, so the shared 'Normal' style is never mutated
+NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=STYLES['Normal'],
+    fontSize=11,
+    leading=14
+)
+
+# Body text for a bullet group, spaced like the old per-item Spacer(1, 0.1*inch)
+BULLET_GROUP_STYLE = ParagraphStyle(
+    'CustomBulletGroup',
+    parent=NORMAL_STYLE,
+    spaceAfter=0.1*inch
+)
+
+DISCLAIMER_STYLE = ParagraphStyle(
+    'Disclaimer',
+    parent=NORMAL_STYLE,
+    fontSize=9,
+    textColor=colors.grey,
+    alignment=TA_JUSTIFY
+)
+
+DISCLAIMER_TEXT = """
+    <b>Medical Disclaimer:</b> This report is generated by an AI-powered health risk assessment tool and is intended 
+    for informational purposes only. It is not a substitute for professional medical advice, diagnosis, or treatment. 
+    Always seek the advice of your physician or other qualified health provider with any questions you may have 
+    regarding a medical condition. Never disregard professional medical advice or delay in seeking it because of 
+    something you have read in this report.
+    """
+
+# The disclaimer is the same on every report, so its markup is parsed once
+DISCLAIMER_PARAGRAPH = Paragraph(DISCLAIMER_TEXT, DISCLAIMER_STYLE)
+
+# Table styles, parsed once and shared by every report; rules under rows instead of a full grid
+PROFILE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HEADING_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
+    ('LINEBELOW', (0, 1), (-1, -1), 0.25, colors.lightgrey),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+])
+
+RISK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), ACCENT_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
+    ('LINEBELOW', (0, 1), (-1, -1), 0.25, colors.lightgrey),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+])
+
+SCORE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), SCORE_GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
+    ('LINEBELOW', (0, 1), (-1, -1), 0.25, colors.lightgrey),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+])
+
+def bullet_paragraph(lines: Sequence[str], style: ParagraphStyle = NORMAL_STYLE) -> Paragraph:
+    """Render consecutive report lines as one Paragraph instead of one flowable per line"""
+    return Paragraph("<br/>".join(lines), style)
+
+# Fallback report sections: (applies to the report values, bullet lines), all that apply are shown
+NUTRITION_FALLBACK_BULLETS = (
+    (lambda v: v['diabetes_risk'] > 30, (
+        "• Focus on low-glycemic index foods to manage blood sugar",
+        "• Limit refined carbohydrates and added sugars",
+        "• Increase fiber intake with vegetables and whole grains",
+    )),
+    (lambda v: v['hypertension_risk'] > 30, (
+        "• Reduce sodium intake to less than 2,300mg per day",
+        "• Increase potassium-rich foods like bananas and leafy greens",
+        "• Limit processed foods and restaurant meals",
+    )),
+    (lambda v: v['bmi'] > 25, (
+        "• Create a moderate calorie deficit for sustainable weight loss",
+        "• Focus on portion control and mindful eating",
+    )),
+)
+
+FITNESS_FALLBACK_BULLETS = (
+    (lambda v: v['diabetes_risk'] > 30, (
+        "• Aim for 150 minutes of moderate aerobic exercise weekly",
+        "• Include resistance training 2-3 times per week",
+        "• Focus on activities that improve insulin sensitivity",
+    )),
+    (lambda v: v['hypertension_risk'] > 30, (
+        "• Engage in regular cardiovascular exercise",
+        "• Include stress-reducing activities like yoga or meditation",
+        "• Start with low-impact activities if you're new to exercise",
+    )),
+    (lambda v: v['physical_activity'] < 5, (
+        "• Start with 10-15 minutes of daily activity and gradually increase",
+        "• Find activities you enjoy to maintain consistency",
+    )),
+)
+
+LIFESTYLE_FALLBACK_BULLETS = (
+    (lambda v: v['smoking_status'] == 2, (  # Current smoker
+        "• Prioritize smoking cessation - this is the most important change",
+        "• Consider nicotine replacement therapy or other cessation aids",
+        "• Seek support from healthcare providers or cessation programs",
+    )),
+    (lambda v: v['stress_level'] and v['stress_level'] > 7, (
+        "• Implement stress management techniques like meditation or deep breathing",
+        "• Ensure adequate sleep (7-9 hours per night)",
+        "• Consider professional help for stress management if needed",
+    )),
+    (lambda v: v['sleep_hours'] and v['sleep_hours'] < 6, (
+        "• Prioritize sleep hygiene and consistent sleep schedule",
+        "• Create a relaxing bedtime routine",
+        "• Limit screen time before bed",
+    )),
+)
+
+FOUNDATION_WEEK_BULLETS = (
+    (lambda v: True, (
+        "• Start with small, sustainable changes",
+        "• Focus on one major habit at a time",
+        "• Track your progress daily",
+    )),
+    (lambda v: v['diabetes_risk'] > 30, ("• Begin monitoring blood sugar if recommended by your doctor",)),
+    (lambda v: v['hypertension_risk'] > 30, ("• Start checking blood pressure regularly",)),
+)
+
+REINFORCEMENT_WEEK_BULLETS = (
+    "• Increase intensity of your chosen activities",
+    "• Add variety to prevent boredom",
+    "• Celebrate small victories",
+    "• Plan for potential obstacles",
+)
+
+LONG_TERM_GOAL_BULLETS = (
+    (lambda v: v['diabetes_risk'] > 30, (
+        "• Achieve and maintain target blood sugar levels",
+        "• Lose 5-10% of body weight if overweight",
+    )),
+    (lambda v: v['hypertension_risk'] > 30, (
+        "• Achieve blood pressure below 130/80 mmHg",
+        "• Reduce sodium intake to less than 1,500mg daily",
+    )),
+    (lambda v: True, (
+        "• Establish consistent exercise routine",
+        "• Regular health monitoring and checkups",
+    )),
+)
+
+MONITORING_SCHEDULE_BULLETS = (
+    # Daily monitoring
+    (lambda v: True, ("Daily Monitoring:",)),
+    (lambda v: v['diabetes_risk'] > 30, ("• Blood glucose levels (if recommended by doctor)",)),
+    (lambda v: v['hypertension_risk'] > 30, ("• Blood pressure readings",)),
+    (lambda v: True, (
+        "• Physical activity tracking",
+        "• Sleep quality and duration",
+        "• Stress levels and mood",
+    )),
+    # Weekly monitoring
+    (lambda v: True, (
+        "Weekly Monitoring:",
+        "• Weight tracking",
+        "• Exercise intensity and duration",
+        "• Nutrition adherence",
+    )),
+    (lambda v: v['smoking_status'] == 2, ("• Smoking cessation progress",)),
+    # Monthly monitoring
+    (lambda v: True, (
+        "Monthly Monitoring:",
+        "• Overall health assessment",
+        "• Progress toward goals",
+        "• Adjustment of strategies if needed",
+    )),
+)
+
+PROVIDER_FOLLOW_UP_BULLETS = (
+    "• Schedule appointment within 2-4 weeks",
+    "• Bring this report to your healthcare provider",
+    "• Discuss specific risk factors and management strategies",
+)
+
+ANNUAL_VISIT_BULLETS = (
+    "• Schedule annual wellness visit",
+    "• Continue regular health monitoring",
+    "• Maintain preventive health measures",
+)
+
+EMERGENCY_BULLETS = (
+    "• Severe chest pain or pressure",
+    "• Difficulty breathing or shortness of breath",
+    "• Severe headache with vision changes",
+    "• Loss of consciousness or severe dizziness",
+    "• Any other severe or sudden symptoms",
+)
+
+# Fallback insights: (report value, ((exceeded threshold, lines), ...) highest first, lines otherwise)
+INSIGHT_FALLBACK_TIERS = (
+    ('diabetes_risk', (
+        (50, (
+            "• Your diabetes risk is significantly elevated and requires immediate attention",
+            "• Focus on blood sugar management and weight control",
+        )),
+        (20, (
+            "• You have moderate diabetes risk that can be managed with lifestyle changes",
+            "• Early intervention can prevent progression to diabetes",
+        )),
+    ), ("• Your diabetes risk is low - continue your healthy habits",)),
+    ('hypertension_risk', (
+        (50, (
+            "• Your blood pressure risk is high and needs medical attention",
+            "• Focus on sodium reduction and stress management",
+        )),
+        (20, (
+            "• You have moderate blood pressure risk that can be improved",
+            "• Regular exercise and diet modifications can help",
+        )),
+    ), ("• Your cardiovascular risk is low - maintain your healthy lifestyle",)),
+    ('bmi', (
+        (30, (
+            "• Weight management should be a primary focus",
+            "• Even modest weight loss can significantly improve health outcomes",
+        )),
+        (25, (
+            "• Consider weight management to optimize your health",
+            "• Small changes can make a big difference",
+        )),
+    ), ("• Your weight is in a healthy range - continue to maintain it",)),
+)
+
+# First page header, drawn straight onto the canvas where the old title and report info
+# paragraphs were laid out, and wrapped the way they were (inside the frame's padding)
+REPORT_TITLE = "PreventiX Health Risk Assessment Report"
+HEADER_LABELS = ("Report Generated:", "Patient Name:")
+HEADER_LABEL_FONT = 'Helvetica-Bold'
+HEADER_VALUE_FONT = 'Helvetica'
+FRAME_PADDING = 6
+
+def wrap_header_value(value: str, first_width: float, width: float) -> List[str]:
+    """Wrap a header value greedily by words; the first line starts after its label"""
+    font_size = NORMAL_STYLE.fontSize
+    fits = lambda text, limit: stringWidth(text, HEADER_VALUE_FONT, font_size) <= limit
+    lines, line, limit = [], "", first_width
+    for word in value.split():
+        candidate = f"{line} {word}" if line else word
+        if fits(candidate, limit):
+            line = candidate
+            continue
+        if fits(word, width):
+            lines.append(line)
+            line, limit = word, width
+            continue
+        # A word wider than a whole line is split from the current line on, like Paragraph's splitLongWords
+        line = candidate
+        while not fits(line, limit):
+            cut = next((end for end in range(len(line) - 1, 0, -1) if fits(line[:end], limit)), 1)
+            lines.append(line[:cut])
+            line, limit = line[cut:], width
+    lines.append(line)
+    return lines
+
+def layout_report_header(doc, report_date: str, patient_name: str) -> tuple:
+    """Split the title and the (label, value) info rows into lines; continuation rows have no label"""
+    text_width = doc.width - 2 * FRAME_PADDING
+    title_lines = simpleSplit(REPORT_TITLE, HEADER_LABEL_FONT, TITLE_STYLE.fontSize, text_width)
+    info_rows = []
+    for label, value in zip(HEADER_LABELS, (report_date, patient_name)):
+        label_width = stringWidth(label + " ", HEADER_LABEL_FONT, NORMAL_STYLE.fontSize)
+        value_lines = wrap_header_value(value, text_width - label_width, text_width)
+        info_rows.append((label, value_lines[0]))
+        info_rows.extend((None, line) for line in value_lines[1:])
+    return title_lines, info_rows
+
+def header_title_height(title_lines: List[str]) -> float:
+    """Flow height of the old title paragraph and the spacer after it"""
+    return len(title_lines) * TITLE_STYLE.leading + TITLE_STYLE.spaceAfter + 0.2*inch
+
+def report_header_height(header: tuple) -> float:
+    """Flow height the header takes on the first page, as the old title and info paragraphs did"""
+    title_lines, info_rows = header
+    return header_title_height(title_lines) + len(info_rows) * NORMAL_STYLE.leading + 0.3*inch
+
+def draw_report_header(canvas, doc, header: tuple) -> None:
+    """Draw the report title, date and patient name on the first page"""
+    title_lines, info_rows = header
+    left = doc.leftMargin + FRAME_PADDING
+    top = doc.bottomMargin + doc.height - FRAME_PADDING
+    canvas.saveState()
+    canvas.setFont(HEADER_LABEL_FONT, TITLE_STYLE.fontSize)
+    canvas.setFillColor(TITLE_BLUE)
+    for row, line in enumerate(title_lines):
+        canvas.drawCentredString(doc.leftMargin + doc.width / 2, top - TITLE_STYLE.fontSize - row * TITLE_STYLE.leading, line)
+    canvas.setFillColor(colors.black)
+    info_top = top - header_title_height(title_lines) - NORMAL_STYLE.fontSize
+    for row, (label, value) in enumerate(info_rows):
+        y = info_top - row * NORMAL_STYLE.leading
+        x = left
+        if label:
+            canvas.setFont(HEADER_LABEL_FONT, NORMAL_STYLE.fontSize)
+            canvas.drawString(x, y, label)
+            x += stringWidth(label + " ", HEADER_LABEL_FONT, NORMAL_STYLE.fontSize)
+        canvas.setFont(HEADER_VALUE_FONT, NORMAL_STYLE.fontSize)
+        canvas.drawString(x, y, value)
+    canvas.restoreState()
+
+def disclaimer_paragraph() -> Paragraph:
+    """A fresh disclaimer Paragraph sharing the pre-parsed fragments, so builds never share layout state"""
+    return Paragraph(DISCLAIMER_TEXT, DISCLAIMER_STYLE, frags=DISCLAIMER_PARAGRAPH.frags)
+
+def section_lines(sections: tuple, values: Dict[str, Any]) -> List[str]:
+    """Collect the lines of every (applies, lines) section that applies to the report values"""
+    return [line for applies, lines in sections if applies(values) for line in lines]
+
+def tiered_lines(tiers: tuple, values: Dict[str, Any]) -> List[str]:
+    """Collect, per value, the lines of the highest threshold it exceeds, or its default lines"""
+    lines = []
+    for field, bands, default_lines in tiers:
+        lines.extend(next((band_lines for threshold, band_lines in bands if values[field] > threshold), default_lines))
+    return lines
+
+def escaped(value: Any) -> str:
+    """Escape report data for Paragraph markup, so stray &, < and > render as text"""
+    return escape(str(value))
+
+def factor_paragraph(factor: Dict[str, Any], action: str, default_recommendation: str) -> Paragraph:
+    """Render an analysis factor and its recommendation as one spaced bullet group"""
+    name = escaped(factor.get('factor', 'Unknown'))
+    explanation = escaped(factor.get('explanation', 'No explanation'))
+    recommendation = escaped(factor.get('recommendation', default_recommendation))
+    return bullet_paragraph([
+        f"• <b>{name}:</b> {explanation}",
+        f"  <i>{action}:</i> {recommendation}",
+    ], BULLET_GROUP_STYLE)
+
+def top_factors_paragraph(factors: List[Dict[str, Any]]) -> Paragraph:
+    """Render the numbered top model factors as one paragraph"""
+    lines = []
+    for i, factor in enumerate(factors, 1):
+        name = escaped(factor.get('feature', 'Unknown').replace('_', ' ').title())
+        lines.append(f"{i}. <b>{name}:</b> {escaped(factor.get('value', 'N/A'))}")
+    return bullet_paragraph(lines)
+
+def risk_factor_section(title: str, factors: Dict[str, Any], risk_recommendation: str) -> List[Any]:
+    """Build the flowables for one condition's critical, risk and protective factors"""
+    section = [Paragraph(title, SUBHEADING_STYLE)]
+    critical = factors.get('critical_concerns', ())
+    if critical:
+        section.append(Paragraph("🚨 <b>Critical Concerns:</b>", NORMAL_STYLE))
+        section.extend(factor_paragraph(concern, "Recommendation", "Consult healthcare provider") for concern in critical[:3])
+    risks = factors.get('risk_factors', ())
+    if risks:
+        section.append(Paragraph("⚠️ <b>Risk Factors:</b>", NORMAL_STYLE))
+        section.extend(factor_paragraph(factor, "Recommendation", risk_recommendation) for factor in risks[:3])
+    protective = factors.get('protective_factors', ())
+    if protective:
+        section.append(Paragraph("✅ <b>Protective Factors:</b>", NORMAL_STYLE))
+        section.extend(factor_paragraph(factor, "Continue", "Maintain current habits") for factor in protective[:2])
+    return section
+
+# Health analysis groups: (analysis key, heading, items shown)
+ANALYSIS_GROUPS = (
+    ('concerns', "⚠️ <b>Areas of Concern:</b>", 3),
+    ('strengths', "✅ <b>Strengths:</b>", 3),
+    ('recommendations', "💡 <b>Recommendations:</b>", 4),
+)
+
+def health_analysis_section(title: str, analysis: Dict[str, Any]) -> List[Any]:
+    """Build the flowables for one health analysis, empty when there is none"""
+    if not analysis:
+        return []
+    section = [Paragraph(title, SUBHEADING_STYLE)]
+    for key, heading, limit in ANALYSIS_GROUPS:
+        items = analysis.get(key, ())
+        if items:
+            section.append(Paragraph(heading, NORMAL_STYLE))
+            section.append(bullet_paragraph([f"• {escaped(item)}" for item in items[:limit]], BULLET_GROUP_STYLE))
+    return section
+
+def numbered_paragraphs(items: Sequence[str]) -> List[Paragraph]:
+    """One spaced, numbered paragraph per recommendation"""
+    return [Paragraph(f"{i}. {escaped(item)}", BULLET_GROUP_STYLE) for i, item in enumerate(items, 1)]
+
+def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[str, Any], out: Optional[BinaryIO] = None) -> Optional[BytesIO]:
+    """Generate a comprehensive personalized health report PDF, into out if given, else a returned BytesIO"""
     
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    buffer = BytesIO() if out is None else out
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch, pageCompression=1)
     
     # Container for PDF elements
     elements = []
     
     # Extract comprehensive data for detailed analysis
-    input_data = prediction_data.get('input_data', {})
-    comprehensive_analysis = prediction_data.get('comprehensive_analysis', {})
+    input_data = prediction_data.get('input_data', EMPTY_SECTION)
+    comprehensive_analysis = prediction_data.get('comprehensive_analysis', EMPTY_SECTION)
     diabetes_risk = prediction_data.get('diabetes_risk', 0) * 100
     hypertension_risk = prediction_data.get('hypertension_risk', 0) * 100
     metabolic_score = prediction_data.get('metabolic_health_score', 0)
     cardio_score = prediction_data.get('cardiovascular_health_score', 0)
     
     # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2563eb'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#1e40af'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=14,
-        textColor=colors.HexColor('#3b82f6'),
-        spaceAfter=10
-    )
-    
-    normal_style = styles['Normal']
-    normal_style.fontSize = 11
-    normal_style.leading = 14
-    
-    # Title
-    elements.append(Paragraph("PreventiX Health Risk Assessment Report", title_style))
-    elements.append(Spacer(1, 0.2*inch))
+    heading_style = HEADING_STYLE
+    subheading_style = SUBHEADING_STYLE
     
-    # Report Info
+    # Title and report info are drawn on the first page's canvas; keep their space in the flow
     report_date = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    elements.append(Paragraph(f"<b>Report Generated:</b> {report_date}", normal_style))
-    elements.append(Paragraph(f"<b>Patient Name:</b> {user_info.get('name', 'N/A')}", normal_style))
-    elements.append(Spacer(1, 0.3*inch))
+    header = layout_report_header(doc, report_date, str(user_info.get('name', 'N/A')))
+    draw_header = partial(draw_report_header, header=header)
+    elements.append(Spacer(1, report_header_height(header)))
     
     # Personalized Health Profile
-    elements.append(Paragraph("Personalized Health Profile", heading_style))
-    
     # Extract key health metrics
     age = input_data.get('age', 'N/A')
     gender = "Male" if input_data.get('gender', 0) == 1 else "Female"
@@ -95,27 +506,13 @@ def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[
         ['Smoking Status', smoking_text, 'Never', get_smoking_status(smoking_status)]
     ]
     
-    profile_table = Table(profile_data, colWidths=[1.8*inch, 1.2*inch, 1.2*inch, 1.5*inch])
-    profile_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elements.append(profile_table)
+    profile_table = Table(profile_data, colWidths=[1.8*inch, 1.2*inch, 1.2*inch, 1.5*inch], repeatRows=1)
+    profile_table.setStyle(PROFILE_TABLE_STYLE)
+    
+    elements.append(KeepTogether([Paragraph("Personalized Health Profile", heading_style), profile_table]))
     elements.append(Spacer(1, 0.3*inch))
     
     # Risk Summary Section
-    elements.append(Paragraph("Comprehensive Risk Analysis", heading_style))
-    
     # Detailed risk analysis with personalized insights
     risk_data = [
         ['Risk Category', 'Your Risk Level', 'Population Average', 'Risk Status', 'Priority'],
@@ -123,114 +520,22 @@ def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[
         ['Hypertension', f"{hypertension_risk:.1f}%", '32%', get_risk_status(hypertension_risk), get_priority_level(hypertension_risk)]
     ]
     
-    risk_table = Table(risk_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 1.8*inch])
-    risk_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    risk_table = Table(risk_data, colWidths=[1.4*inch, 1.2*inch, 1.2*inch, 1.2*inch, 1.0*inch])
-    risk_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elements.append(risk_table)
+    risk_table = Table(risk_data, colWidths=[1.4*inch, 1.2*inch, 1.2*inch, 1.2*inch, 1.0*inch], repeatRows=1)
+    risk_table.setStyle(RISK_TABLE_STYLE)
+    
+    elements.append(KeepTogether([Paragraph("Comprehensive Risk Analysis", heading_style), risk_table]))
     elements.append(Spacer(1, 0.3*inch))
     
     # Detailed Risk Factors Analysis
     elements.append(Paragraph("Detailed Risk Factors Analysis", heading_style))
     
-    # Diabetes Risk Factors
-    elements.append(Paragraph("Diabetes Risk Factors:", subheading_style))
-    diabetes_factors = comprehensive_analysis.get('diabetes_risk_factors', {})
-    
-    # Critical concerns
-    critical_concerns = diabetes_factors.get('critical_concerns', [])
-    if critical_concerns:
-        elements.append(Paragraph("🚨 <b>Critical Concerns:</b>", normal_style))
-        for concern in critical_concerns[:3]:
-            elements.append(Paragraph(f"• <b>{concern.get('factor', 'Unknown')}:</b> {concern.get('explanation', 'No explanation')}", normal_style))
-            elements.append(Paragraph(f"  <i>Recommendation:</i> {concern.get('recommendation', 'Consult healthcare provider')}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-    
-    # Risk factors
-    risk_factors = diabetes_factors.get('risk_factors', [])
-    if risk_factors:
-        elements.append(Paragraph("⚠️ <b>Risk Factors:</b>", normal_style))
-        for factor in risk_factors[:3]:
-            elements.append(Paragraph(f"• <b>{factor.get('factor', 'Unknown')}:</b> {factor.get('explanation', 'No explanation')}", normal_style))
-            elements.append(Paragraph(f"  <i>Recommendation:</i> {factor.get('recommendation', 'Focus on lifestyle improvements')}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-    
-    # Protective factors
-    protective_factors = diabetes_factors.get('protective_factors', [])
-    if protective_factors:
-        elements.append(Paragraph("✅ <b>Protective Factors:</b>", normal_style))
-        for factor in protective_factors[:2]:
-            elements.append(Paragraph(f"• <b>{factor.get('factor', 'Unknown')}:</b> {factor.get('explanation', 'No explanation')}", normal_style))
-            elements.append(Paragraph(f"  <i>Continue:</i> {factor.get('recommendation', 'Maintain current habits')}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-    
+    elements.extend(risk_factor_section("Diabetes Risk Factors:", comprehensive_analysis.get('diabetes_risk_factors', EMPTY_SECTION), "Focus on lifestyle improvements"))
     elements.append(Spacer(1, 0.2*inch))
-    
-    # Hypertension Risk Factors
-    elements.append(Paragraph("Hypertension Risk Factors:", subheading_style))
-    hypertension_factors = comprehensive_analysis.get('hypertension_risk_factors', {})
-    
-    # Critical concerns
-    htn_critical = hypertension_factors.get('critical_concerns', [])
-    if htn_critical:
-        elements.append(Paragraph("🚨 <b>Critical Concerns:</b>", normal_style))
-        for concern in htn_critical[:3]:
-            elements.append(Paragraph(f"• <b>{concern.get('factor', 'Unknown')}:</b> {concern.get('explanation', 'No explanation')}", normal_style))
-            elements.append(Paragraph(f"  <i>Recommendation:</i> {concern.get('recommendation', 'Consult healthcare provider')}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-    
-    # Risk factors
-    htn_risk = hypertension_factors.get('risk_factors', [])
-    if htn_risk:
-        elements.append(Paragraph("⚠️ <b>Risk Factors:</b>", normal_style))
-        for factor in htn_risk[:3]:
-            elements.append(Paragraph(f"• <b>{factor.get('factor', 'Unknown')}:</b> {factor.get('explanation', 'No explanation')}", normal_style))
-            elements.append(Paragraph(f"  <i>Recommendation:</i> {factor.get('recommendation', 'Focus on blood pressure management')}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-    
-    # Protective factors
-    htn_protective = hypertension_factors.get('protective_factors', [])
-    if htn_protective:
-        elements.append(Paragraph("✅ <b>Protective Factors:</b>", normal_style))
-        for factor in htn_protective[:2]:
-            elements.append(Paragraph(f"• <b>{factor.get('factor', 'Unknown')}:</b> {factor.get('explanation', 'No explanation')}", normal_style))
-            elements.append(Paragraph(f"  <i>Continue:</i> {factor.get('recommendation', 'Maintain current habits')}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
+    elements.extend(risk_factor_section("Hypertension Risk Factors:", comprehensive_analysis.get('hypertension_risk_factors', EMPTY_SECTION), "Focus on blood pressure management"))
     
     elements.append(PageBreak())
     
     # Health Scores
-    elements.append(Paragraph("Comprehensive Health Scores", heading_style))
-    
-    metabolic_score = prediction_data.get('metabolic_health_score', 0)
-    cardio_score = prediction_data.get('cardiovascular_health_score', 0)
-    
     # Enhanced health scores with detailed breakdown
     score_data = [
         ['Health Metric', 'Your Score', 'Optimal Range', 'Status', 'Action Required'],
@@ -238,77 +543,17 @@ def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[
         ['Cardiovascular Health', f"{cardio_score:.1f}/100", '85-100', get_score_interpretation(cardio_score), get_action_required(cardio_score)]
     ]
     
-    score_table = Table(score_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 1.5*inch, 1.6*inch])
-    score_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elements.append(score_table)
+    score_table = Table(score_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 1.5*inch, 1.6*inch], repeatRows=1)
+    score_table.setStyle(SCORE_TABLE_STYLE)
+    
+    elements.append(KeepTogether([Paragraph("Comprehensive Health Scores", heading_style), score_table]))
     elements.append(Spacer(1, 0.3*inch))
     
     # Detailed Health Analysis
     elements.append(Paragraph("Detailed Health Analysis", heading_style))
     
-    # Metabolic Health Analysis
-    metabolic_analysis = comprehensive_analysis.get('metabolic_health_analysis', {})
-    if metabolic_analysis:
-        elements.append(Paragraph("Metabolic Health Analysis:", subheading_style))
-        
-        concerns = metabolic_analysis.get('concerns', [])
-        if concerns:
-            elements.append(Paragraph("⚠️ <b>Areas of Concern:</b>", normal_style))
-            for concern in concerns[:3]:
-                elements.append(Paragraph(f"• {concern}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-        
-        strengths = metabolic_analysis.get('strengths', [])
-        if strengths:
-            elements.append(Paragraph("✅ <b>Strengths:</b>", normal_style))
-            for strength in strengths[:3]:
-                elements.append(Paragraph(f"• {strength}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-        
-        recommendations = metabolic_analysis.get('recommendations', [])
-        if recommendations:
-            elements.append(Paragraph("💡 <b>Recommendations:</b>", normal_style))
-            for rec in recommendations[:4]:
-                elements.append(Paragraph(f"• {rec}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-    
-    # Cardiovascular Health Analysis
-    cardio_analysis = comprehensive_analysis.get('cardiovascular_health_analysis', {})
-    if cardio_analysis:
-        elements.append(Paragraph("Cardiovascular Health Analysis:", subheading_style))
-        
-        concerns = cardio_analysis.get('concerns', [])
-        if concerns:
-            elements.append(Paragraph("⚠️ <b>Areas of Concern:</b>", normal_style))
-            for concern in concerns[:3]:
-                elements.append(Paragraph(f"• {concern}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-        
-        strengths = cardio_analysis.get('strengths', [])
-        if strengths:
-            elements.append(Paragraph("✅ <b>Strengths:</b>", normal_style))
-            for strength in strengths[:3]:
-                elements.append(Paragraph(f"• {strength}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
-        
-        recommendations = cardio_analysis.get('recommendations', [])
-        if recommendations:
-            elements.append(Paragraph("💡 <b>Recommendations:</b>", normal_style))
-            for rec in recommendations[:4]:
-                elements.append(Paragraph(f"• {rec}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
+    elements.extend(health_analysis_section("Metabolic Health Analysis:", comprehensive_analysis.get('metabolic_health_analysis', EMPTY_SECTION)))
+    elements.extend(health_analysis_section("Cardiovascular Health Analysis:", comprehensive_analysis.get('cardiovascular_health_analysis', EMPTY_SECTION)))
     
     elements.append(PageBreak())
     
@@ -316,126 +561,72 @@ def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[
     elements.append(Paragraph("Top Risk Factors", heading_style))
     elements.append(Paragraph("Diabetes Risk Factors:", subheading_style))
     
-    diabetes_factors = prediction_data.get('top_diabetes_factors', [])[:3]
-    for i, factor in enumerate(diabetes_factors, 1):
-        factor_name = factor.get('feature', 'Unknown').replace('_', ' ').title()
-        factor_value = factor.get('value', 'N/A')
-        elements.append(Paragraph(f"{i}. <b>{factor_name}:</b> {factor_value}", normal_style))
+    diabetes_factors = prediction_data.get('top_diabetes_factors', ())[:3]
+    if diabetes_factors:
+        elements.append(top_factors_paragraph(diabetes_factors))
     
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph("Hypertension Risk Factors:", subheading_style))
     
-    hypertension_factors = prediction_data.get('top_hypertension_factors', [])[:3]
-    for i, factor in enumerate(hypertension_factors, 1):
-        factor_name = factor.get('feature', 'Unknown').replace('_', ' ').title()
-        factor_value = factor.get('value', 'N/A')
-        elements.append(Paragraph(f"{i}. <b>{factor_name}:</b> {factor_value}", normal_style))
+    hypertension_factors = prediction_data.get('top_hypertension_factors', ())[:3]
+    if hypertension_factors:
+        elements.append(top_factors_paragraph(hypertension_factors))
     
     elements.append(PageBreak())
     
     # Comprehensive Personalized Recommendations
     elements.append(Paragraph("Comprehensive Personalized Recommendations", heading_style))
     
+    # Values the fallback sections are chosen on
+    section_values = {
+        'diabetes_risk': diabetes_risk,
+        'hypertension_risk': hypertension_risk,
+        'bmi': bmi,
+        'physical_activity': physical_activity,
+        'smoking_status': smoking_status,
+        'stress_level': stress_level,
+        'sleep_hours': sleep_hours,
+    }
+    
     # Nutrition Recommendations
     elements.append(Paragraph("🍎 Nutrition & Diet Recommendations:", subheading_style))
-    nutrition_recs = prediction_data.get('nutrition_recommendations', {}).get('primary', [])
+    nutrition_recs = prediction_data.get('nutrition_recommendations', EMPTY_SECTION).get('primary', ())
     if nutrition_recs:
-        for i, rec in enumerate(nutrition_recs[:6], 1):
-            elements.append(Paragraph(f"{i}. {rec}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
+        elements.extend(numbered_paragraphs(nutrition_recs[:6]))
     else:
         # Fallback nutrition recommendations based on health data
-        elements.append(Paragraph("Based on your health profile:", normal_style))
-        if diabetes_risk > 30:
-            elements.append(Paragraph("• Focus on low-glycemic index foods to manage blood sugar", normal_style))
-            elements.append(Paragraph("• Limit refined carbohydrates and added sugars", normal_style))
-            elements.append(Paragraph("• Increase fiber intake with vegetables and whole grains", normal_style))
-        if hypertension_risk > 30:
-            elements.append(Paragraph("• Reduce sodium intake to less than 2,300mg per day", normal_style))
-            elements.append(Paragraph("• Increase potassium-rich foods like bananas and leafy greens", normal_style))
-            elements.append(Paragraph("• Limit processed foods and restaurant meals", normal_style))
-        if bmi > 25:
-            elements.append(Paragraph("• Create a moderate calorie deficit for sustainable weight loss", normal_style))
-            elements.append(Paragraph("• Focus on portion control and mindful eating", normal_style))
+        elements.append(bullet_paragraph(["Based on your health profile:", *section_lines(NUTRITION_FALLBACK_BULLETS, section_values)]))
     
     # Fitness Recommendations
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph("🏃‍♂️ Fitness & Exercise Recommendations:", subheading_style))
-    fitness_recs = prediction_data.get('fitness_recommendations', {}).get('primary', [])
+    fitness_recs = prediction_data.get('fitness_recommendations', EMPTY_SECTION).get('primary', ())
     if fitness_recs:
-        for i, rec in enumerate(fitness_recs[:6], 1):
-            elements.append(Paragraph(f"{i}. {rec}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
+        elements.extend(numbered_paragraphs(fitness_recs[:6]))
     else:
         # Fallback fitness recommendations
-        elements.append(Paragraph("Based on your health profile:", normal_style))
-        if diabetes_risk > 30:
-            elements.append(Paragraph("• Aim for 150 minutes of moderate aerobic exercise weekly", normal_style))
-            elements.append(Paragraph("• Include resistance training 2-3 times per week", normal_style))
-            elements.append(Paragraph("• Focus on activities that improve insulin sensitivity", normal_style))
-        if hypertension_risk > 30:
-            elements.append(Paragraph("• Engage in regular cardiovascular exercise", normal_style))
-            elements.append(Paragraph("• Include stress-reducing activities like yoga or meditation", normal_style))
-            elements.append(Paragraph("• Start with low-impact activities if you're new to exercise", normal_style))
-        if physical_activity < 5:
-            elements.append(Paragraph("• Start with 10-15 minutes of daily activity and gradually increase", normal_style))
-            elements.append(Paragraph("• Find activities you enjoy to maintain consistency", normal_style))
+        elements.append(bullet_paragraph(["Based on your health profile:", *section_lines(FITNESS_FALLBACK_BULLETS, section_values)]))
     
     # Lifestyle Recommendations
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph("🌱 Lifestyle & Wellness Recommendations:", subheading_style))
-    lifestyle_recs = prediction_data.get('lifestyle_recommendations', [])
+    lifestyle_recs = prediction_data.get('lifestyle_recommendations', ())
     if lifestyle_recs:
-        for i, rec in enumerate(lifestyle_recs[:6], 1):
-            elements.append(Paragraph(f"{i}. {rec}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
+        elements.extend(numbered_paragraphs(lifestyle_recs[:6]))
     else:
         # Fallback lifestyle recommendations
-        elements.append(Paragraph("Based on your health profile:", normal_style))
-        if smoking_status == 2:  # Current smoker
-            elements.append(Paragraph("• Prioritize smoking cessation - this is the most important change", normal_style))
-            elements.append(Paragraph("• Consider nicotine replacement therapy or other cessation aids", normal_style))
-            elements.append(Paragraph("• Seek support from healthcare providers or cessation programs", normal_style))
-        if stress_level and stress_level > 7:
-            elements.append(Paragraph("• Implement stress management techniques like meditation or deep breathing", normal_style))
-            elements.append(Paragraph("• Ensure adequate sleep (7-9 hours per night)", normal_style))
-            elements.append(Paragraph("• Consider professional help for stress management if needed", normal_style))
-        if sleep_hours and sleep_hours < 6:
-            elements.append(Paragraph("• Prioritize sleep hygiene and consistent sleep schedule", normal_style))
-            elements.append(Paragraph("• Create a relaxing bedtime routine", normal_style))
-            elements.append(Paragraph("• Limit screen time before bed", normal_style))
+        elements.append(bullet_paragraph(["Based on your health profile:", *section_lines(LIFESTYLE_FALLBACK_BULLETS, section_values)]))
     
     # Personalized Action Plan
     elements.append(Spacer(1, 0.3*inch))
     elements.append(Paragraph("📋 Your Personalized 30-Day Action Plan", heading_style))
     
-    # Week 1-2
     elements.append(Paragraph("Week 1-2: Foundation Building", subheading_style))
-    elements.append(Paragraph("• Start with small, sustainable changes", normal_style))
-    elements.append(Paragraph("• Focus on one major habit at a time", normal_style))
-    elements.append(Paragraph("• Track your progress daily", normal_style))
-    if diabetes_risk > 30:
-        elements.append(Paragraph("• Begin monitoring blood sugar if recommended by your doctor", normal_style))
-    if hypertension_risk > 30:
-        elements.append(Paragraph("• Start checking blood pressure regularly", normal_style))
-    
-    # Week 3-4
+    elements.append(bullet_paragraph(section_lines(FOUNDATION_WEEK_BULLETS, section_values)))
     elements.append(Paragraph("Week 3-4: Habit Reinforcement", subheading_style))
-    elements.append(Paragraph("• Increase intensity of your chosen activities", normal_style))
-    elements.append(Paragraph("• Add variety to prevent boredom", normal_style))
-    elements.append(Paragraph("• Celebrate small victories", normal_style))
-    elements.append(Paragraph("• Plan for potential obstacles", normal_style))
-    
-    # Long-term goals
+    elements.append(bullet_paragraph(REINFORCEMENT_WEEK_BULLETS))
     elements.append(Paragraph("Long-term Goals (3-6 months):", subheading_style))
-    if diabetes_risk > 30:
-        elements.append(Paragraph("• Achieve and maintain target blood sugar levels", normal_style))
-        elements.append(Paragraph("• Lose 5-10% of body weight if overweight", normal_style))
-    if hypertension_risk > 30:
-        elements.append(Paragraph("• Achieve blood pressure below 130/80 mmHg", normal_style))
-        elements.append(Paragraph("• Reduce sodium intake to less than 1,500mg daily", normal_style))
-    elements.append(Paragraph("• Establish consistent exercise routine", normal_style))
-    elements.append(Paragraph("• Regular health monitoring and checkups", normal_style))
+    elements.append(bullet_paragraph(section_lines(LONG_TERM_GOAL_BULLETS, section_values)))
     
     # Monitoring and Follow-up Recommendations
     elements.append(PageBreak())
@@ -443,220 +634,101 @@ def generate_health_report_pdf(prediction_data: Dict[str, Any], user_info: Dict[
     
     # Personalized monitoring schedule
     elements.append(Paragraph("Your Personalized Monitoring Schedule:", subheading_style))
-    
-    # Daily monitoring
-    elements.append(Paragraph("Daily Monitoring:", normal_style))
-    if diabetes_risk > 30:
-        elements.append(Paragraph("• Blood glucose levels (if recommended by doctor)", normal_style))
-    if hypertension_risk > 30:
-        elements.append(Paragraph("• Blood pressure readings", normal_style))
-    elements.append(Paragraph("• Physical activity tracking", normal_style))
-    elements.append(Paragraph("• Sleep quality and duration", normal_style))
-    elements.append(Paragraph("• Stress levels and mood", normal_style))
-    
-    # Weekly monitoring
-    elements.append(Paragraph("Weekly Monitoring:", normal_style))
-    elements.append(Paragraph("• Weight tracking", normal_style))
-    elements.append(Paragraph("• Exercise intensity and duration", normal_style))
-    elements.append(Paragraph("• Nutrition adherence", normal_style))
-    if smoking_status == 2:
-        elements.append(Paragraph("• Smoking cessation progress", normal_style))
-    
-    # Monthly monitoring
-    elements.append(Paragraph("Monthly Monitoring:", normal_style))
-    elements.append(Paragraph("• Overall health assessment", normal_style))
-    elements.append(Paragraph("• Progress toward goals", normal_style))
-    elements.append(Paragraph("• Adjustment of strategies if needed", normal_style))
+    elements.append(bullet_paragraph(section_lines(MONITORING_SCHEDULE_BULLETS, section_values)))
     
     # Healthcare provider visits
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph("Healthcare Provider Visits:", subheading_style))
-    
     if diabetes_risk > 30 or hypertension_risk > 30:
-        elements.append(Paragraph("• Schedule appointment within 2-4 weeks", normal_style))
-        elements.append(Paragraph("• Bring this report to your healthcare provider", normal_style))
-        elements.append(Paragraph("• Discuss specific risk factors and management strategies", normal_style))
+        elements.append(bullet_paragraph(PROVIDER_FOLLOW_UP_BULLETS))
     else:
-        elements.append(Paragraph("• Schedule annual wellness visit", normal_style))
-        elements.append(Paragraph("• Continue regular health monitoring", normal_style))
-        elements.append(Paragraph("• Maintain preventive health measures", normal_style))
+        elements.append(bullet_paragraph(ANNUAL_VISIT_BULLETS))
     
     # Emergency situations
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph("When to Seek Immediate Medical Attention:", subheading_style))
-    elements.append(Paragraph("• Severe chest pain or pressure", normal_style))
-    elements.append(Paragraph("• Difficulty breathing or shortness of breath", normal_style))
-    elements.append(Paragraph("• Severe headache with vision changes", normal_style))
-    elements.append(Paragraph("• Loss of consciousness or severe dizziness", normal_style))
-    elements.append(Paragraph("• Any other severe or sudden symptoms", normal_style))
+    elements.append(bullet_paragraph(EMERGENCY_BULLETS))
     
     # Personalized Insights
     elements.append(Spacer(1, 0.3*inch))
     elements.append(Paragraph("🎯 Your Personalized Health Insights", heading_style))
     
-    insights = prediction_data.get('personalized_insights', [])
+    insights = prediction_data.get('personalized_insights', ())
     if insights:
         for insight in insights[:8]:
-            elements.append(Paragraph(f"• {insight}", normal_style))
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(Paragraph(f"• {escaped(insight)}", BULLET_GROUP_STYLE))
     else:
         # Generate personalized insights based on health data
-        elements.append(Paragraph("Based on your health assessment:", normal_style))
-        
-        if diabetes_risk > 50:
-            elements.append(Paragraph("• Your diabetes risk is significantly elevated and requires immediate attention", normal_style))
-            elements.append(Paragraph("• Focus on blood sugar management and weight control", normal_style))
-        elif diabetes_risk > 20:
-            elements.append(Paragraph("• You have moderate diabetes risk that can be managed with lifestyle changes", normal_style))
-            elements.append(Paragraph("• Early intervention can prevent progression to diabetes", normal_style))
-        else:
-            elements.append(Paragraph("• Your diabetes risk is low - continue your healthy habits", normal_style))
-        
-        if hypertension_risk > 50:
-            elements.append(Paragraph("• Your blood pressure risk is high and needs medical attention", normal_style))
-            elements.append(Paragraph("• Focus on sodium reduction and stress management", normal_style))
-        elif hypertension_risk > 20:
-            elements.append(Paragraph("• You have moderate blood pressure risk that can be improved", normal_style))
-            elements.append(Paragraph("• Regular exercise and diet modifications can help", normal_style))
-        else:
-            elements.append(Paragraph("• Your cardiovascular risk is low - maintain your healthy lifestyle", normal_style))
-        
-        if bmi > 30:
-            elements.append(Paragraph("• Weight management should be a primary focus", normal_style))
-            elements.append(Paragraph("• Even modest weight loss can significantly improve health outcomes", normal_style))
-        elif bmi > 25:
-            elements.append(Paragraph("• Consider weight management to optimize your health", normal_style))
-            elements.append(Paragraph("• Small changes can make a big difference", normal_style))
-        else:
-            elements.append(Paragraph("• Your weight is in a healthy range - continue to maintain it", normal_style))
+        elements.append(bullet_paragraph(["Based on your health assessment:", *tiered_lines(INSIGHT_FALLBACK_TIERS, section_values)]))
     
     # Disclaimer
     elements.append(Spacer(1, 0.4*inch))
-    disclaimer_style = ParagraphStyle(
-        'Disclaimer',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.grey,
-        alignment=TA_JUSTIFY
-    )
-    
-    disclaimer_text = """
-    <b>Medical Disclaimer:</b> This report is generated by an AI-powered health risk assessment tool and is intended 
-    for informational purposes only. It is not a substitute for professional medical advice, diagnosis, or treatment. 
-    Always seek the advice of your physician or other qualified health provider with any questions you may have 
-    regarding a medical condition. Never disregard professional medical advice or delay in seeking it because of 
-    something you have read in this report.
-    """
-    
-    elements.append(Paragraph(disclaimer_text, disclaimer_style))
+    elements.append(disclaimer_paragraph())
     
     # Build PDF
-    doc.build(elements)
+    doc.build(elements, onFirstPage=draw_header)
+    if out is not None:
+        return None
     buffer.seek(0)
     return buffer
 
+def generate_health_report_pdf_bytes(prediction_data: Dict[str, Any], user_info: Dict[str, Any]) -> bytes:
+    """Generate the report PDF as bytes, cheap to hand back from a worker process"""
+    return generate_health_report_pdf(prediction_data, user_info).getvalue()
+
+# Status label tables: (ascending band thresholds, one label per band)
+SCORE_INTERPRETATION_BANDS = ((40, 55, 70, 85), ("Critical - Seek Medical Attention", "Needs Improvement", "Fair", "Good", "Excellent"))
+ACTION_REQUIRED_BANDS = ((40, 55, 70, 85), ("Urgent", "Focus", "Improve", "Monitor", "Maintain"))
+BMI_STATUS_BANDS = ((18.5, 25, 30), ("Underweight", "Normal", "Overweight", "Obese"))
+BP_STATUS_BANDS = ((120, 130, 140), ("Normal", "Elevated", "Stage 1 Hypertension", "Stage 2 Hypertension"))
+GLUCOSE_STATUS_BANDS = ((100, 126), ("Normal", "Pre-diabetic", "Diabetic Range"))
+CHOLESTEROL_STATUS_BANDS = ((200, 240), ("Desirable", "Borderline High", "High"))
+ACTIVITY_STATUS_BANDS = ((4, 7), ("Sedentary", "Moderately Active", "Active"))
+RISK_STATUS_BANDS = ((10, 30, 50), ("Low Risk", "Moderate Risk", "High Risk", "Very High Risk"))
+PRIORITY_LEVEL_BANDS = ((10, 30, 50), ("Low", "Medium", "High", "Critical"))
+SMOKING_STATUS_LABELS = {0: "Never Smoked", 1: "Former Smoker"}
+
+def band_label(value: float, bands: tuple) -> str:
+    """Label of the band a value falls in; each threshold starts the next band"""
+    thresholds, labels = bands
+    return labels[bisect_right(thresholds, value)]
+
 def get_score_interpretation(score: float) -> str:
     """Interpret health score"""
-    if score >= 85:
-        return "Excellent"
-    elif score >= 70:
-        return "Good"
-    elif score >= 55:
-        return "Fair"
-    elif score >= 40:
-        return "Needs Improvement"
-    else:
-        return "Critical - Seek Medical Attention"
+    return band_label(score, SCORE_INTERPRETATION_BANDS)
 
 def get_bmi_status(bmi: float) -> str:
     """Get BMI status"""
-    if bmi < 18.5:
-        return "Underweight"
-    elif bmi < 25:
-        return "Normal"
-    elif bmi < 30:
-        return "Overweight"
-    else:
-        return "Obese"
+    return band_label(bmi, BMI_STATUS_BANDS)
 
 def get_bp_status(bp: float) -> str:
     """Get blood pressure status"""
-    if bp < 120:
-        return "Normal"
-    elif bp < 130:
-        return "Elevated"
-    elif bp < 140:
-        return "Stage 1 Hypertension"
-    else:
-        return "Stage 2 Hypertension"
+    return band_label(bp, BP_STATUS_BANDS)
 
 def get_glucose_status(glucose: float) -> str:
     """Get glucose status"""
-    if glucose < 100:
-        return "Normal"
-    elif glucose < 126:
-        return "Pre-diabetic"
-    else:
-        return "Diabetic Range"
+    return band_label(glucose, GLUCOSE_STATUS_BANDS)
 
 def get_cholesterol_status(cholesterol: float) -> str:
     """Get cholesterol status"""
-    if cholesterol < 200:
-        return "Desirable"
-    elif cholesterol < 240:
-        return "Borderline High"
-    else:
-        return "High"
+    return band_label(cholesterol, CHOLESTEROL_STATUS_BANDS)
 
 def get_activity_status(activity: float) -> str:
     """Get physical activity status"""
-    if activity >= 7:
-        return "Active"
-    elif activity >= 4:
-        return "Moderately Active"
-    else:
-        return "Sedentary"
+    return band_label(activity, ACTIVITY_STATUS_BANDS)
 
 def get_smoking_status(smoking: int) -> str:
     """Get smoking status"""
-    if smoking == 0:
-        return "Never Smoked"
-    elif smoking == 1:
-        return "Former Smoker"
-    else:
-        return "Current Smoker"
+    return SMOKING_STATUS_LABELS.get(smoking, "Current Smoker")
 
 def get_risk_status(risk: float) -> str:
     """Get risk status"""
-    if risk < 10:
-        return "Low Risk"
-    elif risk < 30:
-        return "Moderate Risk"
-    elif risk < 50:
-        return "High Risk"
-    else:
-        return "Very High Risk"
+    return band_label(risk, RISK_STATUS_BANDS)
 
 def get_priority_level(risk: float) -> str:
     """Get priority level"""
-    if risk < 10:
-        return "Low"
-    elif risk < 30:
-        return "Medium"
-    elif risk < 50:
-        return "High"
-    else:
-        return "Critical"
+    return band_label(risk, PRIORITY_LEVEL_BANDS)
 
 def get_action_required(score: float) -> str:
     """Get action required based on score"""
-    if score >= 85:
-        return "Maintain"
-    elif score >= 70:
-        return "Monitor"
-    elif score >= 55:
-        return "Improve"
-    elif score >= 40:
-        return "Focus"
-    else:
-        return "Urgent"
\ No newline at end of file
+    return band_label(score, ACTION_REQUIRED_BANDS)
@@ -0,0 +1,30 @@
+"""Regression tests for the memoized question answers in main.py"""
+import pytest
+
+import main
+
+QUESTIONS = (
+    "What is my diabetes risk?",
+    "What is my hypertension risk?",
+    "How can I prevent disease?",
+)
+
+
+@pytest.fixture(autouse=True)
+def cold_answer_caches():
+    for cache in main.ANSWER_CACHES:
+        cache.cache_clear()
+    yield
+    for cache in main.ANSWER_CACHES:
+        cache.cache_clear()
+
+
+@pytest.mark.parametrize("question", QUESTIONS)
+def test_int_and_float_profiles_get_their_own_answers(question):
+    float_answer = main.analyze_health_question(question, {"age": 25.0, "bmi": 22.0}, {"diabetes_risk": 0.1})
+    int_answer = main.analyze_health_question(question, {"age": 25, "bmi": 22}, {"diabetes_risk": 0.1})
+
+    for cache in main.ANSWER_CACHES:
+        cache.cache_clear()
+    assert int_answer == main.analyze_health_question(question, {"age": 25, "bmi": 22}, {"diabetes_risk": 0.1})
+    assert float_answer == main.analyze_health_question(question, {"age": 25.0, "bmi": 22.0}, {"diabetes_risk": 0.1})
@@ -1,14 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timedelta
 from typing import Optional
 from pydantic import BaseModel, Field
 from auth import get_current_active_user
-from database import get_tracking_collection
+from database import get_tracking_collection_async
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tracking", tags=["tracking"])
 
+# created_at rendered the way datetime.isoformat() renders a stored BSON date: BSON keeps
+# milliseconds, so the microseconds are ms * 1000, and are left out entirely when zero
+HISTORY_CREATED_AT = {"$cond": [
+    {"$eq": [{"$millisecond": "$created_at"}, 0]},
+    {"$dateToString": {"date": "$created_at", "format": "%Y-%m-%dT%H:%M:%S"}},
+    {"$dateToString": {"date": "$created_at", "format": "%Y-%m-%dT%H:%M:%S.%L000"}}
+]}
+HISTORY_BATCH_SIZE = 500
+
 class TrackingData(BaseModel):
     daily_steps: Optional[int] = Field(None, ge=0)
     sleep_hours: Optional[float] = Field(None, ge=0, le=24)
@@ -28,17 +38,19 @@ async def log_tracking_data(
 ):
     """Log daily health tracking data"""
     try:
-        tracking_collection = get_tracking_collection()
+        tracking_collection = get_tracking_collection_async()
         
+        # One timestamp, so the stored date string and created_at always agree
+        now = datetime.utcnow()
         tracking_entry = {
             "user_id": current_user["id"],
             "email": current_user["email"],
-            "date": datetime.utcnow().isoformat(),
-            **tracking_data.dict(exclude_none=True),
-            "created_at": datetime.utcnow()
+            "date": now.isoformat(),
+            **tracking_data.model_dump(exclude_none=True),
+            "created_at": now
         }
         
-        result = tracking_collection.insert_one(tracking_entry)
+        result = await tracking_collection.insert_one(tracking_entry)
         
         logger.info(f"Tracking data logged for user: {current_user['email']}")
         
@@ -62,29 +74,30 @@ async def get_tracking_history(
 ):
     """Get tracking history for the user"""
     try:
-        tracking_collection = get_tracking_collection()
+        tracking_collection = get_tracking_collection_async()
         
         # Calculate date range
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
-        # Query tracking data
-        tracking_data = list(tracking_collection.find(
-            {
+        # Query tracking data, stringifying _id and created_at in the database
+        tracking_data = await tracking_collection.aggregate([
+            {"$match": {
                 "user_id": current_user["id"],
                 "created_at": {"$gte": start_date, "$lte": end_date}
-            }
-        ).sort("created_at", -1))
-        
-        # Convert ObjectId to string
-        for entry in tracking_data:
-            entry["_id"] = str(entry["_id"])
-            entry["created_at"] = entry["created_at"].isoformat()
+            }},
+            {"$sort": {"created_at": -1}},
+            {"$set": {
+                "_id": {"$toString": "$_id"},
+                "created_at": HISTORY_CREATED_AT
+            }}
+        ], batchSize=HISTORY_BATCH_SIZE).to_list(length=None)
         
-        return {
+        # Every field is already JSON-native, so skip jsonable_encoder's per-field walk
+        return ORJSONResponse({
             "count": len(tracking_data),
             "history": tracking_data
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error fetching tracking history: {str(e)}")